@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_from_directory, send_file, abort, g
 import os
 import json
 from datetime import datetime
@@ -7,8 +7,22 @@ from models.ai_interviewer import AIInterviewer
 from models.resume_analyzer import ResumeAnalyzer
 from models.speech_processor import SpeechProcessor
 from models.question_generator import QuestionGenerator
+from models.results_store import ResultsStore
+from models.event_log import EventLog
+from models.candidate_index import CandidateIndex
+from models.resume_dedup import ResumeDeduplicator
+from models.video_upload import VideoUploadManager, UploadError, UploadOffsetError
+from models.tts_cache import TTSCache, create_engine
+from models.response_log import ResponseLog, persona_feedback
+from models.upload_store import UploadStore
+from models.resume_incremental import IncrementalResumeAnalyzer
 from utils.helpers import allowed_file, calculate_score, clean_text
+from utils.assets import AssetManifest, BUNDLES
+from utils.fragment_cache import FragmentCache
+from utils.rate_limiter import RateLimiter, AdmissionController, RequestThrottle, create_backend
+from utils.profiler import RequestProfiler
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 import ssl
 
 app = Flask(__name__)
@@ -18,10 +32,127 @@ app.config.from_object(Config)
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # Initialize AI components
-ai_interviewer = AIInterviewer()
-resume_analyzer = ResumeAnalyzer()
+ai_interviewer = AIInterviewer(scoring_mode=app.config['SCORING_MODE'],
+                               synonyms_file=app.config['SYNONYMS_FILE'],
+                               reference_file=app.config['ANSWER_REFERENCE_FILE'],
+                               events_folder=app.config['EVENT_LOG_FOLDER'],
+                               tenants_folder=app.config['QUESTION_BANK_FOLDER'],
+                               max_loaded_tenants=app.config['MAX_LOADED_TENANTS'],
+                               memo_size=app.config['ANSWER_MEMO_SIZE'])
+resume_stage_pool = (ThreadPoolExecutor(app.config['RESUME_STAGE_THREADS'], thread_name_prefix='resume-stage')
+                     if app.config['RESUME_STAGE_THREADS'] else None)
+resume_analyzer = ResumeAnalyzer(weights_file=app.config['RESUME_SCORING_WEIGHTS'], executor=resume_stage_pool,
+                                 stage_timeout=app.config['RESUME_STAGE_TIMEOUT'])
 speech_processor = SpeechProcessor()
 question_generator = QuestionGenerator()
+results_store = ResultsStore(app.config['RESULTS_FOLDER'])
+candidate_index = CandidateIndex(resume_analyzer.skill_categories, app.config['CANDIDATE_INDEX_FOLDER'],
+                                 feature_extractor=resume_analyzer.feature_extractor)
+throttle = RequestThrottle(
+    RateLimiter(app.config['RATE_LIMITS'],
+                create_backend(app.config['RATE_LIMIT_BACKEND'], app.config['RATE_LIMIT_SQLITE_PATH'])),
+    AdmissionController(app.config['ADMISSION_LIMITS'], app.config['ADMISSION_SHED_LOW_PRIORITY_AT'])
+)
+video_uploads = VideoUploadManager(app.config['VIDEO_UPLOAD_FOLDER'],
+                                   abandon_after=app.config['VIDEO_UPLOAD_ABANDON_AFTER'])
+resume_revisions = IncrementalResumeAnalyzer(resume_analyzer, app.config['RESUME_REVISION_CACHE_BYTES'])
+resume_uploads = UploadStore(app.config['RESUME_STORE_FOLDER'], app.config['UPLOAD_RETENTION_DAYS'],
+                             app.config['UPLOAD_ARCHIVE_AFTER_DAYS'])
+fragment_cache = FragmentCache(app.config['FRAGMENT_CACHE_SIZE'])
+# Stored analyses are reused only while both the analyzer and its scoring weights are unchanged
+resume_analysis_version = f"{app.config['RESUME_ANALYSIS_VERSION']}/{resume_analyzer.scorer.fingerprint}"
+resume_deduplicator = ResumeDeduplicator(app.config['DEDUP_FOLDER'], threshold=app.config['DEDUP_THRESHOLD'],
+                                         analysis_version=resume_analysis_version)
+event_log = EventLog(app.config['EVENT_LOG_FOLDER'],
+                     queue_size=app.config['EVENT_LOG_QUEUE_SIZE'],
+                     fsync_interval=app.config['EVENT_LOG_FSYNC_INTERVAL'],
+                     segment_bytes=app.config['EVENT_LOG_SEGMENT_BYTES'])
+
+asset_manifest = AssetManifest(app.config['ASSET_DIST_FOLDER'])
+profiler = RequestProfiler(app.config['PROFILE_FOLDER'],
+                           enabled=app.config['PROFILE_ENABLED'],
+                           sample_rate=app.config['PROFILE_SAMPLE_RATE'],
+                           token=app.config['PROFILE_TOKEN'],
+                           interval=app.config['PROFILE_INTERVAL'],
+                           max_bytes=app.config['PROFILE_MAX_BYTES'])
+
+# Question audio is rendered when a question bank loads, so playback starts immediately
+tts_engine = create_engine(app.config['TTS_ENGINE'])
+tts_cache = TTSCache(app.config['TTS_CACHE_FOLDER'], tts_engine, app.config['TTS_VOICE'],
+                     app.config['TTS_CACHE_MAX_TEXTS']) if tts_engine else None
+if tts_cache:
+    tts_cache.prerender_async(
+        [q['question'] for questions in ai_interviewer.questions.values() for q in questions] +
+        [q['question'] for questions in question_generator.base_questions.values() for q in questions]
+    )
+    ai_interviewer.question_banks.on_load = lambda tenant, bank: tts_cache.prerender_async(
+        q['question'] for role in bank.roles() for q in bank.get_questions(role)
+    )
+
+@app.context_processor
+def inject_asset_urls():
+    def asset_urls(name):
+        """URLs to include for a bundle: the fingerprinted build, or its sources"""
+        if app.debug:
+            asset_manifest.reload()
+        hashed = asset_manifest.resolve(name)
+        if hashed:
+            return [url_for('serve_asset', filename=hashed)]
+        return [url_for('static', filename=source) for source in BUNDLES[name]]
+    return dict(asset_urls=asset_urls)
+
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serve fingerprinted bundles, precompressed when the client accepts it"""
+    if filename == 'manifest.json':
+        abort(404)
+    
+    accept_encoding = request.headers.get('Accept-Encoding', '')
+    variant, encoding = asset_manifest.variant(filename, accept_encoding)
+    response = send_from_directory(app.config['ASSET_DIST_FOLDER'], variant,
+                                   max_age=app.config['ASSET_MAX_AGE'])
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+        response.headers.pop('Content-Disposition', None)
+        response.mimetype = 'text/css' if filename.endswith('.css') else 'application/javascript'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = f"public, max-age={app.config['ASSET_MAX_AGE']}, immutable"
+    return response
+
+@app.route('/tts/<filename>')
+def question_audio(filename):
+    """Pre-rendered question audio; supports range requests and never changes for a URL"""
+    if tts_cache is None:
+        abort(404)
+    key, extension = os.path.splitext(filename)
+    try:
+        if extension != tts_cache.engine.extension:
+            raise KeyError(key)
+        path = tts_cache.ensure(key)
+    except KeyError:
+        abort(404)
+    
+    response = send_file(path, mimetype=tts_cache.engine.mime_type, conditional=True,
+                         max_age=app.config['ASSET_MAX_AGE'])
+    response.headers['Cache-Control'] = f"public, max-age={app.config['ASSET_MAX_AGE']}, immutable"
+    return response
+
+def _question_audio_url(text):
+    # A plain path rather than url_for, so the async API can build payloads outside a request
+    if tts_cache is None:
+        return None
+    return f'/tts/{tts_cache.key(text)}{tts_cache.engine.extension}'
+
+@app.before_request
+def start_profiling():
+    if profiler.should_profile(request.headers):
+        g.profiling = True
+        profiler.start()
+
+@app.teardown_request
+def stop_profiling(exc):
+    if g.pop('profiling', False):
+        profiler.stop(request.endpoint)
 
 # Add CORS headers for microphone access
 @app.after_request
@@ -33,6 +164,10 @@ def after_request(response):
 
 @app.route('/')
 def index():
+    tenant = request.args.get('tenant')
+    if tenant and ai_interviewer.question_banks.has(tenant):
+        return render_template('index.html', tenant=tenant,
+                               tenant_roles=ai_interviewer.question_banks.get(tenant).roles())
     return render_template('index.html')
 
 @app.route('/debug/models')
@@ -68,8 +203,30 @@ def debug_models():
     except Exception as e:
         results['speech_processor'] = f"Error: {e}"
     
+    results['event_log'] = f"Dropped events: {event_log.dropped}"
+    results['fragment_cache'] = fragment_cache.stats()
+    results['admission'] = throttle.admission_controller.stats()
+    results['question_banks'] = ai_interviewer.question_banks.stats()
+    if ai_interviewer.answer_memo is not None:
+        results['answer_memo'] = ai_interviewer.answer_memo.stats()
+    results['resume_uploads'] = resume_uploads.stats()
+    results['resume_revisions'] = resume_revisions.stats()
+    results['profiler'] = {'enabled': profiler.enabled, 'profiled_requests': profiler.profiled}
+    
     return jsonify(results)
 
+@app.route('/debug/profile')
+def debug_profile():
+    """Aggregated stack samples; ?format=folded returns collapsed stacks for flamegraph tools"""
+    # Only reachable with the configured X-Profile token; without one it does not exist
+    if not profiler.authorized(request.headers):
+        abort(404)
+    
+    route = request.args.get('route')
+    if request.args.get('format') == 'folded':
+        return profiler.folded(route), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    return jsonify(profiler.summary(route, limit=request.args.get('limit', 20, type=int)))
+
 @app.route('/debug/start_interview_direct')
 def debug_start_interview_direct():
     """Direct test of interview start"""
@@ -82,11 +239,12 @@ def debug_start_interview_direct():
     session['interview_id'] = secrets.token_hex(16)
     session['current_question'] = 0
     session['score'] = 0
-    session['responses'] = []
+    session['responses'] = ResponseLog.new()
     session['questions'] = questions
     session['job_role'] = 'software_engineer'
     session['start_time'] = datetime.now().isoformat()
     session['enable_voice'] = False
+    event_log.append('start', session['interview_id'], job_role='software_engineer')
     
     return redirect(url_for('interview_room'))
 
@@ -129,6 +287,7 @@ def auto_next_question():
         return redirect(url_for('interview_room'))
 
 @app.route('/analyze_resume', methods=['GET', 'POST'])
+@throttle.limit('resume', methods=('POST',))
 def analyze_resume():
     if request.method == 'POST':
         if 'resume' not in request.files:
@@ -137,19 +296,53 @@ def analyze_resume():
         file = request.files['resume']
         if file and allowed_file(file.filename):
             try:
-                # Save file
-                filename = secrets.token_hex(8) + '_' + file.filename
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
+                # Save file under its content hash
+                upload = resume_uploads.put(file.stream, file.filename)
+                filename = upload['stored_name']
+                filepath = resume_uploads.path(upload['hash'], upload['extension'])
                 
-                # Analyze resume
-                analysis = resume_analyzer.analyze_resume_file(filepath)
+                # Reuse the earlier analysis of a near-duplicate upload, unless
+                # this revises the session's last resume: then only its new or
+                # edited paragraphs are re-analyzed
+                text = resume_analyzer.parse_resume(filepath)
+                signature = resume_deduplicator.signature(text)
+                duplicate = resume_deduplicator.find_duplicate(signature)
+                previous_file = session.get('resume_file')
+                revision = resume_revisions.has(previous_file)
+                
+                if duplicate and not revision:
+                    analysis = dict(duplicate['analysis'])
+                    analysis['duplicate_of'] = {
+                        'resume': duplicate['resume'],
+                        'name': resume_uploads.names([duplicate['resume']])[duplicate['resume']],
+                        'similarity': duplicate['similarity']
+                    }
+                    cache_key = ('resume_analysis', duplicate['resume'], duplicate['similarity'])
+                    candidate_id = duplicate['resume']
+                else:
+                    cache_key = ('resume_analysis', filename, None)
+                    analysis = resume_revisions.analyze(text, filename, previous_file)
+                    # A revision updates its candidate's index entry instead of adding a new one
+                    candidate_id = session.get('candidate_id', previous_file) if revision else filename
+                    if analysis.get('incomplete'):
+                        # Stages that timed out are retried on the next upload, so a
+                        # partial analysis is neither shared, indexed nor cached
+                        cache_key = None
+                    else:
+                        resume_deduplicator.add(filename, signature, analysis)
+                        candidate_index.add(candidate_id, analysis)
+                if cache_key is not None:
+                    # Recorded only now, so a failed analysis leaves the upload stale for re-analysis
+                    resume_uploads.set_analysis_version(upload['hash'], resume_analysis_version)
                 
                 # Store analysis in session
                 session['resume_analysis'] = analysis
                 session['resume_file'] = filename
+                session['candidate_id'] = candidate_id
                 
-                return render_template('resume_analysis.html', analysis=analysis)
+                if cache_key is None:
+                    return render_template('resume_analysis.html', analysis=analysis)
+                return fragment_cache.render(cache_key, 'resume_analysis.html', analysis=analysis)
                 
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -158,6 +351,36 @@ def analyze_resume():
     
     return render_template('resume_analysis.html')
 
+@app.route('/candidates/top', methods=['POST'])
+def top_candidates():
+    """Rank every indexed resume against a job description"""
+    data = request.get_json(silent=True)
+    if data is None:
+        data = request.form
+    elif not isinstance(data, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+    job_description = data.get('job_description', '')
+    if not isinstance(job_description, str):
+        return jsonify({'error': 'job_description must be a string'}), 400
+    if not job_description.strip():
+        return jsonify({'error': 'No job description provided'}), 400
+    
+    try:
+        k = max(1, int(data.get('k', 50)))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'k must be an integer'}), 400
+    skills = resume_analyzer._extract_skills(job_description)
+    
+    candidates = candidate_index.top_k(skills, k=k)
+    names = resume_uploads.names([c['candidate'] for c in candidates])
+    for candidate in candidates:
+        candidate['name'] = names[candidate['candidate']]
+    
+    return jsonify({
+        'required_skills': skills,
+        'candidates': candidates
+    })
+
 @app.route('/chatbot')
 def chatbot_page():
     return render_template('chatbot.html')
@@ -179,7 +402,7 @@ def test_questions():
     session['interview_id'] = 'test'
     session['current_question'] = 0
     session['questions'] = questions
-    session['responses'] = []
+    session['responses'] = ResponseLog.new()
     
     return redirect('/interview_room')
 
@@ -189,20 +412,27 @@ def start_video_interview():
     
     # Get job role and use resume analysis if available
     job_role = request.form.get('job_role', 'software_engineer')
+    tenant = request.form.get('tenant') or request.args.get('tenant')
     resume_analysis = session.get('resume_analysis', {})
     
-    # Generate personalized questions based on resume
-    questions = question_generator.generate_questions(job_role, resume_analysis)
+    # Clients with their own question bank get its questions for the role
+    questions = ai_interviewer.get_questions(job_role, tenant) if ai_interviewer.question_banks.has(tenant) else []
+    if not questions:
+        # Generate personalized questions based on resume
+        tenant = None
+        questions = question_generator.generate_questions(job_role, resume_analysis)
     
     # Initialize interview session
     session['interview_id'] = secrets.token_hex(16)
     session['current_question'] = 0
     session['score'] = 0
-    session['responses'] = []
+    session['responses'] = ResponseLog.new()
     session['questions'] = questions
     session['job_role'] = job_role
     session['start_time'] = datetime.now().isoformat()
     session['enable_voice'] = True
+    session['tenant'] = tenant
+    event_log.append('start', session['interview_id'], job_role=job_role, tenant=tenant)
     
     return redirect(url_for('video_interview'))
 
@@ -214,6 +444,90 @@ def video_interview():
     return render_template('video_interview.html',
                          enable_voice=session.get('enable_voice', True))
 
+def _video_upload_or_error(upload_id):
+    """Check that the upload belongs to this session's interview"""
+    if 'interview_id' not in session:
+        return jsonify({'error': 'No active interview'}), 400
+    try:
+        if video_uploads.owner(upload_id) != session['interview_id']:
+            return jsonify({'error': 'Unknown upload'}), 404
+    except UploadError as e:
+        return jsonify({'error': str(e)}), 404
+    return None
+
+@app.route('/video_upload', methods=['POST'])
+def start_video_upload():
+    """Open a chunked upload for one recorded answer"""
+    if 'interview_id' not in session:
+        return jsonify({'error': 'No active interview'}), 400
+    
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = request.form
+    try:
+        question_index = int(data.get('question_index', session.get('current_question', 0)))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'question_index must be an integer'}), 400
+    if not 0 <= question_index < len(session['questions']):
+        return jsonify({'error': 'question_index out of range'}), 400
+    upload_id = video_uploads.start(session['interview_id'], question_index,
+                                    data.get('mime_type', 'video/webm'))
+    return jsonify({'upload_id': upload_id, 'offset': 0})
+
+@app.route('/video_upload/<upload_id>', methods=['GET'])
+def video_upload_status(upload_id):
+    """Current offset, so a client can resume after a dropped connection"""
+    error = _video_upload_or_error(upload_id)
+    if error:
+        return error
+    return jsonify(video_uploads.status(upload_id))
+
+@app.route('/video_upload/<upload_id>', methods=['PUT'])
+def upload_video_chunk(upload_id):
+    """Append one MediaRecorder segment: ?offset=N, body is the raw bytes"""
+    error = _video_upload_or_error(upload_id)
+    if error:
+        return error
+    
+    offset = request.args.get('offset', type=int)
+    length = request.content_length
+    if offset is None or length is None:
+        return jsonify({'error': 'offset and Content-Length are required'}), 400
+    
+    try:
+        new_offset = video_uploads.append_chunk(upload_id, offset, request.stream, length,
+                                                request.headers.get('X-Chunk-Checksum'))
+    except UploadOffsetError as e:
+        return jsonify({'error': str(e), 'offset': e.expected_offset}), 409
+    except UploadError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({'offset': new_offset})
+
+@app.route('/video_upload/<upload_id>/complete', methods=['POST'])
+def complete_video_upload(upload_id):
+    error = _video_upload_or_error(upload_id)
+    if error:
+        return error
+    
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = request.form
+    total_size = data.get('size')
+    try:
+        total_size = int(total_size) if total_size is not None else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'size must be an integer'}), 400
+    try:
+        video_uploads.complete(upload_id, total_size)
+    except UploadOffsetError as e:
+        return jsonify({'error': str(e), 'offset': e.expected_offset}), 409
+    except UploadError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    event_log.append('video', session['interview_id'], upload_id=upload_id)
+    return jsonify(video_uploads.status(upload_id))
+
 @app.route('/interview_room')
 def interview_room():
     if 'interview_id' not in session:
@@ -229,73 +543,143 @@ def interview_room():
     question = questions[current_q]
     return render_template('interview_room.html',
                          question=question,
+                         audio_url=_question_audio_url(question['question']),
                          question_num=current_q + 1,
                          total_questions=len(questions),
-                         enable_voice=session.get('enable_voice', True))
+                         enable_voice=session.get('enable_voice', True),
+                         single_page=app.config['INTERVIEW_SINGLE_PAGE'],
+                         prefetch=app.config['INTERVIEW_PREFETCH'],
+                         transcript_stream_url=app.config['TRANSCRIPT_STREAM_URL'])
     
     
-@app.route('/submit_answer', methods=['POST'])
-def submit_answer():
-    if 'interview_id' not in session:
-        return jsonify({'error': 'No active interview'}), 400
-    
-    current_q = session['current_question']
-    questions = session['questions']
-    
-    # Check if we've exceeded the question count
-    if current_q >= len(questions):
-        return jsonify({
-            'completed': True,
-            'next_question': current_q,
-            'score': 0,
-            'feedback': 'Interview completed!',
-            'detailed_analysis': {}
-        })
-    
-    answer = request.form.get('answer', '')
-    job_role = session['job_role']
-    resume_analysis = session.get('resume_analysis', {})
+def _question_payload(index, questions):
+    question = questions[index]
+    return {
+        'question': question['question'],
+        'question_num': index + 1,
+        'total_questions': len(questions),
+        'type': question.get('type', 'technical'),
+        'audio_url': _question_audio_url(question['question'])
+    }
+
+def _parse_prefetch(value):
+    """A client's prefetch value: 'all' or a count of at least 0. Raises ValueError otherwise"""
+    if value == 'all':
+        return value
+    try:
+        count = int(value)
+    except TypeError:
+        raise ValueError(f"Invalid prefetch {value!r}")
+    if count < 0:
+        raise ValueError(f"Invalid prefetch {value!r}")
+    return count
+
+def _upcoming_questions(prefetch, state=None):
+    """The next `prefetch` questions from the current one ('all' for the rest)"""
+    state = session if state is None else state
+    current_q = state['current_question']
+    questions = state['questions']
+    end = len(questions) if prefetch == 'all' else min(len(questions), current_q + prefetch)
+    return [_question_payload(i, questions) for i in range(current_q, end)]
+
+def _process_answer(answer, state=None):
+    """Score the answer to the current question and advance the interview
+    
+    `state` defaults to the Flask session; the async API passes the session
+    dict it decoded from the cookie and runs this in an executor.
+    """
+    state = session if state is None else state
+    current_q = state['current_question']
+    questions = state['questions']
+    job_role = state['job_role']
+    resume_analysis = state.get('resume_analysis', {})
     
     # Analyze the answer
     score, feedback, detailed_analysis = ai_interviewer.analyze_answer(
-        job_role, current_q, answer, resume_analysis
+        job_role, current_q, answer, resume_analysis, tenant=state.get('tenant')
     )
     
     # Add AI personality to feedback
-    if score >= 8:
-        ai_feedback = f"Excellent! {feedback} That was a well-structured response."
-    elif score >= 6:
-        ai_feedback = f"Good job. {feedback} You're on the right track."
-    elif score >= 4:
-        ai_feedback = f"Okay. {feedback} Let's work on improving this."
-    else:
-        ai_feedback = f"I see. {feedback} We'll practice more on this area."
+    ai_feedback = persona_feedback(score, feedback)
     
-    # Store response
-    session['responses'].append({
-        'question_index': current_q,
-        'question': questions[current_q]['question'],
-        'answer': answer,
-        'score': score,
-        'feedback': ai_feedback,
-        'detailed_analysis': detailed_analysis
-    })
+    event_log.append('answer', state['interview_id'], question_index=current_q, answer=answer)
+    event_log.append('score', state['interview_id'], question_index=current_q,
+                     score=score, feedback=ai_feedback)
     
-    session['score'] += score
-    session['current_question'] += 1
+    # Store response; question and feedback text are rebuilt when results render
+    responses = ResponseLog.from_session(state)
+    responses.append(current_q, answer, score, detailed_analysis.pop('feedback_parts'))
     
-    # Check if interview is completed
-    completed = session['current_question'] >= len(questions)
+    state['score'] += score
+    state['current_question'] += 1
+    state['results_version'] = state.get('results_version', 0) + 1
     
-    return jsonify({
-        'next_question': session['current_question'],
+    # Check if interview is completed
+    completed = state['current_question'] >= len(questions)
+    if completed:
+        state['overall_feedback'] = ai_interviewer.generate_overall_feedback(
+            responses.scored(), resume_analysis
+        )
+        event_log.append('finish', state['interview_id'], job_role=job_role, total_score=state['score'])
+        results_store.record_interview(state['interview_id'], job_role, responses.scored(),
+                                       tenant=state.get('tenant'))
+    
+    return {
+        'next_question': state['current_question'],
         'score': score,
         'feedback': ai_feedback,
         'detailed_analysis': detailed_analysis,
         'completed': completed
-    })
+    }
+
+@app.route('/submit_answer', methods=['POST'])
+@throttle.limit('answer')
+def submit_answer():
+    if 'interview_id' not in session:
+        return jsonify({'error': 'No active interview'}), 400
+    
+    # Check if we've exceeded the question count
+    if session['current_question'] >= len(session['questions']):
+        return jsonify({
+            'completed': True,
+            'next_question': session['current_question'],
+            'score': 0,
+            'feedback': 'Interview completed!',
+            'detailed_analysis': {}
+        })
+    
+    return jsonify(_process_answer(request.form.get('answer', '')))
+
+@app.route('/api/interview/answer', methods=['POST'])
+@throttle.limit('answer')
+def api_submit_answer():
+    """JSON answer API for the single-page interview flow.
+    
+    Returns the score plus the next few questions so the page can move on
+    without a redirect or template render.
+    """
+    if 'interview_id' not in session:
+        return jsonify({'error': 'No active interview'}), 400
+    
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = request.form
+    try:
+        prefetch = _parse_prefetch(data.get('prefetch', app.config['INTERVIEW_PREFETCH']))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    answer = data.get('answer', '')
+    if not isinstance(answer, str):
+        return jsonify({'error': 'answer must be a string'}), 400
+    if session['current_question'] >= len(session['questions']):
+        return jsonify({'completed': True, 'upcoming': []})
+    
+    result = _process_answer(answer)
+    result['upcoming'] = _upcoming_questions(prefetch)
+    return jsonify(result)
 
 @app.route('/process_voice', methods=['POST'])
+@throttle.limit('voice')
 def process_voice():
     if 'interview_id' not in session:
         return jsonify({'error': 'No active interview'}), 400
@@ -331,40 +715,75 @@ def results():
     if 'interview_id' not in session:
         return redirect(url_for('index'))
     
+    responses = ResponseLog.from_session(session)
     total_score = session['score']
-    max_possible = len(session['responses']) * 10
+    max_possible = len(responses) * 10
     percentage = (total_score / max_possible * 100) if max_possible > 0 else 0
     
-    # Generate overall feedback
-    overall_feedback = ai_interviewer.generate_overall_feedback(
-        session['responses'], session.get('resume_analysis', {})
-    )
+    # Rendered page is cached per interview until another answer changes it
+    cache_key = ('results', session['interview_id'], session.get('results_version', 0))
+    html = fragment_cache.get(cache_key)
+    if html is not None:
+        return html
+    
+    # Overall feedback is precomputed when the interview completes
+    overall_feedback = session.get('overall_feedback')
+    if overall_feedback is None:
+        overall_feedback = ai_interviewer.generate_overall_feedback(
+            responses.scored(), session.get('resume_analysis', {})
+        )
     
-    return render_template('results.html',
+    html = render_template('results.html',
                          score=total_score,
                          percentage=percentage,
-                         responses=session['responses'],
+                         responses=list(responses.records(session.get('questions', []))),
                          overall_feedback=overall_feedback,
                          resume_analysis=session.get('resume_analysis'))
+    fragment_cache.set(cache_key, html)
+    return html
+
+@app.route('/cohort')
+def cohort():
+    """Compare the current candidate against every stored interview for the role"""
+    job_role = request.args.get('role', session.get('job_role', 'software_engineer'))
+    tenant = request.args.get('tenant', session.get('tenant'))
+    try:
+        bins = int(request.args.get('bins', 10))
+    except ValueError:
+        return jsonify({'error': 'bins must be an integer'}), 400
+    if bins < 1:
+        return jsonify({'error': 'bins must be at least 1'}), 400
+    bins = min(bins, app.config['COHORT_MAX_BINS'])
+    
+    return jsonify(results_store.cohort(job_role, session.get('interview_id'), bins=bins, tenant=tenant))
 
 @app.route('/get_next_question')
 def get_next_question():
     if 'interview_id' not in session:
         return jsonify({'error': 'No active interview'}), 400
     
-    current_q = session['current_question']
-    questions = session['questions']
+    prefetch = request.args.get('prefetch')
+    try:
+        prefetch = _parse_prefetch(prefetch) if prefetch is not None else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(_next_question(prefetch))
+
+def _next_question(prefetch=None, state=None):
+    state = session if state is None else state
+    current_q = state['current_question']
+    questions = state['questions']
     
     if current_q >= len(questions):
-        return jsonify({'completed': True})
+        return {'completed': True}
     
-    question = questions[current_q]
-    return jsonify({
-        'question': question['question'],
-        'question_num': current_q + 1,
-        'total_questions': len(questions),
-        'type': question.get('type', 'technical')
-    })
+    payload = _question_payload(current_q, questions)
+    
+    # ?prefetch=N (or 'all') also returns the upcoming questions for the single-page flow
+    if prefetch:
+        payload['upcoming'] = _upcoming_questions(prefetch, state)
+    
+    return payload
 
 def create_ssl_context():
     """Create SSL context with fallback"""
@@ -0,0 +1,280 @@
+"""ASGI variant of the interview API for long-lived voice sessions.
+
+Serves the answer, next-question and transcript-stream endpoints on one
+event loop, so an idle open connection costs a coroutine instead of a
+thread. Scoring and transcription reuse the Flask app's AIInterviewer and
+SpeechProcessor and run in a thread pool. The interview state is the
+Flask session cookie, so both apps can serve the same interview.
+
+Run with: uvicorn app_async:application --port 8000
+"""
+import asyncio
+import io
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+from werkzeug.http import dump_cookie, parse_cookie
+from itsdangerous import BadSignature
+from app import (app as flask_app, ai_interviewer, speech_processor, throttle,
+                 _process_answer, _next_question, _upcoming_questions, _parse_prefetch)
+
+executor = ThreadPoolExecutor(max_workers=flask_app.config['ASYNC_SCORING_THREADS'])
+
+
+class CookieSession:
+    """Reads and writes the Flask session cookie outside of a Flask request."""
+
+    def __init__(self, app):
+        self.app = app
+        self.interface = app.session_interface
+        self.serializer = self.interface.get_signing_serializer(app)
+        self.cookie_name = self.interface.get_cookie_name(app)
+        self.max_age = int(app.permanent_session_lifetime.total_seconds())
+
+    def load(self, headers):
+        cookie = parse_cookie(headers.get('cookie', '')).get(self.cookie_name)
+        if not cookie:
+            return {}
+        try:
+            return self.serializer.loads(cookie, max_age=self.max_age)
+        except BadSignature:
+            return {}
+
+    def set_cookie_header(self, state):
+        return dump_cookie(
+            self.cookie_name,
+            self.serializer.dumps(dict(state)),
+            domain=self.interface.get_cookie_domain(self.app),
+            path=self.interface.get_cookie_path(self.app),
+            secure=self.interface.get_cookie_secure(self.app),
+            httponly=self.interface.get_cookie_httponly(self.app),
+            samesite=self.interface.get_cookie_samesite(self.app),
+        )
+
+
+cookie_session = CookieSession(flask_app)
+
+
+def _headers(scope):
+    return {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+
+
+async def _read_body(receive, limit):
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        body += message.get('body', b'')
+        if len(body) > limit:
+            return None
+        if not message.get('more_body'):
+            return bytes(body)
+
+
+async def _send_json(send, status, payload, headers=()):
+    body = json.dumps(payload).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'),
+                    (b'content-length', str(len(body)).encode())] + list(headers),
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def _client_key(scope):
+    # The client's address, like RequestThrottle: a new interview must not reset its buckets
+    return (scope.get('client') or ('unknown',))[0]
+
+
+async def submit_answer(scope, receive, send):
+    """POST /api/interview/answer, the same contract as the Flask route."""
+    state = cookie_session.load(_headers(scope))
+    body = await _read_body(receive, flask_app.config['ASYNC_MAX_BODY'])
+    if body is None:
+        return await _send_json(send, 413, {'error': 'Request body too large'})
+    if 'interview_id' not in state:
+        return await _send_json(send, 400, {'error': 'No active interview'})
+
+    # The SQLite backend does blocking I/O, so the check runs off the event loop
+    loop = asyncio.get_running_loop()
+    allowed, retry_after = await loop.run_in_executor(executor, throttle.rate_limiter.check,
+                                                      'answer', _client_key(scope))
+    if not allowed:
+        return await _send_json(send, 429, {'error': 'Too many requests, please slow down',
+                                            'retry_after': round(retry_after, 2)},
+                                [(b'retry-after', str(max(1, math.ceil(retry_after))).encode())])
+
+    try:
+        data = json.loads(body or b'{}')
+    except ValueError:
+        return await _send_json(send, 400, {'error': 'Invalid JSON'})
+    if not isinstance(data, dict):
+        return await _send_json(send, 400, {'error': 'Expected a JSON object'})
+    answer = data.get('answer', '')
+    if not isinstance(answer, str):
+        return await _send_json(send, 400, {'error': 'answer must be a string'})
+    try:
+        prefetch = _parse_prefetch(data.get('prefetch', flask_app.config['INTERVIEW_PREFETCH']))
+    except ValueError as e:
+        return await _send_json(send, 400, {'error': str(e)})
+    if state['current_question'] >= len(state['questions']):
+        return await _send_json(send, 200, {'completed': True, 'upcoming': []})
+
+    if not throttle.admission_controller.try_acquire('answer'):
+        return await _send_json(send, 429, {'error': 'Server busy, please retry shortly', 'retry_after': 1},
+                                [(b'retry-after', b'1')])
+    try:
+        result = await loop.run_in_executor(executor, _process_answer, answer, state)
+    finally:
+        throttle.admission_controller.release('answer')
+
+    result['upcoming'] = _upcoming_questions(prefetch, state)
+    await _send_json(send, 200, result, [(b'set-cookie', cookie_session.set_cookie_header(state).encode('latin-1'))])
+
+
+async def next_question(scope, receive, send):
+    """GET /get_next_question[?prefetch=N]"""
+    state = cookie_session.load(_headers(scope))
+    if 'interview_id' not in state:
+        return await _send_json(send, 400, {'error': 'No active interview'})
+    prefetch = parse_qs(scope.get('query_string', b'').decode()).get('prefetch', [None])[0]
+    try:
+        prefetch = _parse_prefetch(prefetch) if prefetch is not None else None
+    except ValueError as e:
+        return await _send_json(send, 400, {'error': str(e)})
+    await _send_json(send, 200, _next_question(prefetch, state))
+
+
+def _keyword_progress(state, transcript):
+    """Keywords of the current question the transcript covers so far"""
+    job_role, current_q, tenant = state['job_role'], state['current_question'], state.get('tenant')
+    questions = ai_interviewer.get_questions(job_role, tenant)
+    if current_q >= len(questions):
+        return []
+    keywords = questions[current_q].get('keywords', [])
+    return ai_interviewer._find_keywords(job_role, current_q, transcript, keywords, tenant)
+
+
+async def transcript_stream(scope, receive, send):
+    """WebSocket /ws/interview/transcript
+
+    Binary frames are audio chunks, transcribed in the executor. Text frames
+    are JSON transcripts from the browser's speech recognition,
+    ``{"text": ..., "final": true|false}``. Each final segment is answered
+    with the running transcript and the keywords it covers; the answer itself
+    is still submitted to /api/interview/answer, which can update the cookie.
+    Audio is rate limited and admitted like /process_voice. A frame larger
+    than ASYNC_MAX_BODY closes the socket with 1009, and a transcript past
+    ASYNC_TRANSCRIPT_MAX_SEGMENTS or _MAX_CHARS with 4413.
+    """
+    state = cookie_session.load(_headers(scope))
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    if 'interview_id' not in state or state['current_question'] >= len(state['questions']):
+        return await send({'type': 'websocket.close', 'code': 4400})
+    await send({'type': 'websocket.accept'})
+
+    loop = asyncio.get_running_loop()
+    client_key = _client_key(scope)
+    max_segments = flask_app.config['ASYNC_TRANSCRIPT_MAX_SEGMENTS']
+    max_chars = flask_app.config['ASYNC_TRANSCRIPT_MAX_CHARS']
+    segments = []
+    length = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'websocket.disconnect':
+            return
+
+        audio = message.get('bytes')
+        if audio is not None:
+            if len(audio) > flask_app.config['ASYNC_MAX_BODY']:
+                return await send({'type': 'websocket.close', 'code': 1009})
+            # Transcription runs in the scoring pool, so it is limited like /process_voice
+            allowed, retry_after = await loop.run_in_executor(executor, throttle.rate_limiter.check,
+                                                              'voice', client_key)
+            if not allowed:
+                await _send_ws_error(send, 'Too many requests, please slow down', retry_after=round(retry_after, 2))
+                continue
+            if not throttle.admission_controller.try_acquire('voice'):
+                await _send_ws_error(send, 'Server busy, please retry shortly', retry_after=1)
+                continue
+            try:
+                text = await loop.run_in_executor(executor, speech_processor.speech_to_text, io.BytesIO(audio))
+            finally:
+                throttle.admission_controller.release('voice')
+            if not text:
+                await _send_ws_error(send, 'Could not understand audio')
+                continue
+            segment = {'text': text, 'final': True}
+        else:
+            raw = message.get('text') or '{}'
+            if len(raw) > max_chars:
+                return await send({'type': 'websocket.close', 'code': 1009})
+            try:
+                segment = json.loads(raw)
+            except ValueError:
+                segment = None
+            if not isinstance(segment, dict) or not isinstance(segment.get('text', ''), str):
+                await _send_ws_error(send, 'Expected {"text": string, "final": boolean}')
+                continue
+        if not segment.get('final'):
+            continue
+
+        text = segment.get('text', '').strip()
+        segments.append(text)
+        length += len(text) + 1
+        if len(segments) > max_segments or length > max_chars:
+            await _send_ws_error(send, 'Transcript too long')
+            return await send({'type': 'websocket.close', 'code': 4413})
+        transcript = ' '.join(s for s in segments if s)
+        keywords = await loop.run_in_executor(executor, _keyword_progress, state, transcript)
+        await send({'type': 'websocket.send', 'text': json.dumps({
+            'type': 'transcript',
+            'text': transcript,
+            'word_count': len(transcript.split()),
+            'keywords_found': keywords
+        })})
+
+
+async def _send_ws_error(send, error, **fields):
+    await send({'type': 'websocket.send', 'text': json.dumps({'type': 'error', 'error': error, **fields})})
+
+
+HTTP_ROUTES = {
+    ('POST', '/api/interview/answer'): submit_answer,
+    ('GET', '/get_next_question'): next_question,
+}
+WEBSOCKET_ROUTES = {
+    '/ws/interview/transcript': transcript_stream,
+}
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            executor.shutdown(wait=True)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await _lifespan(receive, send)
+
+    if scope['type'] == 'websocket':
+        handler = WEBSOCKET_ROUTES.get(scope['path'])
+        if handler is None:
+            return await send({'type': 'websocket.close', 'code': 4404})
+        return await handler(scope, receive, send)
+
+    handler = HTTP_ROUTES.get((scope['method'], scope['path']))
+    if handler is None:
+        return await _send_json(send, 404, {'error': 'Not found'})
+    await handler(scope, receive, send)
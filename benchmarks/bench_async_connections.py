@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Idle-connection capacity of the Flask app vs. the ASGI interview API.
+
+Opens N client connections that send an incomplete request and then sit
+idle, like voice clients holding a connection open, and then times a
+normal /get_next_question request. It also reports the server's thread
+count and RSS. The Flask app runs on its threaded development server and
+the ASGI app runs on uvicorn (pip install uvicorn). Linux only, because
+it reads /proc.
+
+Usage: python benchmarks/bench_async_connections.py [connections ...]
+"""
+import sys
+import os
+import resource
+import socket
+import subprocess
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+os.chdir(ROOT)
+
+from app import app
+
+SERVERS = {
+    'flask': [sys.executable, '-c', 'from app import app; app.run(port={port}, threaded=True)'],
+    'asgi': [sys.executable, '-m', 'uvicorn', 'app_async:application', '--port', '{port}',
+             '--log-level', 'warning', '--backlog', '16384'],
+}
+
+
+def session_cookie():
+    client = app.test_client()
+    client.get('/debug/start_interview_direct')
+    return client.get_cookie('session').value
+
+
+def proc_status(pid):
+    status = {}
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            status[key] = value.strip()
+    return int(status['Threads']), int(status['VmRSS'].split()[0]) / 1024
+
+
+def wait_until_up(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start")
+
+
+def probe(port, cookie):
+    request = urllib.request.Request(f'http://127.0.0.1:{port}/get_next_question',
+                                     headers={'Cookie': f'session={cookie}'})
+    start = time.perf_counter()
+    try:
+        urllib.request.urlopen(request, timeout=10).read()
+    except OSError:
+        return None
+    return (time.perf_counter() - start) * 1000
+
+
+def run(name, connections, port, cookie):
+    command = [part.format(port=port) for part in SERVERS[name]]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    sockets = []
+    try:
+        wait_until_up(port)
+        opened = 0
+        for _ in range(connections):
+            try:
+                sock = socket.create_connection(('127.0.0.1', port), timeout=5)
+                sock.sendall(b'GET /get_next_question HTTP/1.1\r\nHost: localhost\r\n')
+                sockets.append(sock)
+                opened += 1
+            except OSError:
+                break
+        time.sleep(1)
+        latency = probe(port, cookie)
+        threads, rss = proc_status(server.pid)
+        return opened, threads, rss, latency
+    finally:
+        for sock in sockets:
+            sock.close()
+        server.terminate()
+        server.wait()
+
+
+def main(sizes):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    cookie = session_cookie()
+
+    print(f"{'server':>6} {'idle conns':>10} {'threads':>8} {'RSS MB':>8} {'probe ms':>9}")
+    port = 8700
+    for connections in sizes:
+        for name in SERVERS:
+            port += 1
+            opened, threads, rss, latency = run(name, connections, port, cookie)
+            latency = f"{latency:.1f}" if latency is not None else 'failed'
+            print(f"{name:>6} {opened:>10} {threads:>8} {rss:>8.1f} {latency:>9}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 4000])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""DOCX text extraction: python-docx object tree vs. streaming document.xml.
+
+Usage: python benchmarks/bench_docx_parse.py [paragraphs ...]
+"""
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from utils.docx_text import extract_docx_text
+
+
+def make_docx(path, paragraphs):
+    doc = Document()
+    for i in range(paragraphs):
+        doc.add_paragraph(f'Led project {i} using Python, Docker and PostgreSQL; cut latency by {i % 90}%.')
+    table = doc.add_table(rows=paragraphs // 20 or 1, cols=3)
+    for row in table.rows:
+        for cell, text in zip(row.cells, ('Acme Corp', 'Engineer', '2018 - 2020')):
+            cell.text = text
+    doc.save(path)
+
+
+def python_docx_text(path):
+    doc = Document(path)
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    return text
+
+
+def measure(func, path, runs=3):
+    start = time.perf_counter()
+    for _ in range(runs):
+        func(path)
+    elapsed = (time.perf_counter() - start) / runs * 1000
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(sizes):
+    print(f"{'paragraphs':>10} {'python-docx ms':>15} {'peak MB':>8} {'streaming ms':>13} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as folder:
+        for paragraphs in sizes:
+            path = os.path.join(folder, f'resume-{paragraphs}.docx')
+            make_docx(path, paragraphs)
+            slow, slow_peak = measure(python_docx_text, path)
+            fast, fast_peak = measure(extract_docx_text, path)
+            print(f"{paragraphs:>10} {slow:>15.1f} {slow_peak:>8.1f} {fast:>13.1f} {fast_peak:>8.1f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Per-interview footprint of session['responses'], response dicts vs. compact columns.
+
+Builds the responses of an N-question interview both ways, as decoded from
+the session cookie, and reports the Python heap they hold (tracemalloc), the
+JSON size and the signed session cookie size. The interview's questions
+are in the session either way, so they are not counted.
+
+Usage: python benchmarks/bench_response_memory.py [questions ...]
+"""
+import sys
+import os
+import json
+import random
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask.sessions import SecureCookieSessionInterface
+from models.response_log import (GOOD, NOTE_FILLERS, ResponseLog, persona_feedback,
+                                 render_feedback)
+
+ANSWER = ("In my last project the team needed to cut checkout latency, so I profiled the service, "
+          "moved the price lookups behind a cache and added load tests. Latency dropped by forty percent.")
+
+
+def interview(count):
+    """(question_index, answer, score, feedback parts, detailed analysis) per answer."""
+    rng = random.Random(count)
+    words = ANSWER.split()
+    for i in range(count):
+        answer = ' '.join(rng.sample(words, len(words)))  # distinct answers, as zlib would see them
+        parts = [GOOD, NOTE_FILLERS] if i % 3 == 0 else [GOOD]
+        analysis = {'word_count': 34, 'sentences': 2, 'quality': {
+            'word_count': 34, 'lexical_diversity': 0.85, 'avg_sentence_length': 17.0, 'filler_rate': 0.0,
+            'star_coverage': 0.75, 'keyword_coverage': 0.5, 'star': ['situation', 'action', 'result']}}
+        yield i, answer, 6.5, parts, analysis
+
+
+def legacy_responses(count, questions):
+    return [{
+        'question_index': i,
+        'question': questions[i]['question'],
+        'answer': answer,
+        'score': score,
+        'feedback': persona_feedback(score, render_feedback(parts)),
+        'detailed_analysis': analysis,
+    } for i, answer, score, parts, analysis in interview(count)]
+
+
+def compact_responses(count, questions):
+    columns = ResponseLog.new()
+    responses = ResponseLog(columns)
+    for i, answer, score, parts, _ in interview(count):
+        responses.append(i, answer, score, parts)
+    return columns
+
+
+def measure(build, count, questions, serializer):
+    # Measure the structure as a request sees it: decoded from the cookie
+    encoded = json.dumps(build(count, questions))
+    tracemalloc.start()
+    decoded = json.loads(encoded)
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    cookie = serializer.dumps({'responses': decoded})
+    return heap, len(encoded), len(cookie)
+
+
+def main(sizes):
+    app = Flask(__name__)
+    app.secret_key = 'benchmark'
+    serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+
+    print(f"{'questions':>9} {'layout':>8} {'heap KB':>8} {'JSON KB':>8} {'cookie KB':>10}")
+    for count in sizes:
+        questions = [{'question': f'Question {i}: tell me about a time you improved the performance of a system.'}
+                     for i in range(count)]
+        for name, build in (('dicts', legacy_responses), ('columns', compact_responses)):
+            heap, size, cookie = measure(build, count, questions, serializer)
+            print(f"{count:>9} {name:>8} {heap / 1024:>8.1f} {size / 1024:>8.1f} {cookie / 1024:>10.1f}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10, 50, 200])
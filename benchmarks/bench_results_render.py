@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Render time of /results for long interviews, uncached vs. fragment-cache hits.
+
+Usage: python benchmarks/bench_results_render.py [answers ...]
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, fragment_cache
+from models.response_log import GOOD
+
+
+def make_session(client, answers):
+    with client.session_transaction() as sess:
+        sess['interview_id'] = f'bench-{answers}'
+        sess['score'] = 6.5 * answers
+        sess['results_version'] = answers
+        sess['questions'] = [{'question': f'Benchmark question {i}: describe a project you are proud of.'}
+                             for i in range(answers)]
+        sess['responses'] = {
+            'question': list(range(answers)),
+            'answer': ['I led the migration of our billing service to a new platform. ' * 8] * answers,
+            'score': [6.5] * answers,
+            'feedback': [[GOOD]] * answers,
+        }
+
+
+def timed(client, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        client.get('/results')
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main(sizes):
+    runs = 50
+    client = app.test_client()
+    print(f"{'answers':>8} {'uncached ms':>12} {'cached ms':>10}")
+    for answers in sizes:
+        make_session(client, answers)
+
+        uncached = 0.0
+        for _ in range(runs):
+            fragment_cache._entries.clear()
+            uncached += timed(client, 1)
+        uncached /= runs
+
+        client.get('/results')
+        cached = timed(client, runs)
+        print(f"{answers:>8} {uncached:>12.2f} {cached:>10.2f}")
+    print(f"cache stats: {fragment_cache.stats()}")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10, 50, 100, 200])
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Latency of analyze_resume_text for one large resume, inline vs. the stage pool.
+
+Reports each stage's time, then p50/p99 of whole analyses run inline, on a
+thread pool, and on a thread pool with a stage timeout. The stages are
+pure-Python regex scans that hold the GIL, so the pool only overlaps them
+when they wait on something, and an abandoned stage keeps the GIL busy
+until it finishes.
+
+Usage: python benchmarks/bench_resume_stages.py [blocks ...]
+"""
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.resume_analyzer import ResumeAnalyzer
+from models.resume_sections import SectionIndex
+
+BLOCK = """EXPERIENCE
+Senior Engineer, Acme Corp  Jan 2018 - Mar 2022
+Built python and django services on aws with docker and kubernetes, postgresql and redis.
+Led a team of five; improved communication and teamwork.
+EDUCATION
+Bachelor of Science in Computer Science; Master of Engineering
+SKILLS
+python, java, react, pandas, numpy, terraform
+PROJECTS
+Search engine in rust and go with a react front end.
+"""
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main(sizes):
+    runs = 50
+    pool = ThreadPoolExecutor(4)
+    for blocks in sizes:
+        text = "Jane Doe\nSUMMARY\n8 years experience\n" + BLOCK * blocks
+        analyzer = ResumeAnalyzer()
+        sections = SectionIndex.segment(text)
+        print(f"{len(text) / 1024:.0f} KB resume: sections {timed(SectionIndex.segment, text):.1f} ms, "
+              f"skills {timed(analyzer._extract_skills, text, sections):.1f} ms, "
+              f"experience {timed(analyzer._extract_experience, text, sections):.1f} ms, "
+              f"education {timed(analyzer._extract_education, text, sections):.1f} ms")
+
+        print(f"{'mode':>16} {'p50 ms':>8} {'p99 ms':>8} {'incomplete':>10}")
+        for name, analyzer in (('inline', ResumeAnalyzer()),
+                               ('pool', ResumeAnalyzer(executor=pool)),
+                               ('pool, 50ms cap', ResumeAnalyzer(executor=pool, stage_timeout=0.05))):
+            samples = []
+            incomplete = 0
+            for _ in range(runs):
+                start = time.perf_counter()
+                analysis = analyzer.analyze_resume_text(text)
+                samples.append((time.perf_counter() - start) * 1000)
+                incomplete += 'incomplete' in analysis
+            p50, p99 = percentiles(samples)
+            print(f"{name:>16} {p50:>8.1f} {p99:>8.1f} {incomplete:>10}")
+            pool.submit(time.sleep, 0).result()
+            time.sleep(0.5)  # let abandoned stages finish before the next mode
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [200, 2000])
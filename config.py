@@ -3,11 +3,84 @@ import os
 class Config:
     SECRET_KEY = 'your-secret-key-here-change-this-in-production'
     UPLOAD_FOLDER = 'uploads'
+    RESUME_STORE_FOLDER = 'uploads/resumes'  # hash-sharded; python -m models.upload_store maintain
+    UPLOAD_RETENTION_DAYS = 365  # None keeps uploads forever
+    UPLOAD_ARCHIVE_AFTER_DAYS = 30  # then packed into per-day zip archives
+    RESUME_ANALYSIS_VERSION = 1  # bump when analysis output changes; recorded per upload
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    ASSET_DIST_FOLDER = 'static/dist'  # built by: python -m utils.assets
+    ASSET_MAX_AGE = 365 * 24 * 60 * 60
+    # Offline question audio: 'pyttsx3' (pip install pyttsx3), 'stub' for tests, None to leave it to the browser
+    TTS_ENGINE = os.environ.get('TTS_ENGINE')
+    TTS_VOICE = None
+    TTS_CACHE_FOLDER = 'data/tts'
+    TTS_CACHE_MAX_TEXTS = 10000  # question texts remembered for rendering clips on demand
+    FRAGMENT_CACHE_SIZE = 256  # rendered results/resume pages kept in memory
+    VIDEO_UPLOAD_FOLDER = 'uploads/videos'
+    VIDEO_UPLOAD_ABANDON_AFTER = 24 * 60 * 60  # seconds without a chunk before a partial upload is deleted
+    RESULTS_FOLDER = 'data/results'
+    COHORT_MAX_BINS = 100  # histogram bins a /cohort request may ask for
+    CANDIDATE_INDEX_FOLDER = 'data/candidates'
+    RESUME_SCORING_WEIGHTS = None  # JSON file overriding LinearResumeScorer.DEFAULT_WEIGHTS, e.g. retrained weights
+    RESUME_STAGE_THREADS = 0  # shared pool for concurrent resume analysis stages; 0 runs them inline
+    RESUME_STAGE_TIMEOUT = 5.0  # seconds before a stage is abandoned and its partial default used
+    RESUME_REVISION_CACHE_BYTES = 4 * 1024 * 1024  # stage results of recent resumes kept for re-uploaded revisions
+    DEDUP_FOLDER = 'data/dedup'
+    DEDUP_THRESHOLD = 0.8  # estimated Jaccard similarity to treat an upload as a duplicate
+    
+    # Event log settings
+    EVENT_LOG_FOLDER = 'data/events'
+    EVENT_LOG_QUEUE_SIZE = 10000
+    EVENT_LOG_FSYNC_INTERVAL = 1.0  # seconds between fsyncs of the active segment
+    EVENT_LOG_SEGMENT_BYTES = 16 * 1024 * 1024
     
     # Interview settings
     MAX_QUESTIONS = 10
     QUESTION_TIME_LIMIT = 180  # 3 minutes per question
+    INTERVIEW_SINGLE_PAGE = True  # move between questions over JSON instead of re-rendering the room
+    INTERVIEW_PREFETCH = 3  # upcoming questions sent with each answer
+    
+    # Answer scoring: 'exact' keyword substrings or 'semantic' synonym/stem matching.
+    # 'semantic' finds more keywords, so it raises scores compared with earlier interviews
+    SCORING_MODE = 'exact'
+    SYNONYMS_FILE = 'data/questions/synonyms.json'
+    ANSWER_REFERENCE_FILE = 'data/responses/sample_responses.json'
+    ANSWER_MEMO_SIZE = 4096  # analyses of repeated practice answers kept per worker; 0 disables
+    
+    # Per-tenant question banks: <folder>/<tenant>/interview_questions.json
+    QUESTION_BANK_FOLDER = 'data/tenants'
+    MAX_LOADED_TENANTS = 64  # compiled banks kept mapped per worker
+    
+    # Rate limiting and admission control per route class
+    RATE_LIMITS = {  # (tokens per second, burst) per client IP
+        'resume': (0.1, 5),
+        'voice': (1.0, 10),
+        'answer': (2.0, 10)
+    }
+    ADMISSION_LIMITS = {  # (max concurrent requests per worker, priority)
+        'resume': (2, 'low'),
+        'voice': (4, 'low'),
+        'answer': (32, 'high')
+    }
+    ADMISSION_SHED_LOW_PRIORITY_AT = 16  # in-flight requests before low priority work is refused
+    RATE_LIMIT_BACKEND = 'memory'  # or 'sqlite' to share buckets across workers
+    RATE_LIMIT_SQLITE_PATH = 'data/rate_limits.sqlite3'
+    
+    # Async (ASGI) interview API: uvicorn app_async:application
+    ASYNC_SCORING_THREADS = 8  # executor threads for answer scoring and transcription
+    ASYNC_MAX_BODY = 1024 * 1024  # also the largest audio frame on the transcript socket
+    ASYNC_TRANSCRIPT_MAX_SEGMENTS = 500  # final segments per transcript socket before it is closed
+    ASYNC_TRANSCRIPT_MAX_CHARS = 20000
+    # Live keyword progress while speaking, e.g. ws://localhost:8000/ws/interview/transcript
+    TRANSCRIPT_STREAM_URL = os.environ.get('TRANSCRIPT_STREAM_URL')
+    
+    # Sampling profiler: a fraction of requests, or any request sent with X-Profile: <token>
+    PROFILE_ENABLED = False
+    PROFILE_SAMPLE_RATE = 0.01
+    PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN')
+    PROFILE_INTERVAL = 0.005  # seconds between stack samples
+    PROFILE_FOLDER = 'data/profiles'
+    PROFILE_MAX_BYTES = 4 * 1024 * 1024  # per route; older samples are merged and the rarest dropped
     
     # Chatbot settings
     CHATBOT_NAME = "InterviewBot"
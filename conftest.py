@@ -0,0 +1,30 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Settings the app writes to at import time or while serving requests
+WRITABLE_SETTINGS = ('UPLOAD_FOLDER', 'RESUME_STORE_FOLDER', 'VIDEO_UPLOAD_FOLDER', 'TTS_CACHE_FOLDER',
+                     'RESULTS_FOLDER', 'CANDIDATE_INDEX_FOLDER', 'DEDUP_FOLDER', 'EVENT_LOG_FOLDER',
+                     'RATE_LIMIT_SQLITE_PATH', 'PROFILE_FOLDER')
+
+
+@pytest.fixture(scope='session')
+def app_module(tmp_path_factory):
+    """The app module, imported with its data and upload paths under a temporary folder."""
+    from config import Config
+
+    if 'app' in sys.modules:
+        yield sys.modules['app']
+        return
+    root = tmp_path_factory.mktemp('app')
+    patch = pytest.MonkeyPatch()
+    for name in WRITABLE_SETTINGS:
+        patch.setattr(Config, name, str(root / os.path.basename(getattr(Config, name))))
+    try:
+        yield importlib.import_module('app')
+    finally:
+        patch.undo()
@@ -2,6 +2,13 @@ import json
 import os
 import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
+from models.keyword_matcher import KeywordMatcher, SynonymTable
+from models.question_bank import QuestionBankRegistry
+from models.answer_memo import AnswerMemo, answer_digest
+from models.answer_quality import (ReferenceStats, extract_quality_features, quality_note_parts,
+                                   read_sample_answers, update_logged_stats)
+from models import response_log
+from models.response_log import feedback_part, render_feedback
 
 # Download required NLTK data
 try:
@@ -10,9 +17,24 @@ except LookupError:
     nltk.download('punkt')
 
 class AIInterviewer:
-    def __init__(self):
+    SCORING_VERSION = 1  # bump when scoring or feedback changes, so memoized analyses are not reused
+    
+    def __init__(self, scoring_mode='exact', synonyms_file='data/questions/synonyms.json',
+                 reference_file='data/responses/sample_responses.json', events_folder=None,
+                 tenants_folder='data/tenants', max_loaded_tenants=64, memo_size=4096):
         self.questions_file = 'data/questions/interview_questions.json'
+        self.scoring_mode = scoring_mode
+        self.synonyms_file = synonyms_file
         self.questions = self._load_questions()
+        self.synonym_table = SynonymTable(synonyms_file) if scoring_mode == 'semantic' else None
+        self.matchers = self._compile_matchers()
+        self.question_banks = QuestionBankRegistry(tenants_folder, max_loaded_tenants)
+        self.reference_stats = ReferenceStats()
+        self._seed_reference_stats(read_sample_answers(reference_file))
+        if events_folder:
+            self.reference_stats.merge(update_logged_stats(events_folder, self._reference_version(),
+                                                           self._reference_features))
+        self.answer_memo = AnswerMemo(memo_size) if memo_size else None
     
     def _load_questions(self):
         try:
@@ -55,37 +77,127 @@ class AIInterviewer:
             ]
         }
     
-    def get_questions(self, job_role):
+    def _compile_matchers(self):
+        """Build one keyword matcher per question when semantic scoring is enabled"""
+        if self.synonym_table is None:
+            return {}
+        
+        return {
+            job_role: [KeywordMatcher(q.get('keywords', []), self.synonym_table) for q in questions]
+            for job_role, questions in self.questions.items()
+        }
+    
+    def _seed_reference_stats(self, answers):
+        """Add (job_role, question_index, answer) samples to the per-question reference statistics"""
+        for job_role, question_index, answer in answers:
+            features = self._reference_features(job_role, question_index, answer)
+            if features is not None:
+                self.reference_stats.observe(job_role, question_index, features)
+    
+    def _reference_features(self, job_role, question_index, answer):
+        """Quality features of a reference answer, or None if it does not fit the question bank"""
+        questions = self.questions.get(job_role)
+        if not questions or not 0 <= question_index < len(questions) or not answer.strip():
+            return None
+        keywords = questions[question_index].get('keywords', [])
+        keywords_found = self._find_keywords(job_role, question_index, answer, keywords)
+        return extract_quality_features(answer, keywords, keywords_found)
+    
+    def _reference_version(self):
+        """Identifies what logged-answer statistics depend on, so a stale snapshot is rebuilt"""
+        sources = [self.questions_file] + ([self.synonyms_file] if self.synonym_table is not None else [])
+        mtimes = [os.path.getmtime(path) if os.path.exists(path) else 0 for path in sources]
+        return f"{self.scoring_mode}/{self.SCORING_VERSION}/" + '/'.join(f'{m:.6f}' for m in mtimes)
+    
+    def _find_keywords(self, job_role, question_index, answer, expected_keywords, tenant=None):
+        """Return the expected keywords covered by the answer"""
+        if tenant and self.synonym_table is not None:
+            # Tenant questions are not precompiled; matchers are built on first use and
+            # cached on the mapped bank, so they go when the bank is reloaded or evicted
+            bank = self.question_banks.get(tenant)
+            key = (bank.default_role(job_role), question_index)
+            matcher = bank.matchers.get(key)
+            if matcher is None:
+                matcher = bank.matchers[key] = KeywordMatcher(expected_keywords, self.synonym_table)
+            found = matcher.match(answer)
+            return [kw for i, kw in enumerate(expected_keywords) if i in found]
+        
+        matchers = None if tenant else self.matchers.get(job_role if job_role in self.questions else 'software_engineer')
+        if matchers:
+            found = matchers[question_index].match(answer)
+            return [kw for i, kw in enumerate(expected_keywords) if i in found]
+        
+        answer_lower = answer.lower()
+        return [kw for kw in expected_keywords if kw.lower() in answer_lower]
+    
+    def get_questions(self, job_role, tenant=None):
+        if tenant:
+            bank = self.question_banks.get(tenant)
+            role = bank.default_role(job_role)
+            return bank.get_questions(role) if role is not None else []
         return self.questions.get(job_role, self.questions['software_engineer'])
     
-    def analyze_answer(self, job_role, question_index, answer, resume_analysis=None):
-        questions = self.get_questions(job_role)
+    def analyze_answer(self, job_role, question_index, answer, resume_analysis=None, tenant=None):
+        if tenant:
+            bank = self.question_banks.get(tenant)
+            role = bank.default_role(job_role)
+            question = bank.get_question(role, question_index) if role is not None else None
+            stats_role = f'{tenant}/{role}'
+            bank_version = bank.source_stamp
+        else:
+            questions = self.get_questions(job_role)
+            question = questions[question_index] if question_index < len(questions) else None
+            stats_role = job_role if job_role in self.questions else 'software_engineer'
+            bank_version = None
         
-        if question_index >= len(questions):
-            return 0, "Invalid question index", {}
+        if question is None:
+            return 0, "Invalid question index", {'feedback_parts': [response_log.INVALID_QUESTION]}
         
-        question = questions[question_index]
+        # Practice answers are often resubmitted unchanged; a repeat is not
+        # scored again and does not count twice in the reference statistics
+        memo_key = None
+        if self.answer_memo is not None:
+            memo_key = (stats_role, bank_version, question_index, self.scoring_mode, self.SCORING_VERSION,
+                        answer_digest(answer))
+            cached = self.answer_memo.get(memo_key)
+            if cached is not None:
+                return cached
         
         # Basic analysis
-        score = self._calculate_score(answer, question.get('keywords', []))
-        feedback = self._generate_feedback(answer, question.get('keywords', []), score)
+        keywords = question.get('keywords', [])
+        keywords_found = self._find_keywords(job_role, question_index, answer, keywords, tenant)
+        score = self._calculate_score(answer, keywords, keywords_found)
+        feedback_parts = [self._generate_feedback(answer, keywords, score, keywords_found)]
         analysis = {
             'word_count': len(word_tokenize(answer)),
             'sentences': len(sent_tokenize(answer))
         }
         
-        return score, feedback, analysis
+        # Answer quality against earlier answers to the same question
+        if answer.strip():
+            quality = extract_quality_features(answer, keywords, keywords_found)
+            comparison = self.reference_stats.compare(stats_role, question_index, quality)
+            feedback_parts.extend(quality_note_parts(question.get('type'), quality, comparison))
+            if comparison:
+                quality['vs_reference'] = comparison
+            analysis['quality'] = quality
+            self.reference_stats.observe(stats_role, question_index, quality)
+        
+        # Template ids of the feedback, so responses can store it compactly
+        analysis['feedback_parts'] = feedback_parts
+        result = (score, render_feedback(feedback_parts), analysis)
+        if memo_key is not None:
+            self.answer_memo.set(memo_key, result)
+        return result
     
-    def _calculate_score(self, answer, expected_keywords):
+    def _calculate_score(self, answer, expected_keywords, keywords_found=None):
         if not answer.strip():
             return 0
         
-        answer_lower = answer.lower()
-        keywords_found = 0
-        
-        for keyword in expected_keywords:
-            if keyword.lower() in answer_lower:
-                keywords_found += 1
+        if keywords_found is None:
+            answer_lower = answer.lower()
+            keywords_found = [kw for kw in expected_keywords if kw.lower() in answer_lower]
+        keywords_found = len(keywords_found)
         
         # Calculate score based on keyword matches and answer length
         keyword_score = (keywords_found / len(expected_keywords)) * 6 if expected_keywords else 0
@@ -97,19 +209,22 @@ class AIInterviewer:
         total_score = min(10, keyword_score + length_score)
         return round(total_score, 1)
     
-    def _generate_feedback(self, answer, expected_keywords, score):
+    def _generate_feedback(self, answer, expected_keywords, score, keywords_found=None):
+        """Feedback template id for the answer (see models.response_log)."""
         if score >= 8:
-            return "Excellent answer! You covered the key points clearly and thoroughly."
+            return response_log.EXCELLENT
         elif score >= 6:
-            return "Good answer. You mentioned some relevant points but could add more detail."
+            return response_log.GOOD
         elif score >= 4:
-            return "Average answer. Consider providing more specific examples and details."
+            return response_log.AVERAGE
         else:
-            missing_keywords = [kw for kw in expected_keywords if kw.lower() not in answer.lower()]
+            if keywords_found is None:
+                keywords_found = [kw for kw in expected_keywords if kw.lower() in answer.lower()]
+            missing_keywords = [kw for kw in expected_keywords if kw not in keywords_found]
             if missing_keywords:
-                return f"Try to include concepts like: {', '.join(missing_keywords[:3])}"
+                return feedback_part(response_log.MISSING_KEYWORDS, ', '.join(missing_keywords[:3]))
             else:
-                return "Please provide a more detailed and structured answer."
+                return response_log.NEEDS_DETAIL
     
     def generate_overall_feedback(self, responses, resume_analysis):
         if not responses:
@@ -0,0 +1,58 @@
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def answer_digest(answer):
+    """Hash of the answer with runs of whitespace collapsed.
+
+    Case and punctuation are kept: sentence splitting and keyword matching
+    can depend on them, so only answers that score identically share a key.
+    """
+    normalized = ' '.join(answer.split())
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class AnswerMemo:
+    """Bounded LRU of answer analyses, for practice answers submitted again and again.
+
+    Keys include the question bank version and the scoring version, so a
+    reloaded bank or changed scoring never hits old entries; they fall out
+    of the LRU. Results are copied in and out because callers mutate the
+    analysis dict.
+    """
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(result)
+
+    def set(self, key, result):
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
@@ -0,0 +1,264 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from models.event_log import position_is_valid, read_events_since
+from models import response_log
+from models.response_log import feedback_part
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?|[.!?]+")
+
+FILLERS = {'um', 'umm', 'uh', 'er', 'ah', 'hmm', 'basically', 'literally', 'actually', 'honestly'}
+FILLER_PHRASES = {('you', 'know'), ('i', 'mean'), ('kind', 'of'), ('sort', 'of')}
+
+# Cue words for each part of a STAR (situation, task, action, result) answer
+STAR_CUES = {
+    'situation': {'when', 'while', 'situation', 'context', 'background', 'project', 'team', 'company'},
+    'task': {'task', 'goal', 'responsible', 'responsibility', 'needed', 'objective', 'assigned', 'challenge'},
+    'action': {'implemented', 'built', 'designed', 'decided', 'led', 'created', 'wrote', 'analyzed',
+               'refactored', 'organized', 'introduced', 'developed', 'proposed'},
+    'result': {'result', 'resulted', 'outcome', 'improved', 'reduced', 'increased', 'saved', 'learned',
+               'finally', 'achieved', 'delivered', 'percent'},
+}
+STAR_PHRASES = {('as', 'a'): 'result', ('which', 'led'): 'result', ('my', 'role'): 'task', ('i', 'was'): 'situation'}
+STAR_STAGES = list(STAR_CUES)
+CUE_STAGES = {cue: stage for stage, cues in STAR_CUES.items() for cue in cues}
+
+FEATURES = ['word_count', 'lexical_diversity', 'avg_sentence_length', 'filler_rate', 'star_coverage',
+            'keyword_coverage']
+
+
+def extract_quality_features(answer, expected_keywords=(), keywords_found=()):
+    """Answer-quality features from a single pass over the answer's tokens."""
+    words = 0
+    sentences = 0
+    pending_sentence = False
+    fillers = 0
+    vocabulary = set()
+    stages = set()
+    previous = None
+
+    for match in TOKEN_PATTERN.finditer(answer.lower()):
+        token = match.group(0)
+        if token[0] in '.!?':
+            if pending_sentence:
+                sentences += 1
+                pending_sentence = False
+            previous = None
+            continue
+
+        words += 1
+        pending_sentence = True
+        vocabulary.add(token)
+        if token in FILLERS:
+            fillers += 1
+        stage = CUE_STAGES.get(token)
+        if stage:
+            stages.add(stage)
+        if previous is not None:
+            pair = (previous, token)
+            if pair in FILLER_PHRASES:
+                fillers += 1
+            if pair in STAR_PHRASES:
+                stages.add(STAR_PHRASES[pair])
+        previous = token
+
+    if pending_sentence:
+        sentences += 1
+
+    return {
+        'word_count': words,
+        'lexical_diversity': round(len(vocabulary) / words, 3) if words else 0.0,
+        'avg_sentence_length': round(words / sentences, 1) if sentences else 0.0,
+        'filler_rate': round(fillers / words, 3) if words else 0.0,
+        'star_coverage': round(len(stages) / len(STAR_STAGES), 2),
+        'star': [stage for stage in STAR_STAGES if stage in stages],
+        'keyword_coverage': round(len(keywords_found) / len(expected_keywords), 2) if expected_keywords else 0.0,
+    }
+
+
+class ReferenceStats:
+    """Running mean and variance of every quality feature per (job role, question).
+
+    Seeded from sample responses and past answers, then updated with each
+    new answer, so comparing an answer costs a dictionary lookup.
+    """
+
+    MIN_SAMPLES = 5
+
+    def __init__(self):
+        self._stats = {}  # (job_role, question_index) -> [count, means, m2s]
+        self._lock = threading.Lock()
+
+    def observe(self, job_role, question_index, features):
+        key = (job_role, question_index)
+        with self._lock:
+            count, means, m2s = self._stats.setdefault(key, [0, [0.0] * len(FEATURES), [0.0] * len(FEATURES)])
+            count += 1
+            for i, name in enumerate(FEATURES):
+                # Welford's update keeps the variance exact without storing samples
+                delta = features[name] - means[i]
+                means[i] += delta / count
+                m2s[i] += delta * (features[name] - means[i])
+            self._stats[key][0] = count
+
+    def compare(self, job_role, question_index, features):
+        """Standard score of each feature against past answers, or None with too few samples."""
+        with self._lock:
+            stats = self._stats.get((job_role, question_index))
+            if not stats or stats[0] < self.MIN_SAMPLES:
+                return None
+            count, means, m2s = stats
+            comparison = {}
+            for i, name in enumerate(FEATURES):
+                std = math.sqrt(m2s[i] / (count - 1))
+                comparison[name] = round((features[name] - means[i]) / std, 2) if std else 0.0
+            return comparison
+
+    def sample_count(self, job_role, question_index):
+        stats = self._stats.get((job_role, question_index))
+        return stats[0] if stats else 0
+
+    def merge(self, other):
+        """Fold another set of statistics into this one (Chan et al.'s parallel update)."""
+        with self._lock:
+            for key, (count_b, means_b, m2s_b) in other._stats.items():
+                if not count_b:
+                    continue
+                count_a, means_a, m2s_a = self._stats.setdefault(key, [0, [0.0] * len(FEATURES),
+                                                                        [0.0] * len(FEATURES)])
+                count = count_a + count_b
+                for i in range(len(FEATURES)):
+                    delta = means_b[i] - means_a[i]
+                    means_a[i] += delta * count_b / count
+                    m2s_a[i] += m2s_b[i] + delta * delta * count_a * count_b / count
+                self._stats[key][0] = count
+
+    def to_dict(self):
+        with self._lock:
+            return [[job_role, question_index, count, means, m2s]
+                    for (job_role, question_index), (count, means, m2s) in self._stats.items()]
+
+    @classmethod
+    def from_dict(cls, rows):
+        stats = cls()
+        for job_role, question_index, count, means, m2s in rows:
+            if len(means) == len(m2s) == len(FEATURES):
+                stats._stats[(job_role, question_index)] = [count, list(means), list(m2s)]
+        return stats
+
+
+def read_sample_answers(path):
+    """(job_role, question_index, answer) from a JSON list of sample responses.
+
+    Malformed entries are skipped with a warning.
+    """
+    try:
+        with open(path, 'r') as f:
+            samples = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return
+    if not isinstance(samples, list):
+        print(f"Warning: {path} is not a list of sample responses")
+        return
+    skipped = 0
+    for sample in samples:
+        if not isinstance(sample, dict):
+            skipped += 1
+            continue
+        job_role = sample.get('job_role', 'software_engineer')
+        question_index = sample.get('question_index')
+        answer = sample.get('answer')
+        if (not isinstance(job_role, str) or not isinstance(answer, str)
+                or not isinstance(question_index, int) or isinstance(question_index, bool)):
+            skipped += 1
+            continue
+        yield job_role, question_index, answer
+    if skipped:
+        print(f"Warning: skipped {skipped} malformed sample responses in {path}")
+
+
+LOGGED_STATS_FILE = 'reference_stats.json'
+OPEN_INTERVIEW_TTL = 7 * 24 * 3600  # forget the role of an interview with no finish event after this
+
+
+def update_logged_stats(folder, version, features_for):
+    """Reference statistics of every answer in the interview event log.
+
+    The statistics are saved to a snapshot in the log folder together with
+    the log position they cover, so each start only replays the answers
+    logged since. ``version`` identifies the scoring setup; a snapshot
+    from another version is discarded. ``features_for(job_role,
+    question_index, answer)`` returns the answer's quality features, or
+    None to leave it out. Answers to tenant question banks are skipped;
+    their statistics build up as the tenant's interviews come in.
+    """
+    path = os.path.join(folder, LOGGED_STATS_FILE)
+    stats, position, roles = ReferenceStats(), None, {}
+    try:
+        with open(path, 'r') as f:
+            snapshot = json.load(f)
+        if snapshot['version'] == version:
+            stats = ReferenceStats.from_dict(snapshot['stats'])
+            position, roles = snapshot['position'], snapshot['roles']
+    except FileNotFoundError:
+        pass
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Warning: ignoring unreadable reference stats snapshot {path}: {e}")
+
+    if position is not None and not position_is_valid(folder, position):
+        # Compaction moved the lines the snapshot covers: replay the whole log
+        stats, position, roles = ReferenceStats(), None, {}
+
+    replayed = 0
+    last_position = position
+    for event, event_position in read_events_since(folder, position, {'start', 'answer', 'finish'}):
+        replayed += 1
+        last_position = event_position
+        interview_id = event.get('interview_id')
+        if event['type'] == 'start':
+            job_role = None if event.get('tenant') else event.get('job_role') or 'software_engineer'
+            roles[interview_id] = [job_role, event.get('ts', time.time())]
+        elif event['type'] == 'finish':
+            roles.pop(interview_id, None)
+        else:
+            job_role = roles.get(interview_id, ['software_engineer'])[0]
+            answer = event.get('answer')
+            if job_role and isinstance(answer, str) and isinstance(event.get('question_index'), int):
+                features = features_for(job_role, event['question_index'], answer)
+                if features is not None:
+                    stats.observe(job_role, event['question_index'], features)
+
+    if replayed:
+        cutoff = time.time() - OPEN_INTERVIEW_TTL
+        roles = {k: v for k, v in roles.items() if v[1] >= cutoff}
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': version, 'position': last_position, 'roles': roles,
+                           'stats': stats.to_dict()}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not save reference stats snapshot {path}: {e}")
+    return stats
+
+
+def quality_note_parts(question_type, features, comparison):
+    """Coaching notes for the interviewer feedback, as response_log template parts."""
+    notes = []
+    if features['filler_rate'] > 0.05 or (comparison and comparison['filler_rate'] > 1.5):
+        notes.append(response_log.NOTE_FILLERS)
+    if question_type == 'behavioral' and features['star_coverage'] < 0.75:
+        if features['star']:
+            missing = [stage for stage in STAR_STAGES if stage not in features['star']]
+            notes.append(feedback_part(response_log.NOTE_STAR_MISSING, ' and '.join(missing)))
+        else:
+            notes.append(response_log.NOTE_STAR_STRUCTURE)
+    if features['word_count'] >= 30 and features['lexical_diversity'] < 0.4:
+        notes.append(response_log.NOTE_REPETITIVE)
+    if comparison and comparison['word_count'] < -1.5:
+        notes.append(response_log.NOTE_SHORT)
+    return notes
+
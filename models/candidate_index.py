@@ -0,0 +1,295 @@
+import json
+import os
+import threading
+import numpy as np
+from models.resume_scoring import ResumeFeatureExtractor
+from utils.file_lock import FileLock
+
+
+class CandidateIndex:
+    """Memory-mapped skill matrix of every analyzed resume for top-K retrieval.
+
+    Each row is a 0/1 vector over the flattened ``skill_categories``
+    vocabulary plus the resume's scoring features and scores. Rows are appended in place and the
+    files grow by doubling, so new resumes never rewrite the whole index.
+    Writers in every worker take a shared file lock and re-map the files
+    another worker grew. The analysis behind each row is kept in
+    analyses.jsonl, so a changed vocabulary or feature list re-vectorizes
+    the stored candidates instead of dropping them.
+    """
+
+    SCORE_FIELDS = ['skills_score', 'experience_score', 'education_score', 'overall_score']
+    # The parts of an analysis the rows are built from
+    STORED_FIELDS = ('skills', 'experience', 'education', 'word_count', 'scores')
+
+    def __init__(self, skill_categories, folder='data/candidates', initial_capacity=1024, feature_extractor=None):
+        self.folder = folder
+        os.makedirs(self.folder, exist_ok=True)
+        self.vocabulary = [skill for skills in skill_categories.values() for skill in skills]
+        self.columns = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.initial_capacity = initial_capacity
+        self.feature_extractor = feature_extractor or ResumeFeatureExtractor(skill_categories)
+
+        self.meta_file = os.path.join(self.folder, 'meta.json')
+        self.ids_file = os.path.join(self.folder, 'candidates.txt')
+        self.analyses_file = os.path.join(self.folder, 'analyses.jsonl')
+        self.skills_file = os.path.join(self.folder, 'skills.u8')
+        self.scores_file = os.path.join(self.folder, 'scores.f32')
+        self.features_file = os.path.join(self.folder, 'features.f32')
+
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(os.path.join(self.folder, '.lock'))
+        self._meta_stamp = None
+        with self._lock, self._file_lock:
+            self._load()
+
+    def _read_meta(self):
+        try:
+            with open(self.meta_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _load(self):
+        """Open the index files; call with the file lock held"""
+        meta = self._read_meta()
+        if meta is None:
+            if self._load_analyses():
+                print("Warning: candidate index metadata missing, rebuilding it from stored analyses.")
+                self._rebuild(None)
+            else:
+                self.count = 0
+                self.capacity = self.initial_capacity
+                self.ids = []
+                open(self.ids_file, 'w').close()
+                open(self.analyses_file, 'w').close()
+                self._allocate(self.capacity)
+                self._save_meta()
+        elif (meta.get('vocabulary') != self.vocabulary or
+              meta.get('features') != self.feature_extractor.feature_names):
+            print("Warning: skill vocabulary or features changed, re-vectorizing the candidate index.")
+            self._rebuild(meta)
+        else:
+            self.count = meta['count']
+            self.capacity = meta['capacity']
+            self.ids = self._load_ids()[:self.count]
+            self._open_maps()
+
+        self.positions = {candidate_id: i for i, candidate_id in enumerate(self.ids)}
+        self._meta_stamp = self._stamp()
+
+    def _load_ids(self):
+        try:
+            with open(self.ids_file, 'r') as f:
+                return [line.rstrip('\n') for line in f]
+        except FileNotFoundError:
+            return []
+
+    def _load_analyses(self):
+        """Latest stored analysis of every candidate, by id"""
+        analyses = {}
+        try:
+            with open(self.analyses_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line
+                    analyses[record['id']] = record['analysis']
+        except FileNotFoundError:
+            pass
+        return analyses
+
+    def _rebuild(self, meta):
+        """Rebuild every row for the current vocabulary and features.
+
+        Rows come from their stored analyses; rows of an index written
+        before analyses were stored are migrated column by column by skill
+        and feature name, with new columns left at zero.
+        """
+        analyses = self._load_analyses()
+        old = {}
+        if meta:
+            ids = self._load_ids()[:meta['count']]
+            old_widths = {
+                'skill_matrix': meta['vocabulary'],
+                'score_matrix': self.SCORE_FIELDS,
+                'feature_matrix': meta['features'],
+            }
+            for path, _, _, attribute in self._matrices():
+                try:
+                    matrix = np.load(path, mmap_mode='r')
+                except (FileNotFoundError, ValueError):
+                    continue
+                if matrix.shape[1] == len(old_widths[attribute]):
+                    old[attribute] = (np.array(matrix[:len(ids)]), old_widths[attribute])
+                del matrix
+        else:
+            ids = list(analyses)
+
+        self.ids = ids
+        self.count = len(ids)
+        self.capacity = max(self.initial_capacity, 1 << max(self.count - 1, 0).bit_length())
+        self._allocate(self.capacity)
+        new_names = {
+            'skill_matrix': self.vocabulary,
+            'score_matrix': self.SCORE_FIELDS,
+            'feature_matrix': self.feature_extractor.feature_names,
+        }
+        for row, candidate_id in enumerate(ids):
+            if candidate_id in analyses:
+                self._write_row(row, analyses[candidate_id])
+        # Scores may have been recomputed by rescore() since they were stored, so they always carry over
+        migrate = np.array([candidate_id not in analyses for candidate_id in ids], dtype=bool)
+        for attribute, (matrix, names) in old.items():
+            rows = slice(None) if attribute == 'score_matrix' else migrate
+            columns = new_names[attribute]
+            target = getattr(self, attribute)
+            for i, name in enumerate(names):
+                if name in columns:
+                    target[:self.count, columns.index(name)][rows] = matrix[rows, i]
+
+        with open(self.ids_file, 'w') as f:
+            f.writelines(candidate_id + '\n' for candidate_id in ids)
+        self._flush()
+        self._save_meta()
+
+    def _matrices(self):
+        """(path, dtype, width, attribute) for every memory-mapped matrix"""
+        return [
+            (self.skills_file, np.uint8, len(self.vocabulary), 'skill_matrix'),
+            (self.scores_file, np.float32, len(self.SCORE_FIELDS), 'score_matrix'),
+            (self.features_file, np.float32, self.feature_extractor.width, 'feature_matrix'),
+        ]
+
+    def _allocate(self, capacity, grow=False):
+        # Other workers re-map after seeing the new meta.json; they only write
+        # under the file lock, so nothing is written to the replaced files
+        for path, dtype, width, attribute in self._matrices():
+            matrix = np.lib.format.open_memmap(path + '.tmp', mode='w+', dtype=dtype, shape=(capacity, width))
+            if grow:
+                matrix[:self.count] = getattr(self, attribute)[:self.count]
+            matrix.flush()
+            del matrix
+            os.replace(path + '.tmp', path)
+        self._open_maps()
+
+    def _open_maps(self):
+        for path, _, _, attribute in self._matrices():
+            setattr(self, attribute, np.load(path, mmap_mode='r+'))
+
+    def _flush(self):
+        for _, _, _, attribute in self._matrices():
+            getattr(self, attribute).flush()
+
+    def _save_meta(self):
+        tmp = self.meta_file + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({
+                'vocabulary': self.vocabulary,
+                'features': self.feature_extractor.feature_names,
+                'count': self.count,
+                'capacity': self.capacity
+            }, f)
+        os.replace(tmp, self.meta_file)
+        self._meta_stamp = self._stamp()
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.meta_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self):
+        # Another worker may have appended or grown the index since we opened the maps
+        if self._stamp() != self._meta_stamp:
+            self._load()
+
+    def vectorize(self, skills):
+        """0/1 vector for a ``ResumeAnalyzer`` skills dict ({category: [Title-cased skill]})."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.uint8)
+        for category_skills in skills.values():
+            for skill in category_skills:
+                column = self.columns.get(skill.lower())
+                if column is not None:
+                    vector[column] = 1
+        return vector
+
+    def _write_row(self, row, analysis):
+        self.skill_matrix[row] = self.vectorize(analysis.get('skills', {}))
+        self.score_matrix[row] = [analysis.get('scores', {}).get(field, 0) for field in self.SCORE_FIELDS]
+        self.feature_matrix[row] = self.feature_extractor.extract(analysis)
+
+    def add(self, candidate_id, analysis):
+        """Insert or update one analyzed resume."""
+        stored = {field: analysis[field] for field in self.STORED_FIELDS if field in analysis}
+        record = json.dumps({'id': candidate_id, 'analysis': stored})
+
+        with self._lock, self._file_lock:
+            self._refresh()
+            row = self.positions.get(candidate_id)
+            if row is None:
+                if self.count >= self.capacity:
+                    self.capacity *= 2
+                    self._allocate(self.capacity, grow=True)
+                row = self.count
+                with open(self.ids_file, 'a') as f:
+                    f.write(candidate_id + '\n')
+                self.ids.append(candidate_id)
+                self.positions[candidate_id] = row
+                self.count += 1
+
+            with open(self.analyses_file, 'a', encoding='utf-8') as f:
+                f.write(record + '\n')
+            self._write_row(row, stored)
+            self._flush()
+            self._save_meta()
+        return row
+
+    def rescore(self, scorer):
+        """Recompute every stored score from the stored features with one matrix multiply."""
+        with self._lock, self._file_lock:
+            self._refresh()
+            count = self.count
+            self.score_matrix[:count] = scorer.score_batch(np.asarray(self.feature_matrix[:count]))
+            self.score_matrix.flush()
+            self._save_meta()
+        return count
+
+    def top_k(self, skills, k=50, score_weight=0.2):
+        """Best candidates for a set of required skills (e.g. a parsed job description).
+
+        Ranking is the fraction of required skills a resume covers, blended
+        with its overall score by ``score_weight``.
+        """
+        with self._lock:
+            if self._stamp() != self._meta_stamp:
+                with self._file_lock:
+                    self._refresh()
+            count = self.count
+            matrix = self.skill_matrix[:count]
+            overall = self.score_matrix[:count, self.SCORE_FIELDS.index('overall_score')]
+
+            query = self.vectorize(skills).astype(np.float32)
+            required = query.sum()
+            if count == 0:
+                return []
+
+            if required:
+                match = (matrix @ query) / required
+            else:
+                match = np.zeros(count, dtype=np.float32)
+            ranking = (1 - score_weight) * match + score_weight * (overall / 10)
+
+            k = max(1, min(k, count))
+            top = np.argpartition(-ranking, k - 1)[:k]
+            top = top[np.argsort(-ranking[top], kind='stable')]
+
+            return [{
+                'candidate': self.ids[row],
+                'rank_score': round(float(ranking[row]), 4),
+                'skill_match': round(float(match[row]), 4),
+                'matched_skills': [self.vocabulary[c] for c in np.flatnonzero(matrix[row] & (query > 0))],
+                'scores': {field: round(float(v), 2) for field, v in zip(self.SCORE_FIELDS, self.score_matrix[row])},
+            } for row in top]
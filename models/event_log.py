@@ -0,0 +1,397 @@
+import argparse
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import zlib
+from utils.file_lock import FileLock
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the newest segment is known to be open
+    fcntl = None
+
+SEGMENT_PREFIX = 'events-'
+SEGMENT_SUFFIX = '.log'
+
+
+def _segment_name(number):
+    return f'{SEGMENT_PREFIX}{number:08d}{SEGMENT_SUFFIX}'
+
+
+def list_segments(folder):
+    """Segment paths in write order."""
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return []
+    segments = sorted(n for n in names if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(folder, n) for n in segments]
+
+
+def _segment_number(path):
+    return int(os.path.basename(path)[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+
+class EventLog:
+    """Append-only interview event log with a background group-commit writer.
+
+    Requests only enqueue events; the writer thread drains the queue in
+    batches, writes each batch with one call and fsyncs at most once per
+    ``fsync_interval`` seconds. Every worker process has its own writer,
+    which holds a shared lock on the segment it appends to, so compaction
+    can tell which segments are still open.
+    """
+
+    def __init__(self, folder='data/events', queue_size=10000, fsync_interval=1.0,
+                 segment_bytes=16 * 1024 * 1024, batch_size=512):
+        self.folder = folder
+        self.fsync_interval = fsync_interval
+        self.segment_bytes = segment_bytes
+        self.batch_size = batch_size
+        self.dropped = 0
+        os.makedirs(self.folder, exist_ok=True)
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._file = None
+        self._io_lock = threading.Lock()
+        self._last_fsync = time.monotonic()
+        self._open_segment()
+
+        self._thread = threading.Thread(target=self._run, name='event-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _open_segment(self, rotate=False):
+        while True:
+            segments = list_segments(self.folder)
+            number = _segment_number(segments[-1]) if segments else 1
+            if rotate:
+                number += 1
+            path = os.path.join(self.folder, _segment_name(number))
+            f = open(path, 'ab')
+            if fcntl is None:
+                break
+            fcntl.flock(f, fcntl.LOCK_SH)
+            # Compaction may have merged the segment away before the lock was granted
+            try:
+                if os.path.samestat(os.fstat(f.fileno()), os.stat(path)):
+                    break
+            except FileNotFoundError:
+                pass
+            f.close()
+            rotate = False
+        self._file = f
+
+    def append(self, event_type, interview_id, **fields):
+        """Queue an event without blocking. Returns False if the queue is full."""
+        if self._closed:
+            return False
+        event = {'type': event_type, 'interview_id': interview_id, 'ts': time.time()}
+        event.update(fields)
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _run(self):
+        while True:
+            try:
+                event = self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                with self._io_lock:
+                    self._sync(force=False)
+                continue
+
+            batch = [event]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            events = [e for e in batch if e is not None]
+            try:
+                if events:
+                    self._write(events)
+            except Exception as e:
+                # The writer must outlive a bad batch, or every later event is lost
+                self.dropped += len(events)
+                print(f"Warning: event log writer failed: {e}")
+            finally:
+                # flush() and close() wait on the queue, so every item is marked done
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                with self._io_lock:
+                    self._sync(force=True)
+                return
+
+    def _write(self, events):
+        lines = []
+        for event in events:
+            try:
+                lines.append(json.dumps(event, separators=(',', ':')) + '\n')
+            except (TypeError, ValueError) as e:
+                self.dropped += 1
+                print(f"Warning: dropped an event log entry that is not JSON serializable: {e}")
+        if lines:
+            with self._io_lock:
+                self._write_locked(''.join(lines), len(lines))
+
+    def _write_locked(self, data, count):
+        try:
+            self._file.write(data.encode('utf-8'))
+            self._file.flush()
+            self._sync(force=False)
+            if self._file.tell() >= self.segment_bytes:
+                self._sync(force=True)
+                self._file.close()
+                self._open_segment(rotate=True)
+        except OSError as e:
+            self.dropped += count
+            print(f"Warning: event log write failed: {e}")
+
+    def _sync(self, force):
+        now = time.monotonic()
+        if force or now - self._last_fsync >= self.fsync_interval:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+
+    def flush(self):
+        """Block until everything queued so far is written and synced."""
+        self._queue.join()
+        with self._io_lock:
+            if not self._file.closed:
+                self._sync(force=True)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+
+def read_events(folder, event_types=None):
+    """Stream events from every segment in order, skipping a torn trailing line."""
+    for path in list_segments(folder):
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event_types is None or event['type'] in event_types:
+                    yield event
+
+
+def position_is_valid(folder, position):
+    """Whether a position from read_events_since still ends the same line of the log."""
+    if not position:
+        return False
+    length, checksum = position['tail']
+    try:
+        with open(os.path.join(folder, _segment_name(position['segment'])), 'rb') as f:
+            f.seek(max(0, position['offset'] - length))
+            tail = f.read(position['offset'] - f.tell())
+    except FileNotFoundError:
+        return False
+    return len(tail) == length and zlib.crc32(tail) == checksum
+
+
+def read_events_since(folder, position=None, event_types=None):
+    """Stream (event, position after it) for events logged after ``position``.
+
+    A position is ``{'segment', 'offset', 'tail'}``, where ``tail`` is a
+    checksum of the line ending at the offset, so a position that
+    compaction has moved is detected and the whole log is read instead. A
+    line still being written at the end of the newest segment is left for
+    the next call.
+    """
+    segments = list_segments(folder)
+    start, offset = None, 0
+    if position_is_valid(folder, position):
+        start, offset = os.path.join(folder, _segment_name(position['segment'])), position['offset']
+
+    if start is not None:
+        segments = segments[segments.index(start):]
+    for i, path in enumerate(segments):
+        number = _segment_number(path)
+        with open(path, 'rb') as f:
+            if path == start:
+                f.seek(offset)
+            else:
+                offset = 0
+            for line in f:
+                if not line.endswith(b'\n') and i == len(segments) - 1:
+                    break
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event_types is None or event['type'] in event_types:
+                    tail = line[-64:]
+                    yield event, {'segment': number, 'offset': offset, 'tail': [len(tail), zlib.crc32(tail)]}
+
+
+def _lock_sealed(path):
+    """The segment opened with an exclusive lock, or None while a writer still has it open."""
+    f = open(path, 'rb')
+    if fcntl is None:
+        return f
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        if os.path.samestat(os.fstat(f.fileno()), os.stat(path)):
+            return f
+    except (BlockingIOError, FileNotFoundError):
+        pass
+    f.close()
+    return None
+
+
+def compact(folder, segment_bytes=16 * 1024 * 1024):
+    """Merge sealed segments into as few segments as possible, dropping corrupt lines.
+
+    The newest segment, and any segment another worker's writer still has
+    open, is left alone; only runs of consecutive sealed segments are
+    merged, so events stay in order. Returns the number of segments removed.
+    """
+    with FileLock(os.path.join(folder, '.compact.lock')):
+        held = []
+        try:
+            runs, run = [], []
+            for path in list_segments(folder)[:-1]:
+                f = _lock_sealed(path)
+                if f is None:
+                    runs.append(run)
+                    run = []
+                    continue
+                held.append(f)
+                run.append(path)
+            runs.append(run)
+            return sum(_merge_segments(run, segment_bytes) for run in runs)
+        finally:
+            for f in held:
+                f.close()
+
+
+def _merge_segments(sealed, segment_bytes):
+    if len(sealed) < 2:
+        return 0
+
+    groups = []
+    current, size = [], 0
+    for path in sealed:
+        length = os.path.getsize(path)
+        if current and size + length > segment_bytes:
+            groups.append(current)
+            current, size = [], 0
+        current.append(path)
+        size += length
+    groups.append(current)
+
+    removed = 0
+    for group in groups:
+        if len(group) < 2:
+            continue
+        tmp_path = group[0] + '.compact'
+        with open(tmp_path, 'wb') as out:
+            for path in group:
+                with open(path, 'rb') as f:
+                    for line in f:
+                        try:
+                            json.loads(line)
+                        except ValueError:
+                            continue
+                        out.write(line if line.endswith(b'\n') else line + b'\n')
+            out.flush()
+            os.fsync(out.fileno())
+        # Keep the first segment's number so the merged file stays in order
+        os.replace(tmp_path, group[0])
+        for path in group[1:]:
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def replay_results(folder, results_store):
+    """Rebuild the columnar results store from finished interviews in the log."""
+    pending = {}
+    recorded = 0
+    for event in read_events(folder, {'start', 'score', 'finish'}):
+        interview_id = event['interview_id']
+        if event['type'] == 'start':
+            pending[interview_id] = {'job_role': event.get('job_role'), 'tenant': event.get('tenant'),
+                                     'responses': []}
+        elif event['type'] == 'score':
+            state = pending.setdefault(interview_id, {'job_role': None, 'tenant': None, 'responses': []})
+            state['responses'].append({'question_index': event['question_index'], 'score': event['score']})
+        else:
+            state = pending.pop(interview_id, None)
+            if state is None:
+                continue
+            job_role = event.get('job_role') or state['job_role']
+            if results_store.record_interview(interview_id, job_role, state['responses'], tenant=state['tenant']):
+                recorded += 1
+    return recorded
+
+
+def rescore(folder, ai_interviewer):
+    """Re-run answer scoring over every logged answer and yield (event, new score, old score)."""
+    roles = {}
+    scores = {}
+    for event in read_events(folder, {'start', 'answer', 'score'}):
+        key = (event['interview_id'], event.get('question_index'))
+        if event['type'] == 'start':
+            roles[event['interview_id']] = (event.get('job_role', 'software_engineer'), event.get('tenant'))
+        elif event['type'] == 'score':
+            scores[key] = event['score']
+        else:
+            job_role, tenant = roles.get(event['interview_id'], ('software_engineer', None))
+            score, _, _ = ai_interviewer.analyze_answer(job_role, event['question_index'], event['answer'],
+                                                        tenant=tenant)
+            yield event, score, scores.get(key)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Interview event log tools')
+    parser.add_argument('command', choices=['compact', 'replay', 'rescore', 'cat'])
+    parser.add_argument('--folder', default=None)
+    args = parser.parse_args(argv)
+
+    from config import Config
+    folder = args.folder or Config.EVENT_LOG_FOLDER
+
+    if args.command == 'compact':
+        removed = compact(folder, Config.EVENT_LOG_SEGMENT_BYTES)
+        print(f"Compacted event log: {removed} segments merged")
+    elif args.command == 'replay':
+        from models.results_store import ResultsStore
+        recorded = replay_results(folder, ResultsStore(Config.RESULTS_FOLDER))
+        print(f"Replayed {recorded} finished interviews into the results store")
+    elif args.command == 'rescore':
+        from models.ai_interviewer import AIInterviewer
+        changed = total = 0
+        for event, score, old_score in rescore(folder, AIInterviewer()):
+            total += 1
+            if score != old_score:
+                changed += 1
+                print(f"{event['interview_id']} q{event['question_index']}: {old_score} -> {score}")
+        print(f"Rescored {total} answers, {changed} changed")
+    else:
+        for event in read_events(folder):
+            print(json.dumps(event))
+
+
+if __name__ == '__main__':
+    main()
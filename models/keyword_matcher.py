@@ -0,0 +1,95 @@
+import json
+import os
+import pickle
+import re
+from functools import lru_cache
+from nltk.stem import PorterStemmer
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+_stemmer = PorterStemmer()
+
+
+@lru_cache(maxsize=65536)
+def stem(word):
+    return _stemmer.stem(word)
+
+
+def stem_phrase(phrase):
+    return tuple(stem(token) for token in TOKEN_PATTERN.findall(phrase.lower()))
+
+
+class SynonymTable:
+    """Keyword -> stemmed expansion phrases, compiled once and cached as a pickle.
+
+    Workers load the pickle when it is newer than the JSON source instead
+    of re-stemming every synonym on startup.
+    """
+
+    def __init__(self, source_file='data/questions/synonyms.json', cache_file=None):
+        self.source_file = source_file
+        self.cache_file = cache_file or os.path.splitext(source_file)[0] + '.pickle'
+        self.expansions = self._load()
+
+    def _load(self):
+        try:
+            source_mtime = os.path.getmtime(self.source_file)
+        except FileNotFoundError:
+            print(f"Warning: Synonym file {self.source_file} not found. Using exact keywords only.")
+            return {}
+
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('source_mtime') == source_mtime:
+                return cached['expansions']
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+            pass
+
+        with open(self.source_file, 'r') as f:
+            synonyms = json.load(f)
+        expansions = {}
+        for keyword, alternatives in synonyms.items():
+            phrases = {stem_phrase(keyword)}
+            phrases.update(stem_phrase(alternative) for alternative in alternatives)
+            expansions[keyword.lower()] = sorted(p for p in phrases if p)
+
+        # Written aside and renamed, so other workers never read a half-written cache
+        tmp = f'{self.cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump({'source_mtime': source_mtime, 'expansions': expansions}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            print(f"Warning: could not write synonym cache: {e}")
+        return expansions
+
+    def expand(self, keyword):
+        return self.expansions.get(keyword.lower(), [stem_phrase(keyword)])
+
+
+class KeywordMatcher:
+    """Compiled matcher for one question's keywords and their expansions.
+
+    Phrases are indexed by their first stem, so matching an answer is a
+    single pass over its tokens.
+    """
+
+    def __init__(self, keywords, synonym_table):
+        self.keywords = list(keywords)
+        self.phrases = {}
+        for index, keyword in enumerate(self.keywords):
+            for phrase in synonym_table.expand(keyword):
+                if phrase:
+                    self.phrases.setdefault(phrase[0], []).append((phrase, index))
+
+    def match(self, answer):
+        """Indexes of the keywords covered by the answer."""
+        stems = [stem(token) for token in TOKEN_PATTERN.findall(answer.lower())]
+        found = set()
+        for i, token in enumerate(stems):
+            for phrase, index in self.phrases.get(token, ()):
+                if index not in found and tuple(stems[i:i + len(phrase)]) == phrase:
+                    found.add(index)
+        return found
@@ -0,0 +1,202 @@
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+
+TENANT_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]{0,63}$')
+
+MAGIC = b'QBNK'
+VERSION = 2
+HEADER = struct.Struct('<4sIIIqQ')  # magic, version, role count, question count, source mtime (ns), source size
+ROLE = struct.Struct('<IIII')  # name offset, name length, first question, question count
+QUESTION = struct.Struct('<II')  # offset, length of the question's UTF-8 JSON
+
+
+def source_stamp(source_file):
+    """(mtime in ns, size) of a bank's JSON, stored in its index to tell when it is stale."""
+    st = os.stat(source_file)
+    return st.st_mtime_ns, st.st_size
+
+
+def compile_question_bank(source_file, index_file):
+    """Compile a {role: [question, ...]} JSON file into a read-only binary index.
+
+    Layout: header, role table, question table, then a blob holding role
+    names and one JSON document per question. Written to a temporary file
+    and renamed, so workers compiling the same tenant at once never see a
+    partial index.
+    """
+    with open(source_file, 'r') as f:
+        st = os.fstat(f.fileno())
+        roles = json.load(f)
+
+    blob = bytearray()
+    role_entries = []
+    question_entries = []
+    for role, questions in roles.items():
+        name = role.encode('utf-8')
+        role_entries.append((len(blob), len(name), len(question_entries), len(questions)))
+        blob += name
+        for question in questions:
+            data = json.dumps(question, separators=(',', ':')).encode('utf-8')
+            question_entries.append((len(blob), len(data)))
+            blob += data
+
+    # Offsets in the tables are relative to the start of the blob
+    tmp = f'{index_file}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(role_entries), len(question_entries), st.st_mtime_ns, st.st_size))
+        for entry in role_entries:
+            f.write(ROLE.pack(*entry))
+        for entry in question_entries:
+            f.write(QUESTION.pack(*entry))
+        f.write(blob)
+    os.replace(tmp, index_file)
+
+
+class QuestionBank:
+    """One tenant's compiled question bank, memory-mapped read-only.
+
+    Every worker maps the same file, so the pages are shared through the
+    OS page cache. Questions are decoded from the map when requested.
+    """
+
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self.matchers = {}  # (role, question index) -> KeywordMatcher, built by the interviewer on use
+        with open(index_file, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < HEADER.size or self._map[:4] != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a question bank index: {index_file}")
+        magic, version, role_count, self.question_count, mtime_ns, size = HEADER.unpack_from(self._map, 0)
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(f"Question bank index {index_file} has version {version}, expected {VERSION}")
+        self.source_stamp = (mtime_ns, size)
+
+        self._questions_at = HEADER.size + role_count * ROLE.size
+        self._blob_at = self._questions_at + self.question_count * QUESTION.size
+        self._roles = {}
+        for i in range(role_count):
+            name_offset, name_length, first, count = ROLE.unpack_from(self._map, HEADER.size + i * ROLE.size)
+            start = self._blob_at + name_offset
+            self._roles[self._map[start:start + name_length].decode('utf-8')] = (first, count)
+
+    def roles(self):
+        return list(self._roles)
+
+    def has_role(self, job_role):
+        return job_role in self._roles
+
+    def _question(self, number):
+        offset, length = QUESTION.unpack_from(self._map, self._questions_at + number * QUESTION.size)
+        start = self._blob_at + offset
+        return json.loads(self._map[start:start + length])
+
+    def default_role(self, job_role):
+        """The role to ask questions for: ``job_role`` if the bank has it, else a fallback or None."""
+        if job_role in self._roles:
+            return job_role
+        if 'software_engineer' in self._roles:
+            return 'software_engineer'
+        return next(iter(self._roles), None)
+
+    def get_questions(self, job_role):
+        first, count = self._roles[job_role]
+        return [self._question(first + i) for i in range(count)]
+
+    def get_question(self, job_role, question_index):
+        first, count = self._roles[job_role]
+        if not 0 <= question_index < count:
+            return None
+        return self._question(first + question_index)
+
+    def close(self):
+        self._map.close()
+
+
+class QuestionBankRegistry:
+    """Per-tenant question banks under ``folder/<tenant>/interview_questions.json``.
+
+    Banks are compiled on first use (and again when the JSON changes), then
+    mapped lazily. Only ``max_loaded`` tenants stay mapped per worker; the
+    least recently used one is dropped when another is needed and unmapped
+    once no request is still reading it.
+    """
+
+    SOURCE_NAME = 'interview_questions.json'
+    INDEX_NAME = 'interview_questions.qbank'
+
+    def __init__(self, folder='data/tenants', max_loaded=64):
+        self.folder = folder
+        self.max_loaded = max_loaded
+        self._loaded = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+        self.on_load = None  # called with (tenant, bank) whenever a bank is mapped
+
+    def _paths(self, tenant):
+        if not tenant or not TENANT_PATTERN.match(tenant):
+            raise KeyError(tenant)
+        tenant_folder = os.path.join(self.folder, tenant)
+        return os.path.join(tenant_folder, self.SOURCE_NAME), os.path.join(tenant_folder, self.INDEX_NAME)
+
+    def has(self, tenant):
+        try:
+            return os.path.exists(self._paths(tenant)[0])
+        except KeyError:
+            return False
+
+    def tenants(self):
+        try:
+            return sorted(name for name in os.listdir(self.folder) if self.has(name))
+        except FileNotFoundError:
+            return []
+
+    def get(self, tenant):
+        """The tenant's bank; raises KeyError for an unknown tenant."""
+        source_file, index_file = self._paths(tenant)
+        try:
+            stamp = source_stamp(source_file)
+        except FileNotFoundError:
+            raise KeyError(tenant)
+
+        with self._lock:
+            bank = self._loaded.get(tenant)
+            if bank is not None and bank.source_stamp == stamp:
+                self._loaded.move_to_end(tenant)
+                return bank
+
+            # Another worker may already have compiled this version. The stamp
+            # is compared for equality, so a JSON copied in with an older
+            # mtime is recompiled too.
+            bank = self._open_index(index_file)
+            if bank is None or bank.source_stamp != stamp:
+                compile_question_bank(source_file, index_file)
+                bank = QuestionBank(index_file)
+            self._loaded[tenant] = bank
+            self._loaded.move_to_end(tenant)
+            self.loads += 1
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+                self.evictions += 1
+        if self.on_load:
+            self.on_load(tenant, bank)
+        return bank
+
+    @staticmethod
+    def _open_index(index_file):
+        try:
+            return QuestionBank(index_file)
+        except (FileNotFoundError, ValueError, struct.error):
+            return None
+
+    def stats(self):
+        with self._lock:
+            return {'loaded': list(self._loaded), 'loads': self.loads, 'evictions': self.evictions}
@@ -0,0 +1,120 @@
+FEEDBACK_TEMPLATES = (
+    # Answer feedback by score band
+    "Excellent answer! You covered the key points clearly and thoroughly.",
+    "Good answer. You mentioned some relevant points but could add more detail.",
+    "Average answer. Consider providing more specific examples and details.",
+    "Try to include concepts like: {}",
+    "Please provide a more detailed and structured answer.",
+    "Invalid question index",
+    # Answer quality notes
+    "Try to cut down on filler words.",
+    "Make the {} of your story clearer.",
+    "Structure the story as situation, task, action and result.",
+    "The answer repeats itself; vary your wording.",
+    "The answer is much shorter than typical answers to this question.",
+)
+
+(EXCELLENT, GOOD, AVERAGE, MISSING_KEYWORDS, NEEDS_DETAIL, INVALID_QUESTION,
+ NOTE_FILLERS, NOTE_STAR_MISSING, NOTE_STAR_STRUCTURE, NOTE_REPETITIVE, NOTE_SHORT) = range(len(FEEDBACK_TEMPLATES))
+
+# Interviewer wording around the feedback, by score band
+PERSONA = (
+    (8, "Excellent! {} That was a well-structured response."),
+    (6, "Good job. {} You're on the right track."),
+    (4, "Okay. {} Let's work on improving this."),
+    (None, "I see. {} We'll practice more on this area."),
+)
+
+
+def feedback_part(template_id, arg=None):
+    """A template id, or ``[id, arg]`` for templates with a placeholder."""
+    return template_id if arg is None else [template_id, arg]
+
+
+def render_part(part):
+    if isinstance(part, int):
+        return FEEDBACK_TEMPLATES[part]
+    template_id, arg = part
+    return FEEDBACK_TEMPLATES[template_id].format(arg)
+
+
+def render_feedback(parts):
+    """Feedback text from its parts: the answer feedback followed by any notes."""
+    feedback, *notes = [render_part(part) for part in parts]
+    if notes:
+        feedback = f"{feedback.rstrip('.')}. {' '.join(notes)}"
+    return feedback
+
+
+def persona_feedback(score, feedback):
+    for threshold, template in PERSONA:
+        if threshold is None or score >= threshold:
+            return template.format(feedback)
+
+
+class ResponseRecord:
+    """One answer with its question and feedback text, built at render time."""
+
+    __slots__ = ('question_index', 'question', 'answer', 'score', 'feedback')
+
+    def __init__(self, question_index, question, answer, score, feedback):
+        self.question_index = question_index
+        self.question = question
+        self.answer = answer
+        self.score = score
+        self.feedback = feedback
+
+
+class ResponseLog:
+    """Answers of one interview as parallel columns inside the session.
+
+    Questions are stored by index and feedback as template ids, so a long
+    interview does not repeat question text, feedback sentences or a dict
+    per answer in every session cookie. ``records`` materializes the text.
+    """
+
+    COLUMNS = ('question', 'answer', 'score', 'feedback')
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def new(cls):
+        return {name: [] for name in cls.COLUMNS}
+
+    @classmethod
+    def from_session(cls, state):
+        """The interview's log, converting a list of response dicts from an older session."""
+        columns = state.get('responses')
+        if columns is None or isinstance(columns, list):
+            legacy = columns or []
+            columns = cls.new()
+            for response in legacy:
+                columns['question'].append(response['question_index'])
+                columns['answer'].append(response['answer'])
+                columns['score'].append(response['score'])
+                columns['feedback'].append(response['feedback'])
+            state['responses'] = columns
+        return cls(columns)
+
+    def __len__(self):
+        return len(self.columns['score'])
+
+    def append(self, question_index, answer, score, feedback_parts):
+        self.columns['question'].append(question_index)
+        self.columns['answer'].append(answer)
+        self.columns['score'].append(score)
+        self.columns['feedback'].append(feedback_parts)
+
+    def scored(self):
+        """``{'question_index', 'score'}`` per answer, as the results store expects."""
+        return [{'question_index': question_index, 'score': score}
+                for question_index, score in zip(self.columns['question'], self.columns['score'])]
+
+    def records(self, questions):
+        for question_index, answer, score, feedback in zip(*(self.columns[name] for name in self.COLUMNS)):
+            question = questions[question_index]['question'] if question_index < len(questions) else ''
+            # Sessions from before compact records hold the rendered feedback
+            if not isinstance(feedback, str):
+                feedback = persona_feedback(score, render_feedback(feedback))
+            yield ResponseRecord(question_index, question, answer, score, feedback)
@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+import numpy as np
+from utils.file_lock import FileLock
+
+
+class ResultsStore:
+    """Columnar on-disk store of interview answers (one raw NumPy file per column).
+
+    Every worker appends under a shared file lock, and cached columns are
+    re-read whenever the column files have grown.
+    """
+
+    COLUMNS = {
+        'interview': np.int32,
+        'role': np.int16,
+        'question': np.int32,
+        'score': np.float32,
+    }
+    PERCENTILES = [10, 25, 50, 75, 90]
+    QUESTION_STRIDE = 16.0
+
+    def __init__(self, folder='data/results'):
+        self.folder = folder
+        os.makedirs(self.folder, exist_ok=True)
+        self.roles_file = os.path.join(self.folder, 'roles.json')
+        self.interviews_file = os.path.join(self.folder, 'interviews.txt')
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(os.path.join(self.folder, '.lock'))
+        self._cache = None
+        self._cache_sizes = None
+        self.roles = self._load_roles()
+        self.interviews = self._load_interviews()
+
+    def _column_path(self, name):
+        return os.path.join(self.folder, f'{name}.bin')
+
+    def _load_roles(self):
+        try:
+            with open(self.roles_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return []
+
+    def _load_interviews(self):
+        interviews = {}
+        try:
+            with open(self.interviews_file, 'r') as f:
+                for line in f:
+                    interview_id = line.strip()
+                    if interview_id:
+                        interviews[interview_id] = len(interviews)
+        except FileNotFoundError:
+            pass
+        return interviews
+
+    @staticmethod
+    def role_key(job_role, tenant=None):
+        """Tenant roles are stored apart from default roles of the same name"""
+        return f'{tenant}/{job_role}' if tenant else job_role
+
+    def _role_index(self, role, create=False):
+        if role in self.roles:
+            return self.roles.index(role)
+        if not create:
+            return None
+        self.roles.append(role)
+        tmp = self.roles_file + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.roles, f)
+        os.replace(tmp, self.roles_file)
+        return len(self.roles) - 1
+
+    def _column_sizes(self):
+        sizes = []
+        for name in self.COLUMNS:
+            try:
+                sizes.append(os.path.getsize(self._column_path(name)))
+            except FileNotFoundError:
+                sizes.append(0)
+        return tuple(sizes)
+
+    def _truncate_torn_rows(self):
+        # A crash between writes can leave some columns longer than others, or
+        # rows of an interview that never reached interviews.txt; cut them back
+        # before appending so later rows stay aligned
+        lengths = {name: size // np.dtype(dtype).itemsize
+                   for (name, dtype), size in zip(self.COLUMNS.items(), self._column_sizes())}
+        length = min(lengths.values())
+        if length:
+            # Interview indexes are appended in order, so unlisted ones are a tail
+            interviews = np.memmap(self._column_path('interview'), dtype=self.COLUMNS['interview'],
+                                   mode='r', shape=(length,))
+            length = int(np.searchsorted(interviews, len(self.interviews)))
+            del interviews
+        for name, dtype in self.COLUMNS.items():
+            if lengths[name] > length:
+                with open(self._column_path(name), 'r+b') as f:
+                    f.truncate(length * np.dtype(dtype).itemsize)
+
+    def record_interview(self, interview_id, job_role, responses, tenant=None):
+        """Append every answer of a finished interview. Returns False if already stored."""
+        if not responses:
+            return False
+
+        with self._lock, self._file_lock:
+            # Other workers may have appended since we last looked
+            self.roles = self._load_roles()
+            self.interviews = self._load_interviews()
+            if interview_id in self.interviews:
+                return False
+
+            self._truncate_torn_rows()
+            interview_idx = len(self.interviews)
+            role_idx = self._role_index(self.role_key(job_role, tenant), create=True)
+            count = len(responses)
+            rows = {
+                'interview': np.full(count, interview_idx),
+                'role': np.full(count, role_idx),
+                'question': np.array([r['question_index'] for r in responses]),
+                'score': np.array([r['score'] for r in responses]),
+            }
+
+            for name, dtype in self.COLUMNS.items():
+                with open(self._column_path(name), 'ab') as f:
+                    rows[name].astype(dtype).tofile(f)
+
+            with open(self.interviews_file, 'a') as f:
+                f.write(interview_id + '\n')
+            self.interviews[interview_id] = interview_idx
+            return True
+
+    def _load_columns(self):
+        sizes = self._column_sizes()
+        cache = self._cache
+        if cache is not None and sizes == self._cache_sizes:
+            return cache
+
+        # Columns changed, possibly in another worker: pick up its roles and interviews too
+        with self._lock:
+            self.roles = self._load_roles()
+            self.interviews = self._load_interviews()
+
+        columns = {}
+        for name, dtype in self.COLUMNS.items():
+            path = self._column_path(name)
+            columns[name] = np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.empty(0, dtype)
+
+        # A crash between column writes can leave a torn row at the tail
+        length = min(len(col) for col in columns.values())
+        columns = {name: col[:length] for name, col in columns.items()}
+        self._cache, self._cache_sizes = columns, sizes
+        return columns
+
+    def answer_count(self):
+        return len(self._load_columns()['score'])
+
+    def cohort(self, job_role, interview_id=None, bins=10, tenant=None):
+        """Score distribution, percentiles and rank for every stored interview of a role."""
+        columns = self._load_columns()
+        role_idx = self._role_index(self.role_key(job_role, tenant))
+        if role_idx is None:
+            return {'job_role': job_role, 'candidates': 0, 'answers': 0}
+
+        mask = columns['role'] == role_idx
+        interviews = columns['interview'][mask]
+        questions = columns['question'][mask]
+        scores = columns['score'][mask].astype(np.float64)
+        if not len(scores):
+            return {'job_role': job_role, 'candidates': 0, 'answers': 0}
+
+        # Per-candidate percentage: total score over the maximum possible.
+        # Interview indexes are dense, so bincount groups them without sorting.
+        answered = np.bincount(interviews)
+        ids = np.flatnonzero(answered)
+        totals = np.bincount(interviews, weights=scores)[ids]
+        percentages = totals / (answered[ids] * 10) * 100
+
+        hist, edges = np.histogram(percentages, bins=bins, range=(0, 100))
+        result = {
+            'job_role': job_role,
+            'candidates': int(len(ids)),
+            'answers': int(len(scores)),
+            'mean_percentage': round(float(percentages.mean()), 2),
+            'percentiles': self._format_percentiles(np.percentile(percentages, self.PERCENTILES)),
+            'distribution': {
+                'counts': hist.tolist(),
+                'edges': [round(float(e), 2) for e in edges],
+            },
+            'questions': self._question_stats(questions, scores),
+        }
+
+        if interview_id is not None and interview_id in self.interviews:
+            position = np.searchsorted(ids, self.interviews[interview_id])
+            if position < len(ids) and ids[position] == self.interviews[interview_id]:
+                candidate = percentages[position]
+                result['candidate'] = {
+                    'percentage': round(float(candidate), 2),
+                    'rank': int((percentages > candidate).sum()) + 1,
+                    'percentile_rank': round(float((percentages < candidate).mean() * 100), 2),
+                }
+
+        return result
+
+    def _question_stats(self, questions, scores):
+        # Sort once by (question, score) and read every group's percentiles by index.
+        # Scores never exceed 10, so a single float key orders both at once.
+        ordered = np.sort(questions * self.QUESTION_STRIDE + scores)
+        questions = np.floor(ordered / self.QUESTION_STRIDE)
+        scores = ordered - questions * self.QUESTION_STRIDE
+        starts = np.flatnonzero(np.r_[True, questions[1:] != questions[:-1]])
+        counts = np.diff(np.r_[starts, len(scores)])
+        keys = questions[starts]
+        means = np.add.reduceat(scores, starts) / counts
+
+        q = np.array(self.PERCENTILES, dtype=np.float64) / 100
+        positions = starts[:, None] + q[None, :] * (counts[:, None] - 1)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.ceil(positions).astype(np.int64)
+        fraction = positions - lower
+        values = scores[lower] + (scores[upper] - scores[lower]) * fraction
+
+        stats = {}
+        for i, key in enumerate(keys):
+            stats[str(int(key))] = {
+                'answers': int(counts[i]),
+                'mean_score': round(float(means[i]), 2),
+                'percentiles': self._format_percentiles(values[i]),
+            }
+        return stats
+
+    def _format_percentiles(self, values):
+        return {f'p{p}': round(float(v), 2) for p, v in zip(self.PERCENTILES, values)}
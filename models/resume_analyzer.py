@@ -1,10 +1,36 @@
 import PyPDF2
-from docx import Document
+import hashlib
 import re
 import os
+from datetime import date
+from models.resume_scoring import ResumeFeatureExtractor, LinearResumeScorer
+from models.resume_sections import SectionIndex, employment_months
+from utils.docx_text import extract_docx_text
+from utils.stage_graph import StageGraph
+
+YEARS_PATTERN = re.compile(r'(\d+)\s*(?:\+)?\s*years?(?:\s+of)?\s*experience', re.IGNORECASE)
+DEGREES = ['bachelor', 'master', 'phd', 'mba', r'b\.?tech', r'm\.?tech', r'b\.?e', r'm\.?e']
+DEGREE_PATTERN = re.compile(r'\b(' + '|'.join(DEGREES) + r')\b', re.IGNORECASE)
+
+# Sections each extraction stage reads (the whole text when none of them exist)
+STAGE_SECTIONS = {
+    'skills': ('skills', 'projects', 'experience'),
+    'experience': ('summary', 'experience'),
+    'education': ('education',),
+}
+
+def _lines(text, start, end):
+    """(start, end) of each non-blank line within text[start:end]"""
+    while start < end:
+        newline = text.find('\n', start, end)
+        line_end = end if newline == -1 else newline
+        if text[start:line_end].strip():
+            yield start, line_end
+        start = line_end + 1
+
 
 class ResumeAnalyzer:
-    def __init__(self):
+    def __init__(self, weights_file=None, executor=None, stage_timeout=None):
         self.skill_categories = {
             'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin'],
             'web_tech': ['html', 'css', 'react', 'angular', 'vue', 'django', 'flask', 'node.js', 'express'],
@@ -13,6 +39,11 @@ class ResumeAnalyzer:
             'data_science': ['pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'r', 'matplotlib'],
             'soft_skills': ['communication', 'leadership', 'teamwork', 'problem-solving', 'creativity', 'adaptability']
         }
+        self.feature_extractor = ResumeFeatureExtractor(self.skill_categories)
+        self.scorer = LinearResumeScorer(self.feature_extractor.feature_names, weights_file)
+        # Shared pool for running independent analysis stages of one resume concurrently
+        self.executor = executor
+        self.stage_timeout = stage_timeout
     
     def parse_resume(self, file_path):
         filename = file_path.lower()
@@ -40,11 +71,7 @@ class ResumeAnalyzer:
     
     def _parse_docx(self, file_path):
         try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            return extract_docx_text(file_path)
         except Exception as e:
             return f"Error reading DOCX: {str(e)}"
     
@@ -53,38 +80,118 @@ class ResumeAnalyzer:
         return self.analyze_resume_text(text)
     
     def analyze_resume_text(self, text):
+        return self.analyze_revision(text)[0]
+    
+    def analyze_revision(self, text, previous=None):
+        """Analyze a resume, reusing results of an earlier revision for unchanged paragraphs.
+        
+        Skills and degrees never span a line break, so they are extracted
+        per paragraph (line of text) and merged; only new or edited
+        paragraphs are scanned. Employment date ranges can span lines, so
+        experience is re-extracted whenever its sections change.
+        ``previous`` is the stage table returned for the earlier revision.
+        Returns (analysis, stage table, {'reused': n, 'analyzed': n}) where
+        the counts are in paragraphs, plus one for the experience stage.
+        """
         analysis = {}
+        previous = previous or {}
         
         # Basic text analysis
         words = text.split()
         analysis['word_count'] = len(words)
         analysis['char_count'] = len(text)
         
-        # Extract skills
-        analysis['skills'] = self._extract_skills(text)
-        
-        # Extract experience
-        analysis['experience'] = self._extract_experience(text)
-        
-        # Extract education
-        analysis['education'] = self._extract_education(text)
+        # Split into sections once; each extractor scans only its own spans.
+        # Skills, experience and education only depend on the sections, so
+        # they run side by side when an executor is configured.
+        timeout = self.stage_timeout
+        graph = StageGraph()
+        graph.add('sections', lambda: SectionIndex.segment(text))
+        graph.add('skills', lambda sections: self._run_paragraph_stage('skills', text, sections, previous),
+                  deps=('sections',), timeout=timeout, default=lambda: (None, {}, 0, 0))
+        graph.add('experience', lambda sections: self._run_section_stage('experience', text, sections, previous),
+                  deps=('sections',), timeout=timeout, default=lambda: (None, {'years': "Not specified"}, 0, 0))
+        graph.add('education', lambda sections: self._run_paragraph_stage('education', text, sections, previous),
+                  deps=('sections',), timeout=timeout, default=lambda: (None, {'degrees': []}, 0, 0))
+        stages, timed_out = graph.run(self.executor)
+        
+        analysis['sections'] = stages['sections'].to_dict()
+        table = {}
+        counts = {'reused': 0, 'analyzed': 0}
+        for name in STAGE_SECTIONS:
+            entry, result, reused, analyzed = stages[name]
+            analysis[name] = result
+            if entry is not None:
+                table[name] = entry
+            counts['reused'] += reused
+            counts['analyzed'] += analyzed
+        if timed_out:
+            # Scored on what was extracted in time
+            analysis['incomplete'] = timed_out
         
         # Calculate scores
-        analysis['scores'] = self._calculate_scores(text, analysis['skills'])
+        analysis['scores'] = self._calculate_scores(analysis)
         
         # Generate recommendations
         analysis['recommendations'] = self._generate_recommendations(analysis)
         
-        return analysis
+        return analysis, table, counts
     
-    def _extract_skills(self, text):
+    def _run_section_stage(self, name, text, sections, previous):
+        """Experience from the sections it reads, reused if they are unchanged"""
+        digest = hashlib.blake2b(date.today().isoformat().encode(), digest_size=16)  # "- Present" moves daily
+        for start, end in sections.ranges(*STAGE_SECTIONS[name]):
+            digest.update(b'\0' + text[start:end].encode('utf-8'))
+        digest = digest.hexdigest()
+        
+        earlier = previous.get(name)
+        if earlier and earlier[0] == digest:
+            return earlier, earlier[1], 1, 0
+        result = self._extract_experience(text, sections)
+        return (digest, result), result, 0, 1
+    
+    def _run_paragraph_stage(self, name, text, sections, previous):
+        """Skills or degrees extracted per paragraph of the stage's sections, then merged"""
+        extract = self._extract_skills if name == 'skills' else self._extract_education
+        label = STAGE_SECTIONS[name][0]
+        earlier = previous.get(name) or {}
+        table = {}
+        results = []
+        reused = 0
+        for start, end in sections.ranges(*STAGE_SECTIONS[name]):
+            for line_start, line_end in _lines(text, start, end):
+                key = hashlib.blake2b(text[line_start:line_end].encode('utf-8'), digest_size=16).hexdigest()
+                result = table.get(key)
+                if result is None:
+                    result = earlier.get(key)
+                    if result is None:
+                        result = extract(text, SectionIndex(text, [(label, line_start, line_end)]))
+                    else:
+                        reused += 1
+                    table[key] = result
+                results.append(result)
+        
+        if name == 'education':
+            merged = {'degrees': list(dict.fromkeys(d for result in results for d in result['degrees']))}
+        else:
+            found = {}
+            for result in results:
+                for category, skills in result.items():
+                    found.setdefault(category, set()).update(skills)
+            merged = {category: [skill.title() for skill in skills if skill.title() in found[category]]
+                      for category, skills in self.skill_categories.items() if category in found}
+        return table, merged, reused, len(table) - reused
+    
+    def _extract_skills(self, text, sections=None):
         text_lower = text.lower()
         found_skills = {}
+        # Skills show up in the skills list, projects and job descriptions, not the header or education
+        ranges = sections.ranges('skills', 'projects', 'experience') if sections else [(0, len(text))]
         
         for category, skills in self.skill_categories.items():
             category_skills = []
             for skill in skills:
-                if skill in text_lower:
+                if any(text_lower.find(skill, start, end) != -1 for start, end in ranges):
                     category_skills.append(skill.title())
             
             if category_skills:
@@ -92,48 +199,38 @@ class ResumeAnalyzer:
         
         return found_skills
     
-    def _extract_experience(self, text):
+    def _extract_experience(self, text, sections=None):
         experience = {}
+        sections = sections or SectionIndex.segment(text)
         
-        # Extract years of experience
-        years_pattern = r'(\d+)\s*(?:\+)?\s*years?(?:\s+of)?\s*experience'
-        match = re.search(years_pattern, text, re.IGNORECASE)
-        experience['years'] = match.group(1) if match else "Not specified"
+        # Prefer employment date ranges; fall back to a stated "N years experience"
+        months, positions = employment_months(sections)
+        if positions:
+            experience['years'] = f"{months / 12:.1f}".rstrip('0').rstrip('.')
+            experience['positions'] = positions
+        else:
+            match = next(sections.finditer(YEARS_PATTERN, 'summary', 'experience'), None)
+            experience['years'] = match.group(1) if match else "Not specified"
         
         return experience
     
-    def _extract_education(self, text):
+    def _extract_education(self, text, sections=None):
         education = {}
+        sections = sections or SectionIndex.segment(text)
         
         # Extract degrees
-        degrees = ['bachelor', 'master', 'phd', 'mba', 'b\.?tech', 'm\.?tech', 'b\.?e', 'm\.?e']
-        degree_pattern = r'\b(' + '|'.join(degrees) + r')\b'
-        matches = re.findall(degree_pattern, text, re.IGNORECASE)
+        matches = [match.group(1) for match in sections.finditer(DEGREE_PATTERN, 'education')]
         education['degrees'] = list(set(matches))
         
         return education
     
-    def _calculate_scores(self, text, skills):
-        scores = {}
-        
-        # Skills score
-        total_skills = sum(len(skills_list) for skills_list in skills.values())
-        scores['skills_score'] = min(10, total_skills / 2)  # Normalize to 10
-        
-        # Experience score
-        exp_score = 0
-        if any(str(i) in text for i in range(1, 6)):
-            exp_score = min(10, 5)  # Basic score
-        scores['experience_score'] = exp_score
-        
-        # Education score
-        edu_score = min(10, len(self._extract_education(text)['degrees']) * 3)
-        scores['education_score'] = edu_score
-        
-        # Overall score
-        scores['overall_score'] = (scores['skills_score'] + scores['experience_score'] + scores['education_score']) / 3
-        
-        return scores
+    def _calculate_scores(self, analysis):
+        features = self.feature_extractor.extract(analysis)
+        return self.scorer.score(features)
+    
+    def score_analyses(self, analyses):
+        """Score many analyses at once; returns an (n, 4) array in scorer.SCORE_FIELDS order"""
+        return self.scorer.score_batch(self.feature_extractor.extract_batch(analyses))
     
     def _generate_recommendations(self, analysis):
         recommendations = []
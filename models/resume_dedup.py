@@ -0,0 +1,137 @@
+import json
+import os
+import re
+import threading
+import zlib
+import numpy as np
+from utils.file_lock import FileLock
+
+
+class ResumeDeduplicator:
+    """MinHash signatures with an LSH band index to find near-duplicate resumes.
+
+    A new upload only gets compared against resumes that share at least
+    one LSH band with it, so lookups do not scan the whole archive. Each
+    entry records the analysis version it was made with; entries from an
+    older version still count as duplicates but their analysis is not
+    reused. Entries appended by other workers are read before each lookup.
+    """
+
+    PRIME = 4294967311  # smallest prime above 2**32, so a * crc32 + b fits in uint64
+
+    def __init__(self, folder='data/dedup', num_perm=128, bands=32, shingle_size=5, threshold=0.8, seed=1,
+                 analysis_version=None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.folder = folder
+        os.makedirs(self.folder, exist_ok=True)
+        self.entries_file = os.path.join(self.folder, 'entries.jsonl')
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.analysis_version = analysis_version
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2 ** 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 2 ** 31, size=num_perm).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(os.path.join(self.folder, '.lock'))
+        self._offset = 0  # bytes of entries.jsonl already indexed
+        self.signatures = {}
+        self.analyses = {}
+        self.buckets = {}
+        with self._lock:
+            self._read_tail()
+
+    def _read_tail(self):
+        """Index entries appended since the last read, by this or another worker"""
+        try:
+            if os.path.getsize(self.entries_file) == self._offset:
+                return
+            with open(self.entries_file, 'rb') as f:
+                f.seek(self._offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # still being written; read it next time
+                    self._offset += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    signature = np.array(entry['signature'], dtype=np.uint64)
+                    self._index(entry['doc_id'], signature, entry['analysis'], entry.get('version'))
+        except FileNotFoundError:
+            pass
+
+    def _shingles(self, text):
+        tokens = re.findall(r'\w+', text.lower())
+        if len(tokens) <= self.shingle_size:
+            return {' '.join(tokens)} if tokens else set()
+        return {' '.join(tokens[i:i + self.shingle_size]) for i in range(len(tokens) - self.shingle_size + 1)}
+
+    def signature(self, text):
+        """MinHash signature of the text's word shingles, or None for empty text."""
+        shingles = self._shingles(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        permuted = (hashes[:, None] * self._a + self._b) % self.PRIME
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature):
+        bands = signature.reshape(self.bands, self.rows)
+        return [(i, band.tobytes()) for i, band in enumerate(bands)]
+
+    def _index(self, doc_id, signature, analysis, version):
+        if doc_id not in self.signatures:
+            for key in self._band_keys(signature):
+                self.buckets.setdefault(key, []).append(doc_id)
+        self.signatures[doc_id] = signature
+        # Analyses made by an older analyzer are never handed out again
+        self.analyses[doc_id] = analysis if version == self.analysis_version else None
+
+    def find_duplicates(self, signature):
+        """Previously indexed resumes at or above the similarity threshold, best first."""
+        if signature is None:
+            return []
+        with self._lock:
+            self._read_tail()
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+
+        matches = []
+        for doc_id in candidates:
+            similarity = float(np.mean(self.signatures[doc_id] == signature))
+            if similarity >= self.threshold:
+                matches.append({'resume': doc_id, 'similarity': round(similarity, 3)})
+        matches.sort(key=lambda m: m['similarity'], reverse=True)
+        return matches
+
+    def find_duplicate(self, signature):
+        """Best near-duplicate match with a current-version analysis, or None."""
+        for match in self.find_duplicates(signature):
+            analysis = self.analyses.get(match['resume'])
+            if analysis is not None:
+                match['analysis'] = analysis
+                return match
+        return None
+
+    def add(self, doc_id, signature, analysis):
+        if signature is None:
+            return
+        line = json.dumps({
+            'doc_id': doc_id,
+            'signature': signature.tolist(),
+            'version': self.analysis_version,
+            'analysis': analysis
+        }) + '\n'
+        with self._lock:
+            # One writer at a time, so lines from different workers never interleave
+            with self._file_lock, open(self.entries_file, 'a') as f:
+                f.write(line)
+            self._read_tail()
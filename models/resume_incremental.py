@@ -0,0 +1,68 @@
+import json
+import threading
+from collections import OrderedDict
+
+
+class IncrementalResumeAnalyzer:
+    """Re-analyzes a revised resume by scanning only its new or edited paragraphs.
+
+    Each analyzed resume keeps its stage table from
+    ``ResumeAnalyzer.analyze_revision``: skills and degrees per paragraph
+    (line of text), and the experience result with a digest of the
+    sections it reads. A new upload from the same candidate reuses the
+    previous table, so skills and degrees cost is proportional to the
+    paragraphs that changed; experience is re-extracted from whole sections
+    when they change, since date ranges can span lines. Tables live in a
+    per-worker LRU capped by their total size in bytes; a resume with no
+    table is analyzed in full.
+    """
+
+    def __init__(self, analyzer, max_bytes=4 * 1024 * 1024):
+        self.analyzer = analyzer
+        self.max_bytes = max_bytes
+        self._tables = OrderedDict()  # resume id -> (stage table, size in bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.paragraphs_reused = 0
+        self.paragraphs_analyzed = 0
+
+    def has(self, resume_id):
+        with self._lock:
+            return resume_id in self._tables
+
+    def _table(self, resume_id):
+        with self._lock:
+            entry = self._tables.get(resume_id)
+            if entry is None:
+                return None
+            self._tables.move_to_end(resume_id)
+            return entry[0]
+
+    def analyze(self, text, resume_id, previous_id=None):
+        previous = self._table(previous_id) if previous_id else None
+        analysis, table, counts = self.analyzer.analyze_revision(text, previous)
+
+        size = len(resume_id) + len(json.dumps(table))
+        with self._lock:
+            old = self._tables.pop(resume_id, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._tables[resume_id] = (table, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._tables) > 1:
+                _, (_, evicted) = self._tables.popitem(last=False)
+                self._bytes -= evicted
+            self.paragraphs_reused += counts['reused']
+            self.paragraphs_analyzed += counts['analyzed']
+
+        return analysis
+
+    def stats(self):
+        total = self.paragraphs_reused + self.paragraphs_analyzed
+        return {
+            'resumes': len(self._tables),
+            'bytes': self._bytes,
+            'paragraphs_reused': self.paragraphs_reused,
+            'paragraphs_analyzed': self.paragraphs_analyzed,
+            'reuse_rate': round(self.paragraphs_reused / total, 3) if total else 0.0
+        }
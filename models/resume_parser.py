@@ -1,6 +1,6 @@
 import PyPDF2
-from docx import Document
 import re
+from utils.docx_text import extract_docx_text
 
 class ResumeParser:
     def __init__(self):
@@ -32,11 +32,7 @@ class ResumeParser:
         return text
     
     def _parse_docx(self, file):
-        doc = Document(file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return extract_docx_text(file)
     
     def extract_skills(self, text):
         text_lower = text.lower()
@@ -0,0 +1,122 @@
+import argparse
+import hashlib
+import json
+import re
+import numpy as np
+
+
+class ResumeFeatureExtractor:
+    """Turns a resume analysis into a fixed-width feature vector."""
+
+    def __init__(self, skill_categories):
+        self.categories = list(skill_categories)
+        self.feature_names = [f'skills_{category}' for category in self.categories] + [
+            'total_skills',
+            'years_experience',
+            'degree_count',
+            'word_count_hundreds',
+        ]
+        self.width = len(self.feature_names)
+
+    def _years(self, experience):
+        match = re.match(r'\d+(?:\.\d+)?', str(experience.get('years', '')))
+        return float(match.group(0)) if match else 0.0
+
+    def extract(self, analysis):
+        """Feature vector for an analysis dict with skills, experience, education and word_count."""
+        skills = analysis.get('skills', {})
+        counts = [len(skills.get(category, [])) for category in self.categories]
+        return np.array(counts + [
+            sum(counts),
+            self._years(analysis.get('experience', {})),
+            len(analysis.get('education', {}).get('degrees', [])),
+            analysis.get('word_count', 0) / 100,
+        ], dtype=np.float32)
+
+    def extract_batch(self, analyses):
+        matrix = np.zeros((len(analyses), self.width), dtype=np.float32)
+        for i, analysis in enumerate(analyses):
+            matrix[i] = self.extract(analysis)
+        return matrix
+
+
+class LinearResumeScorer:
+    """Linear model from feature vectors to the 0-10 resume scores.
+
+    Weights are read from a JSON file keyed by output and feature name, so
+    adding a feature does not invalidate an existing weights file. The
+    overall score stays the mean of the three component scores.
+    """
+
+    OUTPUTS = ['skills_score', 'experience_score', 'education_score']
+    SCORE_FIELDS = OUTPUTS + ['overall_score']
+
+    # Half a point per skill and three points per degree, as the old
+    # hand-written rules gave; experience now earns one point per year
+    # instead of a flat 5 for any resume mentioning a digit from 1 to 5
+    DEFAULT_WEIGHTS = {
+        'weights': {
+            'skills_score': {'total_skills': 0.5},
+            'experience_score': {'years_experience': 1.0},
+            'education_score': {'degree_count': 3.0},
+        },
+        'bias': {}
+    }
+
+    def __init__(self, feature_names, weights_file=None):
+        self.feature_names = list(feature_names)
+        self.weights_file = weights_file
+        self.load(weights_file)
+
+    def load(self, weights_file=None):
+        config = self.DEFAULT_WEIGHTS
+        if weights_file:
+            try:
+                with open(weights_file, 'r') as f:
+                    config = json.load(f)
+            except FileNotFoundError:
+                print(f"Warning: Scoring weights {weights_file} not found. Using default weights.")
+
+        columns = {name: i for i, name in enumerate(self.feature_names)}
+        self.weights = np.zeros((len(self.feature_names), len(self.OUTPUTS)), dtype=np.float32)
+        self.bias = np.zeros(len(self.OUTPUTS), dtype=np.float32)
+        for j, output in enumerate(self.OUTPUTS):
+            for feature, weight in config.get('weights', {}).get(output, {}).items():
+                if feature in columns:
+                    self.weights[columns[feature], j] = weight
+            self.bias[j] = config.get('bias', {}).get(output, 0.0)
+        # Changes whenever loaded weights would score a resume differently
+        self.fingerprint = hashlib.blake2b(self.weights.tobytes() + self.bias.tobytes(), digest_size=4).hexdigest()
+
+    def score_batch(self, features):
+        """(n, features) matrix -> (n, 4) scores in SCORE_FIELDS order, with one matrix multiply."""
+        components = np.clip(features @ self.weights + self.bias, 0, 10)
+        overall = components.mean(axis=1, keepdims=True)
+        return np.hstack([components, overall])
+
+    def score(self, feature_vector):
+        scores = self.score_batch(feature_vector[None, :])[0]
+        return {field: round(float(value), 2) for field, value in zip(self.SCORE_FIELDS, scores)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Resume scoring model tools')
+    parser.add_argument('command', choices=['rescore'])
+    parser.add_argument('--weights', default=None)
+    args = parser.parse_args(argv)
+
+    import time
+    from config import Config
+    from models.candidate_index import CandidateIndex
+    from models.resume_analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer(weights_file=args.weights or Config.RESUME_SCORING_WEIGHTS)
+    index = CandidateIndex(analyzer.skill_categories, Config.CANDIDATE_INDEX_FOLDER,
+                           feature_extractor=analyzer.feature_extractor)
+    start = time.perf_counter()
+    count = index.rescore(analyzer.scorer)
+    print(f"Rescored {count} resumes in {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
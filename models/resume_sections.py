@@ -0,0 +1,137 @@
+import re
+from datetime import date
+
+# Heading words for each section; a heading is a line that starts with one of
+# these, optionally followed by a colon and inline content ("Skills: Python").
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'career history'],
+    'education': ['education', 'academic background', 'qualifications', 'academics'],
+    'skills': ['skills', 'technical skills', 'core skills', 'key skills', 'technologies', 'competencies'],
+    'projects': ['projects', 'personal projects', 'key projects', 'portfolio'],
+}
+
+HEADING_PATTERN = re.compile(
+    r'^[ \t]*(?:' + '|'.join(
+        f'(?P<{section}>' + '|'.join(sorted((re.escape(h) for h in headings), key=len, reverse=True)) + ')'
+        for section, headings in SECTION_HEADINGS.items()
+    ) + r')[ \t]*(?::|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+MONTHS = {name: i + 1 for i, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
+
+def _date_pattern(prefix):
+    return (
+        rf'(?:(?P<{prefix}_month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+'
+        rf'|(?P<{prefix}_num>\d{{1,2}})/)?(?P<{prefix}_year>(?:19|20)\d{{2}})'
+    )
+
+
+DATE_RANGE_PATTERN = re.compile(
+    _date_pattern('start') + r'\s*(?:-|–|—|to|until)\s*(?:'
+    + _date_pattern('end') + r'|(?P<present>present|current|now|today))',
+    re.IGNORECASE
+)
+
+
+class SectionIndex:
+    """Offsets of each resume section within the extracted text.
+
+    Built in one pass over the heading lines. Only (start, end) offsets are
+    kept, so extractors scan their own sections of the original string with
+    ``pattern.finditer(text, start, end)`` instead of copying slices. Text
+    before the first heading counts as the summary; a resume with no
+    headings at all is therefore one summary span.
+    """
+
+    def __init__(self, text, spans):
+        self.text = text
+        self.spans = spans  # [(section, start, end)] in document order
+
+    @classmethod
+    def segment(cls, text):
+        spans = []
+        section, start = 'summary', 0
+        for match in HEADING_PATTERN.finditer(text):
+            spans.append((section, start, match.start()))
+            section, start = match.lastgroup, match.end()
+        spans.append((section, start, len(text)))
+        return cls(text, [span for span in spans if span[2] > span[1]])
+
+    def has(self, section):
+        return any(name == section for name, _, _ in self.spans)
+
+    def ranges(self, *sections, fallback=True):
+        """(start, end) offsets of the given sections; the whole text if none exist and fallback is set."""
+        ranges = [(start, end) for name, start, end in self.spans if name in sections]
+        if not ranges and fallback:
+            ranges = [(0, len(self.text))]
+        return ranges
+
+    def finditer(self, pattern, *sections, fallback=True):
+        for start, end in self.ranges(*sections, fallback=fallback):
+            yield from pattern.finditer(self.text, start, end)
+
+    def to_dict(self):
+        sections = {}
+        for name, start, end in self.spans:
+            sections.setdefault(name, []).append([start, end])
+        return sections
+
+
+def _month_index(match, prefix):
+    month = match.group(f'{prefix}_month')
+    number = match.group(f'{prefix}_num')
+    if month:
+        month = MONTHS[month[:3].lower()]
+    elif number and 1 <= int(number) <= 12:
+        month = int(number)
+    else:
+        month = 1
+    return int(match.group(f'{prefix}_year')) * 12 + month - 1
+
+
+def date_period(match, today=None):
+    """(start, end) month indexes of a DATE_RANGE_PATTERN match, end exclusive.
+
+    The end of a range up to the present is None when no ``today`` is given.
+    """
+    start = _month_index(match, 'start')
+    if match.group('present'):
+        return start, (today.year * 12 + today.month if today else None)
+    # A month-precise end date includes that month; "2015 - 2019" is four years
+    end = _month_index(match, 'end')
+    if match.group('end_month') or match.group('end_num'):
+        end += 1
+    return start, end
+
+
+def covered_months(periods):
+    """Months covered by (start, end) periods, overlaps counted once."""
+    months = 0
+    current_start = current_end = None
+    for start, end in sorted(periods):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                months += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        months += current_end - current_start
+    return months
+
+
+def employment_months(index, today=None):
+    """Months covered by employment date ranges in the experience section, overlaps counted once.
+
+    Returns (months, number of ranges found).
+    """
+    today = today or date.today()
+    periods = [date_period(match, today) for match in index.finditer(DATE_RANGE_PATTERN, 'experience', fallback=False)]
+    periods = [(start, end) for start, end in periods if end >= start]
+    return covered_months(periods), len(periods)
@@ -0,0 +1,167 @@
+import hashlib
+import io
+import os
+import queue
+import re
+import tempfile
+import threading
+import wave
+from collections import OrderedDict
+from concurrent.futures import Future
+
+KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class StubTTSEngine:
+    """Deterministic silent WAV, a quarter second per word; for tests and development."""
+
+    name = 'stub'
+    extension = '.wav'
+    mime_type = 'audio/wav'
+    sample_rate = 8000
+
+    def synthesize(self, text, voice=None):
+        frames = int(self.sample_rate * 0.25 * max(1, len(text.split())))
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as out:
+            out.setnchannels(1)
+            out.setsampwidth(1)
+            out.setframerate(self.sample_rate)
+            out.writeframes(b'\x80' * frames)
+        return buffer.getvalue()
+
+
+class Pyttsx3Engine:
+    """Offline synthesis through pyttsx3 (espeak on Linux, SAPI5 on Windows).
+
+    pyttsx3 drivers must be created and run on one thread, so a dedicated
+    engine thread owns the driver and renders queued requests in turn.
+    """
+
+    name = 'pyttsx3'
+    extension = '.wav'
+    mime_type = 'audio/wav'
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        started = Future()
+        self._thread = threading.Thread(target=self._run, args=(started,), name='tts-engine', daemon=True)
+        self._thread.start()
+        started.result()  # re-raises if pyttsx3 is missing or has no driver
+
+    def _run(self, started):
+        try:
+            import pyttsx3
+            engine = pyttsx3.init()
+        except Exception as e:
+            started.set_exception(e)
+            return
+        started.set_result(None)
+
+        while True:
+            text, voice, result = self._jobs.get()
+            if not result.set_running_or_notify_cancel():
+                continue
+            try:
+                with tempfile.TemporaryDirectory() as folder:
+                    path = os.path.join(folder, 'speech.wav')
+                    if voice:
+                        engine.setProperty('voice', voice)
+                    engine.save_to_file(text, path)
+                    engine.runAndWait()
+                    with open(path, 'rb') as f:
+                        result.set_result(f.read())
+            except Exception as e:
+                result.set_exception(e)
+
+    def synthesize(self, text, voice=None):
+        result = Future()
+        self._jobs.put((text, voice, result))
+        return result.result()
+
+
+def create_engine(name):
+    """TTS engine by name, or None when it is disabled or not installed."""
+    if name == 'stub':
+        return StubTTSEngine()
+    if name == 'pyttsx3':
+        try:
+            return Pyttsx3Engine()
+        except Exception as e:
+            print(f"Warning: pyttsx3 text-to-speech unavailable ({e}). Questions will be spoken by the browser.")
+    return None
+
+
+class TTSCache:
+    """Content-addressed cache of pre-rendered question audio.
+
+    A clip's key is the SHA-256 of engine, voice and text, so a question is
+    rendered once however many roles, tenants or workers use it, and an
+    edited question gets a new key (and URL) instead of a stale clip.
+    """
+
+    def __init__(self, folder, engine, voice=None, max_texts=10000):
+        self.folder = folder
+        self.engine = engine
+        self.voice = voice
+        self.max_texts = max_texts
+        self._texts = OrderedDict()  # key -> text, least recently used first
+        self._lock = threading.Lock()
+        self.rendered = 0
+        os.makedirs(self.folder, exist_ok=True)
+
+    def key(self, text):
+        """Key for the text; also remembers the text so a miss can be rendered on demand."""
+        key = hashlib.sha256(f'{self.engine.name}\0{self.voice or ""}\0{text}'.encode('utf-8')).hexdigest()
+        with self._lock:
+            self._texts[key] = text
+            self._texts.move_to_end(key)
+            while len(self._texts) > self.max_texts:
+                self._texts.popitem(last=False)
+        return key
+
+    def path(self, key):
+        if not KEY_PATTERN.match(key):
+            raise KeyError(key)
+        return os.path.join(self.folder, key[:2], key + self.engine.extension)
+
+    def render(self, text):
+        """Render the text unless it is already cached; returns its key."""
+        key = self.key(text)
+        path = self.path(key)
+        if os.path.exists(path):
+            return key
+
+        audio = self.engine.synthesize(text, self.voice)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(audio)
+        os.replace(tmp, path)
+        with self._lock:
+            self.rendered += 1
+        return key
+
+    def ensure(self, key):
+        """Path of a cached clip, rendering it if its text is known; raises KeyError otherwise."""
+        path = self.path(key)
+        if not os.path.exists(path):
+            with self._lock:
+                text = self._texts.get(key)
+            if text is None:
+                raise KeyError(key)
+            self.render(text)
+        return path
+
+    def prerender(self, texts):
+        for text in dict.fromkeys(texts):
+            try:
+                self.render(text)
+            except Exception as e:
+                print(f"Warning: could not pre-render question audio: {e}")
+
+    def prerender_async(self, texts):
+        """Render in a background thread so loading a question bank is not delayed."""
+        thread = threading.Thread(target=self.prerender, args=(list(texts),), daemon=True)
+        thread.start()
+        return thread
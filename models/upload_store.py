@@ -0,0 +1,262 @@
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+
+HASH_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+READ_SIZE = 64 * 1024
+DAY = 24 * 60 * 60
+
+
+class UploadStore:
+    """Content-addressed resume uploads with a SQLite manifest.
+
+    Files live at ``<folder>/ab/cd/<sha256><ext>`` so no directory grows
+    past a few hundred entries, and identical uploads are stored once. The
+    manifest records each upload's size, upload time and the analysis
+    version it was analyzed with; retention and archiving query its indexes
+    instead of listing directories. Cold uploads are packed into one
+    compressed zip per upload day under ``<folder>/archive/``, and whole
+    packs are deleted when their day expires.
+    """
+
+    def __init__(self, folder='uploads/resumes', retention_days=365, archive_after_days=30):
+        self.folder = folder
+        self.archive_folder = os.path.join(folder, 'archive')
+        self.retention = retention_days * DAY if retention_days else None
+        self.archive_after = archive_after_days * DAY if archive_after_days else None
+        os.makedirs(self.archive_folder, exist_ok=True)
+        self.manifest_path = os.path.join(folder, 'manifest.sqlite3')
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute('''CREATE TABLE IF NOT EXISTS uploads (
+            hash TEXT PRIMARY KEY, name TEXT, extension TEXT, size INTEGER,
+            uploaded REAL, analysis_version TEXT, archive TEXT)''')
+        connection.execute('CREATE INDEX IF NOT EXISTS uploads_uploaded ON uploads (uploaded)')
+        connection.execute('CREATE INDEX IF NOT EXISTS uploads_archive ON uploads (archive)')
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.manifest_path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
+        return connection
+
+    def stored_name(self, digest, extension):
+        return digest + extension
+
+    def path(self, digest, extension):
+        if not HASH_PATTERN.match(digest):
+            raise KeyError(digest)
+        return os.path.join(self.folder, digest[:2], digest[2:4], self.stored_name(digest, extension))
+
+    def put(self, stream, filename, analysis_version=None, uploaded=None):
+        """Store an uploaded file; returns its manifest record.
+
+        Re-uploading identical content keeps the first record but refreshes
+        its upload time and extension, restoring the file if it had been
+        archived.
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        os.makedirs(self.folder, exist_ok=True)
+        tmp = os.path.join(self.folder, f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp, 'wb') as f:
+                while True:
+                    chunk = stream.read(READ_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            digest = digest.hexdigest()
+
+            path = self.path(digest, extension)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp, path)
+        finally:
+            # Left behind only when the upload stream or the disk failed
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+        previous = self.get(digest)
+        connection = self._connection()
+        connection.execute(
+            '''INSERT INTO uploads (hash, name, extension, size, uploaded, analysis_version, archive)
+               VALUES (?, ?, ?, ?, ?, ?, NULL)
+               ON CONFLICT(hash) DO UPDATE SET uploaded = excluded.uploaded, archive = NULL,
+                   extension = excluded.extension,
+                   analysis_version = COALESCE(excluded.analysis_version, analysis_version)''',
+            (digest, os.path.basename(filename), extension, size,
+             uploaded if uploaded is not None else time.time(), analysis_version))
+        if previous and previous['archive']:
+            self._drop_pack_if_empty(previous['archive'])
+        elif previous and previous['extension'] != extension:
+            # The same bytes now live under the new extension only
+            try:
+                os.remove(self.path(digest, previous['extension']))
+            except FileNotFoundError:
+                pass
+        return self.get(digest)
+
+    def get(self, digest):
+        """Manifest record for a hash, or None."""
+        row = self._connection().execute('SELECT * FROM uploads WHERE hash = ?', (digest,)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record['stored_name'] = self.stored_name(record['hash'], record['extension'])
+        return record
+
+    def names(self, stored_names):
+        """Original file names for stored names; unknown ones map to themselves."""
+        hashes = {os.path.splitext(name)[0]: name for name in stored_names}
+        names = {name: name for name in stored_names}
+        if not hashes:
+            return names
+        rows = self._connection().execute(
+            f"SELECT hash, name FROM uploads WHERE hash IN ({','.join('?' * len(hashes))})", list(hashes))
+        for row in rows:
+            names[hashes[row['hash']]] = row['name']
+        return names
+
+    def set_analysis_version(self, digest, version):
+        self._connection().execute('UPDATE uploads SET analysis_version = ? WHERE hash = ?', (version, digest))
+
+    def stale(self, version, limit=1000):
+        """Hashes not yet analyzed with the given analysis version, oldest first."""
+        rows = self._connection().execute(
+            '''SELECT hash FROM uploads WHERE analysis_version IS NULL OR analysis_version != ?
+               ORDER BY uploaded LIMIT ?''', (version, limit))
+        return [row['hash'] for row in rows]
+
+    def read(self, digest):
+        """File contents, from its shard or its archive pack."""
+        record = self.get(digest)
+        if record is None:
+            raise KeyError(digest)
+        if record['archive']:
+            with zipfile.ZipFile(os.path.join(self.archive_folder, record['archive'])) as pack:
+                return pack.read(record['stored_name'])
+        with open(self.path(digest, record['extension']), 'rb') as f:
+            return f.read()
+
+    def archive(self, now=None):
+        """Pack uploads older than the archive age into per-day zips; returns how many moved."""
+        if self.archive_after is None:
+            return 0
+        now = time.time() if now is None else now
+        connection = self._connection()
+        rows = connection.execute(
+            'SELECT hash, extension, uploaded FROM uploads WHERE archive IS NULL AND uploaded < ? ORDER BY uploaded',
+            (now - self.archive_after,)).fetchall()
+
+        packs = {}
+        for row in rows:
+            day = time.strftime('%Y-%m-%d', time.gmtime(row['uploaded']))
+            packs.setdefault(f'{day}.zip', []).append(row)
+
+        moved = 0
+        for pack_name, members in packs.items():
+            pack_path = os.path.join(self.archive_folder, pack_name)
+            with zipfile.ZipFile(pack_path, 'a', zipfile.ZIP_DEFLATED) as pack:
+                existing = set(pack.namelist())
+                for row in members:
+                    name = self.stored_name(row['hash'], row['extension'])
+                    path = self.path(row['hash'], row['extension'])
+                    if name not in existing:
+                        pack.write(path, name)
+            # Files are removed only once the pack holding them is closed
+            for row in members:
+                connection.execute('UPDATE uploads SET archive = ? WHERE hash = ?', (pack_name, row['hash']))
+                try:
+                    os.remove(self.path(row['hash'], row['extension']))
+                except FileNotFoundError:
+                    pass
+                moved += 1
+        return moved
+
+    def expire(self, now=None):
+        """Delete uploads past the retention period; returns how many were removed."""
+        if self.retention is None:
+            return 0
+        now = time.time() if now is None else now
+        cutoff = now - self.retention
+        connection = self._connection()
+        rows = connection.execute('SELECT hash, extension, archive FROM uploads WHERE uploaded < ?',
+                                  (cutoff,)).fetchall()
+        for row in rows:
+            if not row['archive']:
+                try:
+                    os.remove(self.path(row['hash'], row['extension']))
+                except FileNotFoundError:
+                    pass
+        connection.execute('DELETE FROM uploads WHERE uploaded < ?', (cutoff,))
+
+        for pack_name in {row['archive'] for row in rows if row['archive']}:
+            self._drop_pack_if_empty(pack_name)
+        return len(rows)
+
+    def _drop_pack_if_empty(self, pack_name):
+        """A pack is deleted once no manifest record points into it."""
+        if self._connection().execute('SELECT 1 FROM uploads WHERE archive = ? LIMIT 1', (pack_name,)).fetchone():
+            return
+        try:
+            os.remove(os.path.join(self.archive_folder, pack_name))
+        except FileNotFoundError:
+            pass
+
+    def maintain(self, now=None):
+        expired = self.expire(now)
+        archived = self.archive(now)
+        return expired, archived
+
+    def import_folder(self, folder, analysis_version=None):
+        """Move files from a flat upload folder into the store, keeping their modification times."""
+        imported = 0
+        for entry in os.scandir(folder):
+            if not entry.is_file():
+                continue
+            with open(entry.path, 'rb') as f:
+                self.put(f, entry.name, analysis_version, uploaded=entry.stat().st_mtime)
+            os.remove(entry.path)
+            imported += 1
+        return imported
+
+    def stats(self):
+        row = self._connection().execute(
+            '''SELECT COUNT(*) AS uploads, COALESCE(SUM(size), 0) AS bytes,
+                      COALESCE(SUM(archive IS NOT NULL), 0) AS archived FROM uploads''').fetchone()
+        return dict(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Resume upload storage tools')
+    parser.add_argument('command', choices=['maintain', 'import', 'stats'])
+    parser.add_argument('--folder', default=None, help='flat folder to import (default: UPLOAD_FOLDER)')
+    args = parser.parse_args(argv)
+
+    from config import Config
+    store = UploadStore(Config.RESUME_STORE_FOLDER, Config.UPLOAD_RETENTION_DAYS, Config.UPLOAD_ARCHIVE_AFTER_DAYS)
+
+    if args.command == 'maintain':
+        expired, archived = store.maintain()
+        print(f"Expired {expired} uploads, archived {archived}")
+    elif args.command == 'import':
+        imported = store.import_folder(args.folder or Config.UPLOAD_FOLDER)
+        print(f"Imported {imported} uploads")
+    else:
+        print(store.stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import re
+import secrets
+import threading
+import time
+
+UPLOAD_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+READ_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    pass
+
+
+class UploadOffsetError(UploadError):
+    """Chunk does not start where the stored data ends; carries the offset to resume from."""
+
+    def __init__(self, expected_offset):
+        super().__init__(f"Expected offset {expected_offset}")
+        self.expected_offset = expected_offset
+
+
+class VideoUploadManager:
+    """Chunked, resumable video answer uploads assembled by appending to one file per answer.
+
+    Chunks must arrive in order. A client that lost its connection asks for
+    the current offset and continues from there; re-sending a chunk the
+    server already has is acknowledged without writing it twice. Uploads
+    that receive nothing for ``abandon_after`` seconds are deleted by
+    ``cleanup``, which ``start`` runs at most once an hour.
+    """
+
+    CLEANUP_INTERVAL = 3600
+
+    def __init__(self, folder='uploads/videos', extension='.webm', abandon_after=24 * 3600):
+        self.folder = folder
+        self.extension = extension
+        self.abandon_after = abandon_after
+        os.makedirs(self.folder, exist_ok=True)
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._last_cleanup = 0.0
+
+    def _path(self, upload_id, suffix):
+        if not UPLOAD_ID_PATTERN.match(upload_id):
+            raise UploadError("Invalid upload id")
+        return os.path.join(self.folder, upload_id + suffix)
+
+    def _lock(self, upload_id):
+        with self._locks_guard:
+            return self._locks.setdefault(upload_id, threading.Lock())
+
+    def _read_meta(self, upload_id):
+        try:
+            with open(self._path(upload_id, '.json'), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise UploadError("Unknown upload")
+
+    def _write_meta(self, upload_id, meta):
+        path = self._path(upload_id, '.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(meta, f)
+        os.replace(path + '.tmp', path)
+
+    def start(self, interview_id, question_index, mime_type='video/webm'):
+        if self.abandon_after and time.time() - self._last_cleanup > self.CLEANUP_INTERVAL:
+            self.cleanup()
+        upload_id = secrets.token_hex(16)
+        open(self._path(upload_id, '.part'), 'wb').close()
+        self._write_meta(upload_id, {
+            'interview_id': interview_id,
+            'question_index': question_index,
+            'mime_type': mime_type,
+            'created': time.time(),
+            'complete': False
+        })
+        return upload_id
+
+    def status(self, upload_id):
+        meta = self._read_meta(upload_id)
+        data_path = self._path(upload_id, self.extension if meta['complete'] else '.part')
+        return {
+            'upload_id': upload_id,
+            'offset': os.path.getsize(data_path),
+            'complete': meta['complete']
+        }
+
+    def append_chunk(self, upload_id, offset, stream, length, checksum=None):
+        """Append ``length`` bytes read from ``stream`` at ``offset``; returns the new size.
+
+        The chunk is streamed to disk while it is hashed. On a checksum
+        mismatch the file is truncated back to ``offset``.
+        """
+        with self._lock(upload_id):
+            meta = self._read_meta(upload_id)
+            if meta['complete']:
+                raise UploadError("Upload already completed")
+
+            part_path = self._path(upload_id, '.part')
+            size = os.path.getsize(part_path)
+            if offset + length <= size:
+                return size  # retried chunk we already stored
+            if offset != size:
+                raise UploadOffsetError(size)
+
+            digest = hashlib.sha256()
+            written = 0
+            with open(part_path, 'ab') as f:
+                while written < length:
+                    data = stream.read(min(READ_SIZE, length - written))
+                    if not data:
+                        break
+                    digest.update(data)
+                    f.write(data)
+                    written += len(data)
+
+            if written != length or (checksum and digest.hexdigest() != checksum.lower()):
+                with open(part_path, 'r+b') as f:
+                    f.truncate(size)
+                raise UploadError("Chunk incomplete or checksum mismatch")
+            return size + written
+
+    def complete(self, upload_id, total_size=None):
+        """Seal an upload once every byte has arrived; returns the final file path."""
+        with self._lock(upload_id):
+            meta = self._read_meta(upload_id)
+            final_path = self._path(upload_id, self.extension)
+            if meta['complete']:
+                return final_path
+
+            part_path = self._path(upload_id, '.part')
+            size = os.path.getsize(part_path)
+            if total_size is not None and size != total_size:
+                raise UploadOffsetError(size)
+
+            os.replace(part_path, final_path)
+            meta['complete'] = True
+            meta['size'] = size
+            meta['completed'] = time.time()
+            self._write_meta(upload_id, meta)
+
+        with self._locks_guard:
+            self._locks.pop(upload_id, None)
+        return final_path
+
+    def owner(self, upload_id):
+        return self._read_meta(upload_id).get('interview_id')
+
+    def cleanup(self, now=None):
+        """Delete incomplete uploads with no chunk for ``abandon_after`` seconds; returns how many."""
+        now = time.time() if now is None else now
+        self._last_cleanup = now
+        removed = 0
+        for entry in os.scandir(self.folder):
+            upload_id, suffix = os.path.splitext(entry.name)
+            if suffix != '.part' or not UPLOAD_ID_PATTERN.match(upload_id):
+                continue
+            with self._lock(upload_id):
+                try:
+                    if now - os.stat(entry.path).st_mtime < self.abandon_after:
+                        continue
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue  # completed meanwhile
+                try:
+                    os.remove(self._path(upload_id, '.json'))
+                except FileNotFoundError:
+                    pass
+            with self._locks_guard:
+                self._locks.pop(upload_id, None)
+            removed += 1
+        return removed
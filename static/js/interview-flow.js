@@ -0,0 +1,89 @@
+// Single-page interview flow: the interview room is rendered once and later
+// questions come from a prefetched list instead of a redirect per question.
+class InterviewFlow {
+    constructor() {
+        this.enabled = false;
+        this.prefetchCount = 3;
+        this.questions = {};
+    }
+
+    start(prefetchCount) {
+        this.enabled = true;
+        this.prefetchCount = prefetchCount || this.prefetchCount;
+        return this.prefetch();
+    }
+
+    async prefetch() {
+        try {
+            const response = await fetch(`/get_next_question?prefetch=${this.prefetchCount}`);
+            const data = await response.json();
+            if (data.upcoming) {
+                this.store(data.upcoming);
+            }
+        } catch (error) {
+            console.error('❌ Question prefetch failed:', error);
+        }
+    }
+
+    store(questions) {
+        questions.forEach(question => {
+            this.questions[question.question_num] = question;
+            if (question.audio_url) {
+                // Warm the browser cache so the question plays without a fetch
+                const audio = new Audio();
+                audio.preload = 'auto';
+                audio.src = question.audio_url;
+            }
+        });
+    }
+
+    async submitAnswer(answer) {
+        const response = await fetch('/api/interview/answer', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ answer: answer, prefetch: this.prefetchCount })
+        });
+        if (!response.ok) {
+            throw new Error('Network response was not ok: ' + response.status);
+        }
+
+        const data = await response.json();
+        if (data.upcoming) {
+            this.store(data.upcoming);
+        }
+        return data;
+    }
+
+    getQuestion(questionNum) {
+        return this.questions[questionNum] || null;
+    }
+
+    showQuestion(question) {
+        document.title = `Interview Room - Question ${question.question_num}`;
+        document.getElementById('questionProgress').textContent =
+            `Question ${question.question_num} of ${question.total_questions}`;
+        document.getElementById('questionText').textContent = question.question;
+        document.getElementById('questionText').dataset.audioUrl = question.audio_url || '';
+        document.getElementById('aiQuestionText').textContent = question.question;
+
+        const questionType = question.type.charAt(0).toUpperCase() + question.type.slice(1);
+        document.querySelector('.question-type').textContent = `${questionType} Question`;
+
+        // Reset the answer area and timers left over from the previous question
+        document.getElementById('answer').value = '';
+        document.getElementById('voicePreview').textContent = '';
+        document.getElementById('answerSection').style.display = 'none';
+        document.getElementById('questionCard').classList.remove('minimized');
+        document.getElementById('feedbackSection').style.display = 'none';
+        document.querySelector('.auto-next-countdown').style.display = '';
+        document.getElementById('listeningTimer').className = 'timer';
+        document.getElementById('answerTimer').className = 'timer';
+        document.getElementById('answerTimer').textContent = interviewTimer.answerTime;
+        document.getElementById('aiSpeakingIndicator').style.display = 'flex';
+
+        delete this.questions[question.question_num];
+    }
+}
+
+// Global instance
+const interviewFlow = new InterviewFlow();
@@ -3,6 +3,7 @@ class TextToSpeech {
     constructor() {
         this.synthesis = window.speechSynthesis;
         this.utterance = null;
+        this.audio = null;
         this.isSpeaking = false;
         this.isMuted = false;
         this.voices = [];
@@ -38,7 +39,12 @@ class TextToSpeech {
         });
     }
 
-    speakQuestion(text) {
+    speakQuestion(text, audioUrl) {
+        if (audioUrl && !this.isMuted) {
+            // Server pre-rendered audio; fall back to browser speech if it cannot play
+            return this.playAudio(audioUrl).catch(() => this.speakQuestion(text));
+        }
+
         return new Promise((resolve, reject) => {
             if (this.isMuted) {
                 resolve(); // Resolve immediately if muted
@@ -89,6 +95,29 @@ class TextToSpeech {
         });
     }
 
+    playAudio(url) {
+        return new Promise((resolve, reject) => {
+            this.stop();
+            this.audio = new Audio(url);
+            this.audio.onplaying = () => {
+                this.isSpeaking = true;
+                this.updateAISpeakingUI(true);
+            };
+            this.audio.onended = () => {
+                this.audio = null;
+                this.isSpeaking = false;
+                this.updateAISpeakingUI(false);
+                resolve();
+            };
+            this.audio.onerror = () => {
+                this.audio = null;
+                this.isSpeaking = false;
+                reject(new Error('Could not load ' + url));
+            };
+            this.audio.play().catch(reject);
+        });
+    }
+
     updateAISpeakingUI(speaking) {
         const aiSpeakingIndicator = document.getElementById('aiSpeakingIndicator');
         const statusText = document.getElementById('statusText');
@@ -108,6 +137,12 @@ class TextToSpeech {
     }
 
     stop() {
+        if (this.audio) {
+            this.audio.pause();
+            this.audio = null;
+            this.isSpeaking = false;
+            this.updateAISpeakingUI(false);
+        }
         if (this.synthesis.speaking) {
             this.synthesis.cancel();
             this.isSpeaking = false;
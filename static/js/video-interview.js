@@ -1,3 +1,97 @@
+// Streams MediaRecorder segments to the server as they are produced, so the
+// upload is done moments after recording stops. Chunks are sent in order with
+// their offset and SHA-256; after a failure the uploader asks the server for
+// its current offset and resumes from there.
+class ChunkedVideoUploader {
+    constructor(questionIndex) {
+        this.questionIndex = questionIndex;
+        this.uploadId = null;
+        this.offset = 0;
+        this.pending = [];
+        this.queue = Promise.resolve();
+        this.maxRetries = 5;
+    }
+
+    async start() {
+        const response = await fetch('/video_upload', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ question_index: this.questionIndex, mime_type: 'video/webm' })
+        });
+        const data = await response.json();
+        this.uploadId = data.upload_id;
+        this.offset = data.offset;
+    }
+
+    enqueue(blob) {
+        this.pending.push(blob);
+        this.queue = this.queue.then(() => this.flush());
+        return this.queue;
+    }
+
+    async flush() {
+        while (this.pending.length > 0) {
+            await this.sendChunk(this.pending[0]);
+            this.pending.shift();
+        }
+    }
+
+    async sendChunk(blob) {
+        const buffer = await blob.arrayBuffer();
+        const checksum = await this.sha256(buffer);
+        const end = this.offset + buffer.byteLength;
+
+        for (let attempt = 0; attempt < this.maxRetries; attempt++) {
+            try {
+                // A chunk is always the bytes after what the server already stored
+                const start = Math.max(0, buffer.byteLength - (end - this.offset));
+                const body = start > 0 ? buffer.slice(start) : buffer;
+                const sum = start > 0 ? await this.sha256(body) : checksum;
+                const response = await fetch(`/video_upload/${this.uploadId}?offset=${this.offset}`, {
+                    method: 'PUT',
+                    headers: { 'X-Chunk-Checksum': sum },
+                    body: body
+                });
+                const data = await response.json();
+                if (response.ok || response.status === 409) {
+                    this.offset = data.offset;
+                    if (this.offset >= end) return;
+                }
+            } catch (error) {
+                console.error('Chunk upload failed, resuming:', error);
+                await this.resync();
+            }
+            await new Promise(resolve => setTimeout(resolve, 250 * (attempt + 1)));
+        }
+        throw new Error('Video chunk upload failed');
+    }
+
+    async resync() {
+        try {
+            const response = await fetch(`/video_upload/${this.uploadId}`);
+            const data = await response.json();
+            if (response.ok) this.offset = data.offset;
+        } catch (error) {
+            // Still offline; the next attempt tries again
+        }
+    }
+
+    async finish() {
+        await this.queue;
+        const response = await fetch(`/video_upload/${this.uploadId}/complete`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ size: this.offset })
+        });
+        return response.json();
+    }
+
+    async sha256(buffer) {
+        const digest = await crypto.subtle.digest('SHA-256', buffer);
+        return Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+    }
+}
+
 class VideoInterview {
     constructor() {
         this.videoElement = null;
@@ -7,6 +101,8 @@ class VideoInterview {
         this.isRecording = false;
         this.mediaRecorder = null;
         this.recordedChunks = [];
+        this.uploader = null;
+        this.chunkInterval = 1000;  // ms of video per uploaded segment
     }
     
     async initializeCamera() {
@@ -28,6 +124,12 @@ class VideoInterview {
         }
     }
     
+    // Record from a stream the page already opened (the interview room asks for its own)
+    useStream(stream, videoElement) {
+        this.stream = stream;
+        this.videoElement = videoElement || this.videoElement;
+    }
+    
     captureFrame() {
         if (!this.videoElement || !this.stream) return null;
         
@@ -43,39 +145,69 @@ class VideoInterview {
         return this.canvasElement.toDataURL('image/jpeg', 0.8);
     }
     
-    startRecording() {
+    startRecording(questionIndex) {
         if (!this.stream) return;
         
+        // Stream segments to the server while recording when we know the question
+        this.uploader = null;
+        if (questionIndex !== undefined) {
+            this.uploader = new ChunkedVideoUploader(questionIndex);
+            this.uploader.ready = this.uploader.start().catch(error => {
+                console.error('Could not start video upload:', error);
+                this.uploader = null;
+            });
+        }
+        
         this.recordedChunks = [];
-        this.mediaRecorder = new MediaRecorder(this.stream, { 
-            mimeType: 'video/webm; codecs=vp9' 
-        });
+        const mimeType = ['video/webm; codecs=vp9', 'video/webm']
+            .find(type => MediaRecorder.isTypeSupported(type));
+        this.mediaRecorder = new MediaRecorder(this.stream, mimeType ? { mimeType: mimeType } : undefined);
         
         this.mediaRecorder.ondataavailable = (event) => {
             if (event.data.size > 0) {
                 this.recordedChunks.push(event.data);
+                if (this.uploader) {
+                    const uploader = this.uploader;
+                    uploader.ready.then(() => uploader.uploadId && uploader.enqueue(event.data));
+                }
             }
         };
         
-        this.mediaRecorder.start();
+        this.mediaRecorder.start(this.uploader ? this.chunkInterval : undefined);
         this.isRecording = true;
     }
     
     stopRecording() {
         if (this.mediaRecorder && this.isRecording) {
-            this.mediaRecorder.stop();
             this.isRecording = false;
             
-            return new Promise((resolve) => {
+            this.stopping = new Promise((resolve) => {
                 this.mediaRecorder.onstop = () => {
                     const blob = new Blob(this.recordedChunks, { type: 'video/webm' });
+                    if (this.uploader) {
+                        // The last segment arrives with onstop; seal the upload after it
+                        const uploader = this.uploader;
+                        this.uploadComplete = uploader.ready
+                            .then(() => uploader.queue)
+                            .then(() => uploader.uploadId && uploader.finish());
+                    }
                     resolve(blob);
                 };
             });
+            this.mediaRecorder.stop();
+            return this.stopping;
         }
         return Promise.resolve(null);
     }
     
+    // Resolves once the last recording has stopped and its upload is sealed or has failed
+    async waitForUpload() {
+        await this.stopping;
+        if (this.uploadComplete) {
+            await this.uploadComplete.catch(error => console.error('Video upload failed:', error));
+        }
+    }
+    
     stopCamera() {
         if (this.stream) {
             this.stream.getTracks().forEach(track => track.stop());
@@ -10,6 +10,8 @@ class VoiceRecognition {
         this.onResultCallback = null;
         this.autoStopTimeout = null;
         this.mediaStream = null;
+        this.transcriptStreamUrl = null;  // set to the async API's /ws/interview/transcript to enable
+        this.transcriptSocket = null;
         
         // Check browser support first
         if (this.isSpeechRecognitionSupported()) {
@@ -83,6 +85,7 @@ class VoiceRecognition {
                 const transcript = event.results[i][0].transcript;
                 if (event.results[i].isFinal) {
                     finalTranscript += transcript + ' ';
+                    this.sendSegment(transcript);
                 } else {
                     interimTranscript += transcript;
                 }
@@ -196,6 +199,50 @@ class VoiceRecognition {
         }
     }
     
+    // Stream final segments to the async API, which answers with the keywords covered so far
+    openTranscriptStream() {
+        if (!this.transcriptStreamUrl || this.transcriptSocket || !('WebSocket' in window)) return;
+        
+        const url = new URL(this.transcriptStreamUrl, window.location.href);
+        url.protocol = url.protocol === 'https:' ? 'wss:' : url.protocol === 'http:' ? 'ws:' : url.protocol;
+        const socket = new WebSocket(url.href);
+        socket.onmessage = (event) => {
+            let message;
+            try {
+                message = JSON.parse(event.data);
+            } catch (e) {
+                return;
+            }
+            if (message.type === 'transcript') {
+                this.showKeywordProgress(message.keywords_found || []);
+            }
+        };
+        socket.onclose = () => {
+            if (this.transcriptSocket === socket) this.transcriptSocket = null;
+        };
+        this.transcriptSocket = socket;
+    }
+    
+    closeTranscriptStream() {
+        if (this.transcriptSocket) {
+            this.transcriptSocket.close();
+            this.transcriptSocket = null;
+        }
+    }
+    
+    sendSegment(text) {
+        if (this.transcriptSocket && this.transcriptSocket.readyState === WebSocket.OPEN) {
+            this.transcriptSocket.send(JSON.stringify({ text: text, final: true }));
+        }
+    }
+    
+    showKeywordProgress(keywords) {
+        const progress = document.getElementById('voiceKeywords');
+        if (!progress) return;
+        progress.textContent = keywords.length ? `Key points covered: ${keywords.join(', ')}` : '';
+        progress.style.display = keywords.length ? 'block' : 'none';
+    }
+    
     // Update the answer textarea with recognized speech
     updateAnswerText(transcript) {
         const answerTextarea = document.getElementById('answer');
@@ -368,6 +415,7 @@ class VoiceRecognition {
         
         try {
             this.recognition.start();
+            this.openTranscriptStream();
             // Auto-stop after 25 seconds (5 seconds before 30-second limit)
             this.stopAutomatically(25000);
         } catch (error) {
@@ -389,6 +437,8 @@ class VoiceRecognition {
             clearTimeout(this.autoStopTimeout);
         }
         
+        this.closeTranscriptStream();
+        
         // Stop media stream tracks
         if (this.mediaStream) {
             this.mediaStream.getTracks().forEach(track => track.stop());
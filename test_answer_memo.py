@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.answer_memo import AnswerMemo, answer_digest
+
+
+def test_repeated_answers_hit_and_results_are_copies():
+    memo = AnswerMemo(max_entries=2)
+    assert answer_digest("I use  unit tests.\n") == answer_digest("I use unit tests.")
+    assert answer_digest("I use unit tests.") != answer_digest("i use unit tests.")
+
+    key = ('software_engineer', None, 2, 'semantic', 1, answer_digest("I use unit tests."))
+    memo.set(key, (6.0, "Good answer.", {'feedback_parts': [1]}))
+    score, feedback, analysis = memo.get(key)
+    analysis.pop('feedback_parts')
+    assert memo.get(key)[2] == {'feedback_parts': [1]}
+
+    memo.set(('other', None, 0, 'semantic', 1, 'a'), (1.0, '', {}))
+    memo.set(('other', None, 1, 'semantic', 1, 'b'), (1.0, '', {}))
+    assert memo.get(key) is None
+    assert memo.stats() == {'entries': 2, 'hits': 2, 'misses': 1, 'hit_rate': 0.667}
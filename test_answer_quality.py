@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.answer_quality import (ReferenceStats, extract_quality_features, quality_note_parts,
+                                   read_sample_answers, update_logged_stats)
+from models.event_log import EventLog, compact
+from models.response_log import render_part
+
+
+def test_quality_features_in_one_pass():
+    answer = ("Um, when I was at Acme my role was to fix deploys. I built a pipeline, you know. "
+              "As a result we reduced failures by 40 percent!")
+    features = extract_quality_features(answer, ['pipeline', 'testing'], ['pipeline'])
+
+    assert features['word_count'] == 27
+    assert features['avg_sentence_length'] == 9.0
+    assert features['filler_rate'] == round(2 / 27, 3)
+    assert features['star'] == ['situation', 'task', 'action', 'result']
+    assert features['keyword_coverage'] == 0.5
+    assert [render_part(p) for p in quality_note_parts('behavioral', features, None)] == ["Try to cut down on filler words."]
+
+
+def test_reference_stats_compare_after_enough_samples():
+    stats = ReferenceStats()
+    answers = ["I profiled the service and fixed the slow query. " * n for n in range(1, 6)]
+    for i, answer in enumerate(answers):
+        assert stats.compare('software_engineer', 1, extract_quality_features(answer)) is None
+        stats.observe('software_engineer', 1, extract_quality_features(answer))
+
+    comparison = stats.compare('software_engineer', 1, extract_quality_features("Fixed it."))
+    assert comparison['word_count'] < -1
+    assert stats.compare('data_scientist', 1, extract_quality_features("Fixed it.")) is None
+
+
+def _log_interview(log, interview_id, answer, tenant=None):
+    log.append('start', interview_id, job_role='software_engineer', tenant=tenant)
+    log.append('answer', interview_id, question_index=0, answer=answer)
+    log.append('finish', interview_id)
+    log.flush()
+
+
+def test_logged_stats_resume_from_snapshot(tmp_path):
+    folder = str(tmp_path)
+    seen = []
+
+    def features_for(job_role, question_index, answer):
+        seen.append(answer)
+        return extract_quality_features(answer)
+
+    log = EventLog(folder, segment_bytes=200)
+    _log_interview(log, 'a', 'one two three')
+    _log_interview(log, 't', 'tenant answer', tenant='acme')
+    _log_interview(log, 'b', 'one two')
+    assert update_logged_stats(folder, 'v1', features_for).sample_count('software_engineer', 0) == 2
+
+    _log_interview(log, 'c', 'one')
+    seen.clear()
+    stats = update_logged_stats(folder, 'v1', features_for)
+    assert seen == ['one']
+    assert stats.sample_count('software_engineer', 0) == 3
+    assert stats.compare('software_engineer', 0, extract_quality_features('one')) is None
+
+    # Compaction removes the segment the snapshot points into, so the whole log is replayed
+    _log_interview(log, 'd', 'one two three four')
+    log.close()
+    assert compact(folder, segment_bytes=1 << 20) > 0
+    seen.clear()
+    stats = update_logged_stats(folder, 'v1', features_for)
+    assert seen == ['one two three', 'one two', 'one', 'one two three four']
+    assert stats.sample_count('software_engineer', 0) == 4
+
+    seen.clear()
+    assert update_logged_stats(folder, 'v2', features_for).sample_count('software_engineer', 0) == 4
+    assert len(seen) == 4
+
+
+def test_reference_stats_merge_matches_observing_everything():
+    answers = ["Fixed it.", "I fixed the bug quickly.", "We shipped it. It worked.", "Done.", "Profiled and tuned."]
+    merged, first, second = ReferenceStats(), ReferenceStats(), ReferenceStats()
+    for i, answer in enumerate(answers):
+        merged.observe('software_engineer', 0, extract_quality_features(answer))
+        (first if i < 2 else second).observe('software_engineer', 0, extract_quality_features(answer))
+    first.merge(second)
+
+    probe = extract_quality_features("A longer answer about tuning the database.")
+    assert first.compare('software_engineer', 0, probe) == merged.compare('software_engineer', 0, probe)
+
+
+def test_read_sample_answers_skips_malformed_records(tmp_path):
+    path = tmp_path / 'samples.json'
+    path.write_text('[{"question_index": 0, "answer": "ok"}, {"answer": "no index"}, "text", '
+                    '{"question_index": "1", "answer": "x"}, {"question_index": 1, "answer": null}]')
+    assert list(read_sample_answers(str(path))) == [('software_engineer', 0, 'ok')]
+    path.write_text('{"not": "a list"}')
+    assert list(read_sample_answers(str(path))) == []
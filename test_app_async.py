@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import sys
+import os
+import asyncio
+import importlib
+import json
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(app_module):
+    return app_module.app
+
+
+@pytest.fixture
+def app_async(app_module):
+    return importlib.import_module('app_async')
+
+
+@pytest.fixture
+def cookie(app):
+    client = app.test_client()
+    client.get('/debug/start_interview_direct')
+    return f"{app.config['SESSION_COOKIE_NAME']}={client.get_cookie('session').value}"
+
+
+def _http(app_async, method, path, body=b'', cookie=None, query=b''):
+    headers = [(b'cookie', cookie.encode())] if cookie else []
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query,
+             'headers': headers, 'client': ('10.0.0.1', 5000)}
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app_async.application(scope, receive, send))
+    return sent[0]['status'], json.loads(sent[1]['body'])
+
+
+def test_bad_answer_bodies_are_rejected(app_async, cookie):
+    assert _http(app_async, 'POST', '/api/interview/answer', b'{}')[0] == 400  # no interview
+    for body in (b'not json', b'[1, 2]', b'"text"', b'{"answer": 5}', b'{"answer": "x", "prefetch": "abc"}'):
+        status, payload = _http(app_async, 'POST', '/api/interview/answer', body, cookie)
+        assert status == 400, body
+        assert 'error' in payload
+    assert _http(app_async, 'GET', '/missing')[0] == 404
+
+
+def test_next_question_validates_prefetch(app_async, cookie):
+    status, payload = _http(app_async, 'GET', '/get_next_question', cookie=cookie, query=b'prefetch=2')
+    assert status == 200
+    assert [q['question_num'] for q in payload['upcoming']] == [1, 2]
+    assert _http(app_async, 'GET', '/get_next_question', cookie=cookie, query=b'prefetch=-1')[0] == 400
+
+
+def _socket(app_async, cookie, frames):
+    incoming = [{'type': 'websocket.connect'}] + [
+        dict(frame, type='websocket.receive') for frame in frames] + [{'type': 'websocket.disconnect'}]
+    sent = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'websocket', 'path': '/ws/interview/transcript', 'headers': [(b'cookie', cookie.encode())],
+             'client': ('10.0.0.2', 5000)}
+    asyncio.run(app_async.application(scope, receive, send))
+    return sent
+
+
+def test_transcript_stream_reports_keywords_covered(app_async, cookie):
+    sent = _socket(app_async, cookie, [{'text': json.dumps({'text': 'We use classes', 'final': True})},
+                                       {'text': json.dumps({'text': 'and inher', 'final': False})},
+                                                  {'text': json.dumps({'text': 'and inheritance', 'final': True})}])
+
+    assert sent[0]['type'] == 'websocket.accept'
+    updates = [json.loads(m['text']) for m in sent[1:]]
+    assert [u['text'] for u in updates] == ['We use classes', 'We use classes and inheritance']
+    assert 'inheritance' in updates[-1]['keywords_found']
+
+
+def test_transcript_stream_rejects_bad_frames_and_caps_the_transcript(app, app_async, cookie, monkeypatch):
+    sent = _socket(app_async, cookie, [{'text': '[1]'}, {'text': '"x"'}, {'text': '{"text": 5, "final": true}'},
+                                       {'text': 'not json'}, {'text': json.dumps({'text': 'classes', 'final': True})}])
+    assert [json.loads(m['text'])['type'] for m in sent[1:]] == ['error'] * 4 + ['transcript']
+
+    monkeypatch.setitem(app.config, 'ASYNC_TRANSCRIPT_MAX_SEGMENTS', 2)
+    sent = _socket(app_async, cookie, [{'text': json.dumps({'text': 'word', 'final': True})}] * 5)
+    assert sent[-1] == {'type': 'websocket.close', 'code': 4413}
+    assert len(sent) == 5  # accept, two transcripts, error, close
+
+    monkeypatch.setitem(app.config, 'ASYNC_MAX_BODY', 4)
+    assert _socket(app_async, cookie, [{'bytes': b'too large'}])[-1] == {'type': 'websocket.close', 'code': 1009}
+
+
+def test_audio_frames_are_rate_limited(app_async, cookie, monkeypatch):
+    transcribed = []
+    monkeypatch.setattr(app_async.speech_processor, 'speech_to_text',
+                        lambda audio: transcribed.append(audio) or 'classes')
+    monkeypatch.setattr(app_async.throttle.rate_limiter, 'limits', {'voice': (0.001, 2)})
+    sent = _socket(app_async, cookie, [{'bytes': b'audio'}] * 4)
+
+    kinds = [json.loads(m['text'])['type'] for m in sent[1:]]
+    assert kinds == ['transcript', 'transcript', 'error', 'error']
+    assert len(transcribed) == 2
+    assert app_async.throttle.admission_controller.in_flight['voice'] == 0
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils import assets
+
+
+def test_minify_js_keeps_multiline_template_literals():
+    source = "function f() {\n    // comment\n    return `a\n    // kept\n\n  b`;\n}\n"
+    assert assets.minify_js(source) == "function f() {\nreturn `a\n    // kept\n\n  b`;\n}"
+
+
+def test_build_keeps_the_previous_build_for_cached_pages(tmp_path, monkeypatch):
+    static = tmp_path / 'static'
+    dist = tmp_path / 'dist'
+    (static / 'js').mkdir(parents=True)
+    monkeypatch.setattr(assets, 'BUNDLES', {'app.js': ['js/app.js']})
+
+    builds = []
+    for version in ('one', 'two', 'three'):
+        (static / 'js' / 'app.js').write_text(f"console.log('{version}');\n")
+        builds.append(assets.build_assets(str(static), str(dist))['app.js'])
+
+    files = set(os.listdir(dist))
+    assert builds[0] not in files
+    assert {builds[1], builds[2], builds[2] + '.gz', 'manifest.json'} <= files
+    assert not any(name.startswith('.build-') for name in files)
+    assert json.loads((dist / 'manifest.json').read_text()) == {'app.js': builds[2]}
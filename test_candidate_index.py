@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.candidate_index import CandidateIndex
+
+SKILLS = {'programming': ['python', 'java'], 'cloud': ['aws', 'docker']}
+
+
+def _analysis(skills, overall):
+    return {'skills': skills, 'word_count': 300, 'scores': {'overall_score': overall}}
+
+
+def test_top_k_ranks_by_skill_match_and_survives_reload(tmp_path):
+    index = CandidateIndex(SKILLS, str(tmp_path))
+    index.add('a.pdf', _analysis({'programming': ['Python', 'Java'], 'cloud': ['Aws']}, 5))
+    index.add('b.pdf', _analysis({'programming': ['Python']}, 9))
+    index.add('c.pdf', _analysis({'cloud': ['Docker']}, 1))
+
+    top = index.top_k({'programming': ['Python', 'Java']}, k=2)
+    assert [c['candidate'] for c in top] == ['a.pdf', 'b.pdf']
+    assert top[0]['matched_skills'] == ['python', 'java']
+    assert len(index.top_k({'cloud': ['Aws']}, k=0)) == 1
+
+    reopened = CandidateIndex(SKILLS, str(tmp_path))
+    assert reopened.count == 3
+    assert reopened.top_k({'cloud': ['Docker']}, k=1)[0]['candidate'] == 'c.pdf'
+
+
+def test_workers_see_rows_appended_past_a_grow(tmp_path):
+    first = CandidateIndex(SKILLS, str(tmp_path), initial_capacity=2)
+    second = CandidateIndex(SKILLS, str(tmp_path), initial_capacity=2)
+    first.add('a.pdf', _analysis({'programming': ['Python']}, 5))
+    first.add('b.pdf', _analysis({'programming': ['Java']}, 5))
+    first.add('c.pdf', _analysis({'cloud': ['Aws']}, 5))  # grows and replaces the files
+    second.add('d.pdf', _analysis({'cloud': ['Docker']}, 5))
+
+    assert first.capacity == second.capacity == 4
+    assert [c['candidate'] for c in first.top_k({'cloud': ['Docker']}, k=1)] == ['d.pdf']
+    assert CandidateIndex(SKILLS, str(tmp_path)).ids == ['a.pdf', 'b.pdf', 'c.pdf', 'd.pdf']
+
+
+def test_changed_vocabulary_rebuilds_rows_from_stored_analyses(tmp_path):
+    index = CandidateIndex(SKILLS, str(tmp_path))
+    index.add('a.pdf', _analysis({'programming': ['Python', 'Go']}, 7))
+
+    wider = CandidateIndex({'programming': ['python', 'go'], 'cloud': ['aws']}, str(tmp_path))
+    assert wider.ids == ['a.pdf']
+    top = wider.top_k({'programming': ['Go']}, k=1)
+    assert top[0]['skill_match'] == 1.0
+    assert top[0]['scores']['overall_score'] == 7.0
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+import sys
+import os
+import io
+import zipfile
+import pytest
+from docx import Document
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.docx_text import extract_docx_text, iter_docx_paragraphs
+
+
+def _docx():
+    doc = Document()
+    doc.add_paragraph('Jane Doe')
+    run = doc.add_paragraph().add_run('Python\tDjango')
+    run.add_break()
+    run.add_text('AWS')
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = 'Acme Corp'
+    table.cell(0, 1).text = '2018 - 2022'
+    doc.add_paragraph('References on request')
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def test_paragraphs_tables_tabs_and_breaks():
+    data = _docx()
+    assert list(iter_docx_paragraphs(io.BytesIO(data))) == [
+        'Jane Doe', 'Python\tDjango\nAWS', 'Acme Corp', '2018 - 2022', 'References on request'
+    ]
+    assert extract_docx_text(io.BytesIO(data)).startswith('Jane Doe\nPython\tDjango\nAWS\nAcme Corp\n')
+
+
+def test_falls_back_to_python_docx_when_document_xml_is_elsewhere():
+    # Some generators name the main part differently; python-docx follows the relationships
+    source = zipfile.ZipFile(io.BytesIO(_docx()))
+    moved = io.BytesIO()
+    with zipfile.ZipFile(moved, 'w') as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename in ('[Content_Types].xml', '_rels/.rels'):
+                data = data.replace(b'word/document.xml', b'word/main.xml')
+            target.writestr(item.filename.replace('word/document.xml', 'word/main.xml'), data)
+
+    text = extract_docx_text(moved)
+    # python-docx reads only top-level paragraphs, so the table is missing here
+    assert text == 'Jane Doe\nPython\tDjango\nAWS\nReferences on request\n'
+
+
+def test_bad_zip_is_not_a_docx():
+    with pytest.raises(zipfile.BadZipFile):
+        extract_docx_text(io.BytesIO(b'not a zip file'))
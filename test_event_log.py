@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.event_log import EventLog, compact, list_segments, read_events, replay_results
+from models.results_store import ResultsStore
+
+
+def test_event_log_rotates_compacts_and_replays(tmp_path):
+    folder = str(tmp_path / 'events')
+    log = EventLog(folder, segment_bytes=200, fsync_interval=0.01)
+    for n in range(5):
+        interview_id = f'interview-{n}'
+        assert log.append('start', interview_id, job_role='software_engineer')
+        log.append('answer', interview_id, question_index=0, answer='I used inheritance')
+        log.append('score', interview_id, question_index=0, score=float(n))
+        log.append('finish', interview_id, job_role='software_engineer')
+        log.flush()
+    log.close()
+
+    assert len(list_segments(folder)) > 2
+    events = list(read_events(folder))
+    assert len(events) == 20
+    assert [e['type'] for e in events[:4]] == ['start', 'answer', 'score', 'finish']
+
+    assert compact(folder, segment_bytes=1024 * 1024) > 0
+    assert len(list_segments(folder)) == 2
+    assert list(read_events(folder)) == events
+
+    store = ResultsStore(str(tmp_path / 'results'))
+    assert replay_results(folder, store) == 5
+    assert store.cohort('software_engineer', 'interview-4')['candidate']['rank'] == 1
+
+
+def test_unserializable_event_is_dropped_without_stopping_the_writer(tmp_path):
+    folder = str(tmp_path / 'events')
+    log = EventLog(folder, fsync_interval=0.01)
+    log.append('answer', 'a', tags={'set', 'of', 'tags'})
+    log.append('answer', 'b', question_index=0)
+    log.flush()
+    log.close()
+
+    assert log.dropped == 1
+    assert [e['interview_id'] for e in read_events(folder)] == ['b']
+
+
+def test_compaction_skips_segments_other_writers_still_append_to(tmp_path):
+    folder = str(tmp_path / 'events')
+    first = EventLog(folder, fsync_interval=0.01)  # stays on segment 1
+    for n in range(3):
+        first.append('start', f'first-{n}', job_role='software_engineer')
+    first.flush()
+
+    second = EventLog(folder, segment_bytes=150, fsync_interval=0.01)
+    for n in range(12):
+        second.append('start', f'second-{n}', job_role='software_engineer')
+        second.flush()
+    assert len(list_segments(folder)) > 3
+
+    compact(folder, segment_bytes=1024 * 1024)
+    first.append('finish', 'first-0')
+    first.flush()
+    first.close()
+    second.close()
+
+    ids = [e['interview_id'] for e in read_events(folder)]
+    assert sorted(ids) == sorted([f'first-{n}' for n in range(3)] + ['first-0']
+                                 + [f'second-{n}' for n in range(12)])
+
+
+def test_replay_keeps_tenant_interviews_out_of_the_global_cohort(tmp_path):
+    folder = str(tmp_path / 'events')
+    log = EventLog(folder, fsync_interval=0.01)
+    for interview_id, tenant in (('global', None), ('acme', 'acme')):
+        log.append('start', interview_id, job_role='support', tenant=tenant)
+        log.append('score', interview_id, question_index=0, score=5.0)
+        log.append('finish', interview_id, job_role='support')
+    log.close()
+
+    store = ResultsStore(str(tmp_path / 'results'))
+    assert replay_results(folder, store) == 2
+    assert store.cohort('support')['candidates'] == 1
+    assert store.cohort('support', tenant='acme')['candidates'] == 1
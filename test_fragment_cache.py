@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask
+from utils.fragment_cache import FragmentCache
+
+
+def test_lru_eviction_and_results_version_keys():
+    cache = FragmentCache(max_entries=2)
+    cache.set(('results', 'a', 0), 'a0')
+    cache.set(('results', 'b', 0), 'b0')
+    assert cache.get(('results', 'a', 0)) == 'a0'  # now most recently used
+    cache.set(('results', 'c', 0), 'c0')
+
+    assert cache.get(('results', 'b', 0)) is None
+    assert cache.get(('results', 'a', 0)) == 'a0'
+    # Another answer bumps results_version, so the old page is never served
+    assert cache.get(('results', 'a', 1)) is None
+    assert cache.stats() == {'entries': 2, 'hits': 2, 'misses': 2, 'hit_rate': 0.5}
+
+
+def test_render_only_renders_on_a_miss(tmp_path):
+    (tmp_path / 'page.html').write_text('{{ value }}')
+    app = Flask(__name__, template_folder=str(tmp_path))
+    cache = FragmentCache()
+    with app.app_context():
+        assert cache.render(('page', 1), 'page.html', value='first') == 'first'
+        assert cache.render(('page', 1), 'page.html', value='second') == 'first'
+        assert cache.render(('page', 2), 'page.html', value='second') == 'second'
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import sys
+import os
+import nltk
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _has_punkt():
+    try:
+        nltk.data.find('tokenizers/punkt')
+        return True
+    except LookupError:
+        return False
+
+
+@pytest.fixture
+def app(app_module):
+    return app_module.app
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    client.get('/debug/start_interview_direct')
+    return client
+
+
+def test_next_question_prefetches_upcoming_questions(client):
+    payload = client.get('/get_next_question?prefetch=2').get_json()
+    assert payload['question_num'] == 1
+    assert [q['question_num'] for q in payload['upcoming']] == [1, 2]
+    assert len(client.get('/get_next_question?prefetch=all').get_json()['upcoming']) == payload['total_questions']
+    assert 'upcoming' not in client.get('/get_next_question').get_json()
+
+
+def test_bad_prefetch_is_rejected_before_the_answer_is_scored(client):
+    assert client.get('/get_next_question?prefetch=abc').status_code == 400
+    for prefetch in ('abc', -1, [2]):
+        response = client.post('/api/interview/answer', json={'answer': 'Classes', 'prefetch': prefetch})
+        assert response.status_code == 400
+    assert client.post('/api/interview/answer', json={'answer': 5}).status_code == 400
+    assert client.get('/get_next_question').get_json()['question_num'] == 1
+
+
+@pytest.mark.skipif(not _has_punkt(), reason="NLTK punkt tokenizer data is not installed")
+def test_answer_api_scores_and_returns_the_next_questions(client):
+    response = client.post('/api/interview/answer', json={
+        'answer': 'Encapsulation, inheritance and polymorphism organise classes and objects.',
+        'prefetch': 2
+    })
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['next_question'] == 1 and not data['completed']
+    assert 0 <= data['score'] <= 10
+    assert [q['question_num'] for q in data['upcoming']] == [2, 3]
+
+
+def test_cohort_rejects_bad_bins(client):
+    for bins in ('0', '-1', 'many'):
+        assert client.get(f'/cohort?bins={bins}').status_code == 400
+    assert client.get('/cohort?bins=100000').status_code == 200
+
+
+def test_top_candidates_rejects_bad_bodies(app):
+    client = app.test_client()
+    for body in ([1], 'text', {'job_description': 5}, {'job_description': 'Python', 'k': 'many'}):
+        assert client.post('/candidates/top', json=body).status_code == 400
+    assert client.post('/candidates/top', data={'job_description': ' '}).status_code == 400
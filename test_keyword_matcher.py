@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.ai_interviewer import AIInterviewer
+from models.keyword_matcher import KeywordMatcher, SynonymTable
+
+
+def test_semantic_matcher_expands_synonyms_and_stems(tmp_path):
+    table = SynonymTable('data/questions/synonyms.json', cache_file=str(tmp_path / 'synonyms.pickle'))
+    matcher = KeywordMatcher(["encapsulation", "inheritance", "classes", "unit tests"], table)
+
+    assert matcher.match("A Dog inherits from Animal in OOP") == {1, 2}
+    assert matcher.match("I write unit testing suites and hide data with encapsulated fields") == {0, 3}
+    assert matcher.match("Nothing relevant here") == set()
+
+    # The second load comes from the pickled tables
+    assert SynonymTable('data/questions/synonyms.json', cache_file=str(tmp_path / 'synonyms.pickle')).expansions == table.expansions
+
+
+def test_semantic_scoring_mode_finds_more_keywords():
+    answer = "OOP means a subclass inherits behaviour and overrides methods."
+    exact = AIInterviewer()
+    semantic = AIInterviewer(scoring_mode='semantic')
+
+    assert exact._find_keywords('software_engineer', 0, answer, exact.questions['software_engineer'][0]['keywords']) == []
+    found = semantic._find_keywords('software_engineer', 0, answer, semantic.questions['software_engineer'][0]['keywords'])
+    assert found == ['inheritance', 'polymorphism', 'classes', 'objects']
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import sys
+import os
+import threading
+import time
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.profiler import RequestProfiler
+
+
+def slow_tokenize():
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_samples_are_written_per_route_and_summarized(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), token='secret', interval=0.001)
+    assert profiler.should_profile({'X-Profile': 'secret'})
+    assert not profiler.should_profile({'X-Profile': 'wrong'})
+
+    for _ in range(2):
+        profiler.start()
+        slow_tokenize()
+        profiler.stop('submit_answer')
+
+    summary = profiler.summary()
+    assert summary['routes'] == {'submit_answer': summary['samples']}
+    assert summary['self'][0]['function'] == 'test_profiler.py:slow_tokenize'
+    assert profiler.folded().startswith('submit_answer;')
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in profiler.folded().splitlines())
+
+
+def test_folded_files_are_capped_by_merging_stacks(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), max_bytes=400)
+    path = tmp_path / 'route.folded'
+    for i in range(20):
+        profiler.sampler._targets[threading.get_ident()] = Counter({f'a.py:f;b.py:g{i % 4}': 1, 'a.py:f': 3})
+        profiler.stop('route')
+
+    assert path.stat().st_size <= 400
+    folded = profiler._read_file(str(path))
+    assert folded['a.py:f'] > 3
+    assert profiler.summary()['routes']['route'] == sum(folded.values())
+
+
+def test_profile_endpoint_needs_a_configured_token(app_module, monkeypatch):
+    client = app_module.app.test_client()
+    monkeypatch.setattr(app_module.profiler, 'token', None)
+    assert client.get('/debug/profile').status_code == 404
+    monkeypatch.setattr(app_module.profiler, 'token', 'secret')
+    assert client.get('/debug/profile', headers={'X-Profile': 'wrong'}).status_code == 404
+    assert client.get('/debug/profile', headers={'X-Profile': 'sécret'}).status_code == 404
+    assert client.get('/debug/profile', headers={'X-Profile': 'secret'}).status_code == 200
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.question_bank import QuestionBankRegistry
+from models.ai_interviewer import AIInterviewer
+
+
+def write_bank(folder, tenant, roles):
+    os.makedirs(folder / tenant, exist_ok=True)
+    with open(folder / tenant / 'interview_questions.json', 'w') as f:
+        json.dump(roles, f)
+
+
+def test_banks_are_compiled_lazily_and_least_recently_used_is_dropped(tmp_path):
+    for tenant in ('acme', 'globex', 'initech'):
+        write_bank(tmp_path, tenant, {f'{tenant}_engineer': [{'question': f'Why {tenant}?', 'keywords': ['é']}]})
+    registry = QuestionBankRegistry(str(tmp_path), max_loaded=2)
+
+    assert registry.tenants() == ['acme', 'globex', 'initech']
+    assert not (tmp_path / 'acme' / 'interview_questions.qbank').exists()
+
+    assert registry.get('acme').get_questions('acme_engineer') == [{'question': 'Why acme?', 'keywords': ['é']}]
+    registry.get('globex')
+    registry.get('acme')
+    registry.get('initech')
+    assert registry.stats() == {'loaded': ['acme', 'initech'], 'loads': 3, 'evictions': 1}
+
+
+def test_bank_is_recompiled_when_its_json_changes(tmp_path):
+    write_bank(tmp_path, 'acme', {'support': [{'question': 'Old?'}]})
+    registry = QuestionBankRegistry(str(tmp_path))
+    bank = registry.get('acme')
+    assert bank.get_question('support', 1) is None
+
+    write_bank(tmp_path, 'acme', {'support': [{'question': 'Old?'}, {'question': 'New?'}]})
+    os.utime(tmp_path / 'acme' / 'interview_questions.json', ns=(0, bank.source_stamp[0] + 10 ** 9))
+    assert registry.get('acme').get_question('support', 1) == {'question': 'New?'}
+
+    # A JSON copied in with an older mtime than the index is recompiled as well
+    write_bank(tmp_path, 'acme', {'support': [{'question': 'Restored?'}]})
+    os.utime(tmp_path / 'acme' / 'interview_questions.json', ns=(0, 10 ** 9))
+    assert QuestionBankRegistry(str(tmp_path)).get('acme').get_questions('support') == [{'question': 'Restored?'}]
+    assert registry.get('acme').get_question('support', 1) is None
+
+    assert not registry.has('../acme')
+
+
+def test_empty_bank_has_no_questions(tmp_path):
+    write_bank(tmp_path, 'acme', {})
+    interviewer = AIInterviewer(scoring_mode='semantic', reference_file=str(tmp_path / 'none.json'),
+                                tenants_folder=str(tmp_path), memo_size=0)
+    assert interviewer.get_questions('support', 'acme') == []
+    assert interviewer.question_banks.get('acme').default_role('support') is None
+
+
+def test_tenant_keyword_matchers_are_cached_per_bank(tmp_path):
+    write_bank(tmp_path, 'acme', {'support': [{'question': 'How do you triage?', 'keywords': ['priority']}]})
+    interviewer = AIInterviewer(scoring_mode='semantic', reference_file=str(tmp_path / 'none.json'),
+                                tenants_folder=str(tmp_path), memo_size=0)
+    assert interviewer._find_keywords('support', 0, 'By priority', ['priority'], 'acme') == ['priority']
+    matcher = interviewer.question_banks.get('acme').matchers[('support', 0)]
+    interviewer._find_keywords('support', 0, 'No idea', ['priority'], 'acme')
+    assert interviewer.question_banks.get('acme').matchers[('support', 0)] is matcher
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import sys
+import os
+import pytest
+from flask import Flask, session
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils import rate_limiter
+from utils.rate_limiter import (AdmissionController, MemoryRateLimitBackend, RateLimiter, RequestThrottle,
+                                SQLiteRateLimitBackend)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    time = monotonic
+
+
+@pytest.mark.parametrize('backend', ['memory', 'sqlite'])
+def test_burst_then_refill(backend, tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', clock)
+    store = (MemoryRateLimitBackend() if backend == 'memory'
+             else SQLiteRateLimitBackend(str(tmp_path / 'limits.sqlite3')))
+
+    assert [store.take('client', 1.0, 3)[0] for _ in range(4)] == [True, True, True, False]
+    assert store.take('client', 1.0, 3) == (False, 1.0)
+    assert store.take('other', 1.0, 3)[0]
+
+    clock.now += 2.5  # refills two and a half tokens, never more than the burst
+    assert [store.take('client', 1.0, 3)[0] for _ in range(3)] == [True, True, False]
+    clock.now += 100
+    assert [store.take('client', 1.0, 3)[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_memory_backend_forgets_least_recently_used_clients():
+    store = MemoryRateLimitBackend(max_keys=2)
+    store.take('a', 1.0, 1)
+    store.take('b', 1.0, 1)
+    store.take('a', 1.0, 1)
+    store.take('c', 1.0, 1)
+    assert list(store._buckets) == ['a', 'c']
+
+
+def test_admission_sheds_low_priority_work_first():
+    admission = AdmissionController({'answer': (3, 'high'), 'resume': (2, 'low')}, shed_low_priority_at=2)
+    assert admission.try_acquire('resume')
+    assert admission.try_acquire('answer')
+    assert not admission.try_acquire('resume')  # two requests in flight
+    assert admission.try_acquire('answer')
+    assert admission.try_acquire('answer')
+    assert not admission.try_acquire('answer')  # class limit
+    admission.release('answer')
+    assert admission.stats() == {'in_flight': {'answer': 2, 'resume': 1}, 'rejected': {'answer': 1, 'resume': 1}}
+
+
+def test_buckets_follow_the_client_across_interviews():
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    throttle = RequestThrottle(RateLimiter({'answer': (0.001, 2)}), AdmissionController({}))
+
+    @app.route('/start/<interview_id>')
+    def start(interview_id):
+        session.clear()
+        session['interview_id'] = interview_id
+        return 'started'
+
+    @app.route('/answer', methods=['POST'])
+    @throttle.limit('answer')
+    def answer():
+        return 'ok'
+
+    client = app.test_client()
+    client.get('/start/first')
+    assert [client.post('/answer').status_code for _ in range(2)] == [200, 200]
+    client.get('/start/second')
+    response = client.post('/answer')
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
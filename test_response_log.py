@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models import response_log
+from models.response_log import ResponseLog, feedback_part
+
+
+def test_feedback_text_is_rebuilt_from_template_ids():
+    state = {'responses': ResponseLog.new()}
+    questions = [{'question': 'Explain polymorphism.'}, {'question': 'Describe a conflict at work.'}]
+    responses = ResponseLog.from_session(state)
+    responses.append(0, 'It lets one interface...', 8.5, [response_log.EXCELLENT])
+    responses.append(1, 'Um, we, um, talked.', 2.0, [feedback_part(response_log.MISSING_KEYWORDS, 'conflict, team'),
+                                                     response_log.NOTE_FILLERS])
+
+    first, second = responses.records(questions)
+    assert first.question == 'Explain polymorphism.'
+    assert first.feedback == ("Excellent! Excellent answer! You covered the key points clearly and thoroughly. "
+                              "That was a well-structured response.")
+    assert second.feedback == ("I see. Try to include concepts like: conflict, team. Try to cut down on filler words. "
+                               "We'll practice more on this area.")
+    assert responses.scored() == [{'question_index': 0, 'score': 8.5}, {'question_index': 1, 'score': 2.0}]
+
+
+def test_sessions_with_response_dicts_are_converted():
+    state = {'responses': [{'question_index': 0, 'question': 'Q?', 'answer': 'A.', 'score': 5,
+                            'feedback': 'Okay. Fine.', 'detailed_analysis': {}}]}
+    responses = ResponseLog.from_session(state)
+
+    assert state['responses'] == {'question': [0], 'answer': ['A.'], 'score': [5], 'feedback': ['Okay. Fine.']}
+    assert [r.feedback for r in responses.records([{'question': 'Q?'}])] == ['Okay. Fine.']
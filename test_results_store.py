@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.results_store import ResultsStore
+
+
+def _responses(scores):
+    return [{'question_index': i, 'score': score} for i, score in enumerate(scores)]
+
+
+def test_cohort_ranks_candidates(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    assert store.record_interview('a', 'software_engineer', _responses([8, 9, 10]))
+    assert store.record_interview('b', 'software_engineer', _responses([2, 3, 4]))
+    assert store.record_interview('c', 'data_scientist', _responses([5, 5]))
+    assert not store.record_interview('a', 'software_engineer', _responses([1]))
+
+    cohort = store.cohort('software_engineer', 'b')
+    assert cohort['candidates'] == 2
+    assert cohort['answers'] == 6
+    assert cohort['candidate']['rank'] == 2
+    assert cohort['questions']['0']['percentiles']['p50'] == 5.0
+    assert sum(cohort['distribution']['counts']) == 2
+
+    # Reopening the store reads the same columns back from disk
+    reopened = ResultsStore(str(tmp_path))
+    assert reopened.answer_count() == 8
+    assert reopened.cohort('software_engineer', 'a')['candidate']['rank'] == 1
+    assert reopened.cohort('product_manager')['candidates'] == 0
+
+
+def test_workers_share_interview_indexes_and_see_each_others_rows(tmp_path):
+    first = ResultsStore(str(tmp_path))
+    second = ResultsStore(str(tmp_path))
+    assert first.cohort('software_engineer')['candidates'] == 0
+
+    assert first.record_interview('a', 'software_engineer', _responses([8, 8]))
+    assert second.record_interview('b', 'software_engineer', _responses([4, 4]))
+    assert not first.record_interview('b', 'software_engineer', _responses([1]))
+
+    # Both workers read both interviews, with distinct indexes
+    for store in (first, second):
+        cohort = store.cohort('software_engineer', 'b')
+        assert cohort['candidates'] == 2
+        assert cohort['candidate']['rank'] == 2
+
+
+def test_tenant_roles_are_kept_apart(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    store.record_interview('a', 'software_engineer', _responses([9]))
+    store.record_interview('b', 'software_engineer', _responses([3]), tenant='acme')
+
+    assert store.cohort('software_engineer')['candidates'] == 1
+    assert store.cohort('software_engineer', tenant='acme')['mean_percentage'] == 30.0
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.resume_dedup import ResumeDeduplicator
+
+RESUME = ("Jane Doe senior engineer with eight years of python django and aws experience, "
+          "led a team of five and shipped a search platform used by millions of people")
+
+
+def test_duplicates_reuse_only_current_analyses_and_see_other_workers(tmp_path):
+    first = ResumeDeduplicator(str(tmp_path), analysis_version='1/a')
+    second = ResumeDeduplicator(str(tmp_path), analysis_version='1/a')
+    signature = first.signature(RESUME)
+    assert second.find_duplicate(signature) is None
+
+    first.add('jane.pdf', signature, {'word_count': 30})
+    revised = second.signature(RESUME + " and kubernetes")
+    match = second.find_duplicate(revised)
+    assert match['resume'] == 'jane.pdf'
+    assert match['analysis'] == {'word_count': 30}
+
+    # A newer analyzer still sees the duplicate but never reuses its old analysis
+    upgraded = ResumeDeduplicator(str(tmp_path), analysis_version='2/a')
+    assert upgraded.find_duplicates(signature)[0]['resume'] == 'jane.pdf'
+    assert upgraded.find_duplicate(signature) is None
+    upgraded.add('jane-v2.pdf', signature, {'word_count': 31})
+    assert upgraded.find_duplicate(signature)['analysis'] == {'word_count': 31}
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+import sys
+import os
+import json
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.candidate_index import CandidateIndex
+from models.resume_scoring import LinearResumeScorer, ResumeFeatureExtractor
+
+CATEGORIES = {'programming': ['python', 'java'], 'cloud': ['aws']}
+ANALYSIS = {
+    'skills': {'programming': ['Python', 'Java'], 'cloud': ['Aws']},
+    'experience': {'years': '4.5'},
+    'education': {'degrees': ['Bachelor']},
+    'word_count': 250,
+}
+
+
+def test_feature_extractor_vectorizes_an_analysis():
+    extractor = ResumeFeatureExtractor(CATEGORIES)
+    assert extractor.feature_names == ['skills_programming', 'skills_cloud', 'total_skills', 'years_experience',
+                                       'degree_count', 'word_count_hundreds']
+    assert extractor.extract(ANALYSIS).tolist() == [2, 1, 3, 4.5, 1, 2.5]
+    assert extractor.extract({'experience': {'years': 'Not specified'}}).tolist() == [0] * 6
+    assert extractor.extract_batch([ANALYSIS, {}]).shape == (2, 6)
+
+
+def test_default_weights_score_like_the_old_rules_and_batch_matches_single():
+    extractor = ResumeFeatureExtractor(CATEGORIES)
+    scorer = LinearResumeScorer(extractor.feature_names)
+    assert scorer.score(extractor.extract(ANALYSIS)) == {
+        'skills_score': 1.5, 'experience_score': 4.5, 'education_score': 3.0, 'overall_score': 3.0
+    }
+
+    features = np.array([[0, 0, 40, 20, 5, 0], [0, 0, 0, 0, 0, 0]], dtype=np.float32)
+    scores = scorer.score_batch(features)
+    assert scores.tolist() == [[10, 10, 10, 10], [0, 0, 0, 0]]  # clipped to 0-10
+
+
+def test_weights_file_is_keyed_by_feature_name(tmp_path):
+    extractor = ResumeFeatureExtractor(CATEGORIES)
+    weights_file = tmp_path / 'weights.json'
+    weights_file.write_text(json.dumps({
+        'weights': {'skills_score': {'skills_cloud': 2.0, 'retired_feature': 9.0}},
+        'bias': {'education_score': 1.0}
+    }))
+    scorer = LinearResumeScorer(extractor.feature_names, str(weights_file))
+    default = LinearResumeScorer(extractor.feature_names)
+    assert scorer.score(extractor.extract(ANALYSIS))['skills_score'] == 2.0
+    assert scorer.score(extractor.extract(ANALYSIS))['education_score'] == 1.0
+    assert scorer.fingerprint != default.fingerprint
+
+    missing = LinearResumeScorer(extractor.feature_names, str(tmp_path / 'missing.json'))
+    assert missing.fingerprint == default.fingerprint
+
+
+def test_new_features_are_filled_in_for_indexed_candidates(tmp_path):
+    index = CandidateIndex(CATEGORIES, str(tmp_path))
+    index.add('a.pdf', dict(ANALYSIS, scores={'overall_score': 6}))
+
+    class WithSeniority(ResumeFeatureExtractor):
+        def __init__(self, categories):
+            super().__init__(categories)
+            self.feature_names.append('senior')
+            self.width += 1
+
+        def extract(self, analysis):
+            return np.append(super().extract(analysis), float(analysis['experience']['years']) >= 4)
+
+    upgraded = CandidateIndex(CATEGORIES, str(tmp_path), feature_extractor=WithSeniority(CATEGORIES))
+    assert upgraded.ids == ['a.pdf']
+    assert upgraded.feature_matrix[0].tolist() == [2, 1, 3, 4.5, 1, 2.5, 1]
+    assert upgraded.score_matrix[0, 3] == 6
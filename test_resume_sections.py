@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import sys
+import os
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.resume_analyzer import ResumeAnalyzer
+from models.resume_incremental import IncrementalResumeAnalyzer
+from models.resume_sections import SectionIndex, employment_months
+
+RESUME = """Jane Roe
+Engineer with 3 years of experience. Master of mentoring.
+
+Experience
+Acme Corp, Jan 2018 - Present
+Initech, 03/2015 - 06/2018
+
+Education
+Bachelor of Science, 2011 - 2015
+
+Skills: Python, PostgreSQL
+"""
+
+
+def test_segment_records_offsets_per_section():
+    index = SectionIndex.segment(RESUME)
+    assert [name for name, _, _ in index.spans] == ['summary', 'experience', 'education', 'skills']
+    start, end = index.ranges('skills')[0]
+    assert RESUME[start:end].strip() == 'Python, PostgreSQL'
+    assert SectionIndex.segment("no headings here").ranges('education') == [(0, 16)]
+
+
+def test_overlapping_employment_ranges_are_counted_once():
+    months, positions = employment_months(SectionIndex.segment(RESUME), today=date(2020, 1, 15))
+    # Mar 2015 through Jan 2020; the education dates are not employment
+    assert (months, positions) == (59, 2)
+
+
+def test_extractors_only_scan_their_own_section():
+    analysis = ResumeAnalyzer().analyze_resume_text(RESUME)
+    assert analysis['education']['degrees'] == ['Bachelor']
+    assert analysis['skills']['programming'] == ['Python']
+    assert analysis['experience']['positions'] == 2
+
+
+def test_revised_resume_reanalyzes_only_changed_paragraphs():
+    analyzer = ResumeAnalyzer()
+    revisions = IncrementalResumeAnalyzer(analyzer)
+    assert revisions.analyze(RESUME, 'v1') == analyzer.analyze_resume_text(RESUME)
+    revised = RESUME.replace('Python', 'Python, Kubernetes', 1)
+
+    analysis = revisions.analyze(revised, 'v2', previous_id='v1')
+    assert analysis == analyzer.analyze_resume_text(revised)
+    assert analysis['skills']['cloud'] == ['Kubernetes']
+    # Only the skills line changed: two experience lines, the degree line and
+    # the experience stage are reused
+    stats = revisions.stats()
+    assert (stats['paragraphs_reused'], stats['paragraphs_analyzed']) == (4, 5 + 1)
+
+
+def test_matches_spanning_a_line_break_survive_revisions():
+    resume = RESUME.replace('Acme Corp, Jan 2018 - Present', 'Engineer, Acme Jan 2018 -\nDec 2021')
+    analyzer = ResumeAnalyzer()
+    revisions = IncrementalResumeAnalyzer(analyzer)
+
+    first = revisions.analyze(resume, 'v1')
+    assert first['experience'] == analyzer.analyze_resume_text(resume)['experience']
+    assert first['experience']['positions'] == 2
+
+    revised = resume.replace('Skills: Python', 'Skills: Python, Docker')
+    assert revisions.analyze(revised, 'v2', previous_id='v1')['experience'] == first['experience']
+    moved = revised.replace('Initech, 03/2015 - 06/2018', 'Initech, 03/2015 -\n06/2018')
+    assert revisions.analyze(moved, 'v3', previous_id='v2') == analyzer.analyze_resume_text(moved)
+
+
+def test_revision_tables_are_capped_by_size():
+    revisions = IncrementalResumeAnalyzer(ResumeAnalyzer(), max_bytes=1500)
+    for i in range(10):
+        revisions.analyze(RESUME + f'Projects\nTool {i}\n', f'v{i}')
+    stats = revisions.stats()
+    assert stats['bytes'] <= 1500
+    assert 1 <= stats['resumes'] < 10
+    assert revisions.has('v9') and not revisions.has('v0')
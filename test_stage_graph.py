@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.stage_graph import StageGraph
+
+
+def test_independent_stages_overlap_and_slow_ones_time_out():
+    both_started = threading.Barrier(2, timeout=2)
+    release = threading.Event()
+
+    def skills(sections):
+        both_started.wait()  # raises unless education runs at the same time
+        return f'skills from {sections}'
+
+    def education(sections):
+        both_started.wait()
+        return 'education'
+
+    graph = StageGraph()
+    graph.add('sections', lambda: 'sections')
+    graph.add('skills', skills, deps=('sections',))
+    graph.add('education', education, deps=('sections',))
+    graph.add('experience', lambda sections: release.wait(), deps=('sections',), timeout=0.05, default=dict)
+    graph.add('scores', lambda skills, experience: (skills, experience), deps=('skills', 'experience'))
+
+    with ThreadPoolExecutor(4) as pool:
+        results, timed_out = graph.run(pool)
+        release.set()
+
+    assert timed_out == ['experience']
+    assert results['scores'] == ('skills from sections', {})
+    assert results['education'] == 'education'
+
+
+def test_time_queued_behind_other_requests_does_not_count():
+    release = threading.Event()
+    graph = StageGraph()
+    graph.add('quick', lambda: 'done', timeout=0.05, default=lambda: 'timed out')
+
+    with ThreadPoolExecutor(1) as pool:
+        pool.submit(release.wait, 0.2)  # another request holds the only thread
+        results, timed_out = graph.run(pool)
+
+    assert (results, timed_out) == ({'quick': 'done'}, [])
+
+
+def test_without_an_executor_stages_run_inline_in_order():
+    order = []
+    graph = StageGraph().add('a', lambda: order.append('a') or 1)
+    graph.add('b', lambda a: order.append('b') or a + 1, deps=('a',), timeout=0.001)
+
+    assert graph.run() == ({'a': 1, 'b': 2}, [])
+    assert order == ['a', 'b']
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.question_bank import QuestionBankRegistry
+from models.resume_analyzer import ResumeAnalyzer
+from utils.synthetic_data import WRITERS, SyntheticDataGenerator
+
+
+def test_resumes_are_reproducible_in_every_format(tmp_path):
+    analyzer = ResumeAnalyzer()
+    generator = SyntheticDataGenerator(seed=3, skill_categories=analyzer.skill_categories,
+                                       category_rates={'cloud': 1.0})
+    assert generator.resume(5) == SyntheticDataGenerator(seed=3, category_rates={'cloud': 1.0}).resume(5)
+
+    for i, extension in enumerate(WRITERS):
+        text, truth = generator.resume(i)
+        path = str(tmp_path / f'resume.{extension}')
+        WRITERS[extension](path, text)
+        analysis = analyzer.analyze_resume_text(analyzer.parse_resume(path))
+
+        found = {skill.lower() for skills in analysis['skills'].values() for skill in skills}
+        assert set(truth['skills']['cloud']) <= found
+        assert analysis['experience']['positions'] == truth['positions']
+
+
+def test_question_banks_load_as_tenant_banks(tmp_path):
+    generator = SyntheticDataGenerator(seed=1)
+    bank = generator.question_bank(['software_engineer'], per_role=2000)
+    os.makedirs(tmp_path / 'synthetic')
+    with open(tmp_path / 'synthetic' / 'interview_questions.json', 'w') as f:
+        json.dump(bank, f)
+
+    loaded = QuestionBankRegistry(str(tmp_path)).get('synthetic')
+    assert loaded.get_question('software_engineer', 1999) == bank['software_engineer'][1999]
+
+    question = bank['software_engineer'][0]
+    answer = generator.answer(question, words=60, keyword_rate=1.0)
+    assert len(answer.split()) >= 60
+    assert all(keyword in answer for keyword in question['keywords'])
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.tts_cache import StubTTSEngine, TTSCache, create_engine
+
+
+def test_audio_is_rendered_once_per_text_and_voice(tmp_path):
+    cache = TTSCache(str(tmp_path), StubTTSEngine())
+    key = cache.render("Describe a challenging problem you solved.")
+
+    assert cache.render("Describe a challenging problem you solved.") == key
+    assert cache.rendered == 1
+    assert os.path.getsize(cache.path(key)) > 44  # WAV header plus samples
+
+    other_voice = TTSCache(str(tmp_path), StubTTSEngine(), voice='en-gb')
+    assert other_voice.key("Describe a challenging problem you solved.") != key
+
+
+def test_known_texts_render_on_demand(tmp_path):
+    cache = TTSCache(str(tmp_path), StubTTSEngine())
+    key = cache.key("How do you ensure code quality?")
+
+    assert os.path.exists(cache.ensure(key))
+    try:
+        cache.ensure('f' * 64)
+        assert False, "unknown keys must not render"
+    except KeyError:
+        pass
+
+
+def test_remembered_texts_are_capped(tmp_path):
+    cache = TTSCache(str(tmp_path), StubTTSEngine(), max_texts=2)
+    first = cache.key("First question?")
+    second = cache.key("Second question?")
+    cache.key("First question?")
+    cache.key("Third question?")
+
+    assert os.path.exists(cache.ensure(first))
+    try:
+        cache.ensure(second)
+        assert False, "the least recently used text must be forgotten"
+    except KeyError:
+        pass
+
+
+def test_missing_pyttsx3_leaves_speech_to_the_browser():
+    try:
+        import pyttsx3  # noqa: F401
+    except ImportError:
+        assert create_engine('pyttsx3') is None
+    assert create_engine(None) is None
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import sys
+import os
+import io
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.upload_store import DAY, UploadStore
+
+
+def test_uploads_are_sharded_archived_and_expired(tmp_path):
+    store = UploadStore(str(tmp_path), retention_days=365, archive_after_days=30)
+    now = 1_700_000_000
+    old = store.put(io.BytesIO(b'old resume'), 'old.pdf', analysis_version=1, uploaded=now - 400 * DAY)
+    cold = store.put(io.BytesIO(b'cold resume'), 'Cold.DOCX', analysis_version=1, uploaded=now - 40 * DAY)
+    hot = store.put(io.BytesIO(b'hot resume'), 'hot.txt', analysis_version=2, uploaded=now)
+
+    path = store.path(hot['hash'], '.txt')
+    assert path == os.path.join(str(tmp_path), hot['hash'][:2], hot['hash'][2:4], hot['hash'] + '.txt')
+    assert store.stale(2) == [old['hash'], cold['hash']]
+
+    assert store.maintain(now) == (1, 1)
+    assert store.get(old['hash']) is None
+    assert store.get(cold['hash'])['archive'].endswith('.zip')
+    assert not os.path.exists(store.path(cold['hash'], '.docx'))
+    assert store.read(cold['hash']) == b'cold resume'
+    assert store.read(hot['hash']) == b'hot resume'
+
+    # Uploading archived content again brings it back into its shard
+    store.put(io.BytesIO(b'cold resume'), 'cold.docx', uploaded=now)
+    assert store.get(cold['hash'])['archive'] is None
+    assert os.listdir(store.archive_folder) == []
+
+
+class FailingStream:
+    def __init__(self):
+        self.reads = 0
+
+    def read(self, size):
+        self.reads += 1
+        if self.reads > 1:
+            raise OSError('connection reset')
+        return b'partial'
+
+
+def test_failed_upload_leaves_no_temporary_file(tmp_path):
+    store = UploadStore(str(tmp_path))
+    try:
+        store.put(FailingStream(), 'cv.pdf')
+        assert False, "the stream error must propagate"
+    except OSError:
+        pass
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+    assert store.stats()['uploads'] == 0
+
+
+def test_stored_names_map_to_uploaded_names(tmp_path):
+    store = UploadStore(str(tmp_path))
+    record = store.put(io.BytesIO(b'resume'), 'Jane Doe CV.pdf')
+    assert store.names([record['stored_name'], 'unknown.pdf']) == {record['stored_name']: 'Jane Doe CV.pdf',
+                                                                 'unknown.pdf': 'unknown.pdf'}
+    assert store.get(record['hash'])['analysis_version'] is None
+    store.set_analysis_version(record['hash'], 3)
+    assert store.stale(3) == []
+
+
+def test_reupload_with_new_extension_moves_the_file(tmp_path):
+    store = UploadStore(str(tmp_path))
+    first = store.put(io.BytesIO(b'resume'), 'cv.PDF')
+    store.set_analysis_version(first['hash'], '1/abc')
+    second = store.put(io.BytesIO(b'resume'), 'cv.txt')
+
+    assert second['extension'] == '.txt'
+    assert store.read(second['hash']) == b'resume'
+    assert not os.path.exists(store.path(first['hash'], '.pdf'))
+    assert store.stale('1/abc') == []
+    assert store.stale('1/def') == [first['hash']]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import sys
+import os
+import io
+import hashlib
+import time
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.video_upload import VideoUploadManager, UploadError, UploadOffsetError
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_chunks_resume_from_the_stored_offset(tmp_path):
+    uploads = VideoUploadManager(str(tmp_path))
+    upload_id = uploads.start('interview', 0)
+
+    assert uploads.append_chunk(upload_id, 0, io.BytesIO(b'abcd'), 4, _sha(b'abcd')) == 4
+    # A retried chunk the server already has is acknowledged, not written twice
+    assert uploads.append_chunk(upload_id, 0, io.BytesIO(b'abcd'), 4) == 4
+    with pytest.raises(UploadOffsetError) as error:
+        uploads.append_chunk(upload_id, 6, io.BytesIO(b'gh'), 2)
+    assert error.value.expected_offset == 4
+
+    # A bad checksum or a short body is cut back to where the chunk started
+    with pytest.raises(UploadError):
+        uploads.append_chunk(upload_id, 4, io.BytesIO(b'ef'), 2, _sha(b'xx'))
+    with pytest.raises(UploadError):
+        uploads.append_chunk(upload_id, 4, io.BytesIO(b'e'), 2)
+    assert uploads.status(upload_id)['offset'] == 4
+
+    assert uploads.append_chunk(upload_id, 4, io.BytesIO(b'ef'), 2, _sha(b'ef').upper()) == 6
+    with pytest.raises(UploadOffsetError):
+        uploads.complete(upload_id, total_size=8)
+    path = uploads.complete(upload_id, total_size=6)
+    assert open(path, 'rb').read() == b'abcdef'
+    assert uploads.status(upload_id) == {'upload_id': upload_id, 'offset': 6, 'complete': True}
+    with pytest.raises(UploadError):
+        uploads.append_chunk(upload_id, 6, io.BytesIO(b'g'), 1)
+    with pytest.raises(UploadError):
+        uploads.status('../etc/passwd')
+
+
+def test_cleanup_removes_only_abandoned_partial_uploads(tmp_path):
+    uploads = VideoUploadManager(str(tmp_path), abandon_after=60)
+    abandoned = uploads.start('interview', 0)
+    active = uploads.start('interview', 1)
+    finished = uploads.start('interview', 2)
+    uploads.complete(finished)
+    old = time.time() - 120
+    os.utime(os.path.join(str(tmp_path), abandoned + '.part'), (old, old))
+
+    assert uploads.cleanup() == 1
+    with pytest.raises(UploadError):
+        uploads.status(abandoned)
+    assert uploads.status(active)['offset'] == 0
+    assert uploads.status(finished)['complete']
@@ -0,0 +1,177 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bundle name -> source files under static/, concatenated in order
+BUNDLES = {
+    'app.css': ['css/style.css'],
+    'app.js': ['js/script.js'],
+    # Page scripts are bundled one by one, so each page only loads the ones it uses
+    'interview.js': ['js/voice-recognition.js'],
+    'interview-flow.js': ['js/interview-flow.js'],
+    'video-interview.js': ['js/video-interview.js'],
+    'text-to-speech.js': ['js/text-to-speech.js'],
+}
+
+MANIFEST_NAME = 'manifest.json'
+COMPRESSIBLE = ('.js', '.css')
+TEMPLATE_QUOTE = re.compile(r'(?<!\\)`')
+
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    return source.replace(';}', '}').strip()
+
+
+def minify_js(source):
+    """Drop indentation, blank lines and whole-line comments.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as
+    in the source; anything smarter needs a real JS parser. Lines inside a
+    multi-line template literal are kept verbatim, since their whitespace
+    and any ``//`` are part of the string (backticks are counted per line,
+    so one inside a quoted string or comment would confuse this).
+    """
+    lines = []
+    in_template = False
+    for raw in source.splitlines():
+        starts_inside = in_template
+        if not starts_inside:
+            line = raw.strip()
+            if not line or line.startswith('//'):
+                continue
+        if len(TEMPLATE_QUOTE.findall(raw)) % 2:
+            in_template = not in_template
+        if starts_inside:
+            lines.append(raw)
+        else:
+            lines.append(raw.lstrip() if in_template else raw.strip())
+    return '\n'.join(lines)
+
+
+def _read_manifest(dist_folder):
+    try:
+        with open(os.path.join(dist_folder, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def build_assets(static_folder='static', dist_folder='static/dist'):
+    """Bundle, minify and fingerprint every entry in BUNDLES.
+
+    Writes ``<name>.<hash>.<ext>`` plus .gz (and .br when brotli is installed)
+    variants and a manifest mapping bundle names to the hashed files. The
+    build happens in a temporary folder; its files are then moved into
+    dist_folder and the manifest is swapped in last. The previous build's
+    files are kept, so cached pages that still link to them keep working
+    until the next build.
+    """
+    os.makedirs(dist_folder, exist_ok=True)
+    previous = _read_manifest(dist_folder)
+    manifest = {}
+    build_folder = tempfile.mkdtemp(prefix='.build-', dir=dist_folder)
+
+    try:
+        for name, sources in BUNDLES.items():
+            base, ext = os.path.splitext(name)
+            if ext in COMPRESSIBLE:
+                parts = []
+                for source in sources:
+                    with open(os.path.join(static_folder, source), 'r', encoding='utf-8') as f:
+                        parts.append(f.read())
+                if ext == '.css':
+                    data = minify_css('\n'.join(parts)).encode('utf-8')
+                else:
+                    data = ';\n'.join(minify_js(part) for part in parts).encode('utf-8')
+            else:
+                with open(os.path.join(static_folder, sources[0]), 'rb') as f:
+                    data = f.read()
+
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            hashed_name = f'{base}.{digest}{ext}'
+            path = os.path.join(build_folder, hashed_name)
+            with open(path, 'wb') as f:
+                f.write(data)
+
+            if ext in COMPRESSIBLE:
+                with open(path + '.gz', 'wb') as f:
+                    f.write(gzip.compress(data, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    with open(path + '.br', 'wb') as f:
+                        f.write(brotli.compress(data, quality=11))
+
+            manifest[name] = hashed_name
+
+        with open(os.path.join(build_folder, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        # Hashed names are content addressed, so replacing one never changes what it serves
+        for filename in sorted(os.listdir(build_folder), key=lambda name: name == MANIFEST_NAME):
+            os.replace(os.path.join(build_folder, filename), os.path.join(dist_folder, filename))
+    finally:
+        shutil.rmtree(build_folder, ignore_errors=True)
+
+    # Remove outputs older than the previous build
+    keep = set(manifest.values()) | set(previous.values())
+    for filename in os.listdir(dist_folder):
+        path = os.path.join(dist_folder, filename)
+        if filename == MANIFEST_NAME or os.path.isdir(path):
+            continue
+        if (filename[:-3] if filename.endswith(('.gz', '.br')) else filename) not in keep:
+            os.remove(path)
+
+    return manifest
+
+
+class AssetManifest:
+    """Resolves bundle names to fingerprinted files, falling back to the sources."""
+
+    def __init__(self, dist_folder='static/dist'):
+        self.dist_folder = dist_folder
+        self.manifest_file = os.path.join(dist_folder, MANIFEST_NAME)
+        self._mtime = None
+        self.files = {}
+        self.reload()
+
+    def reload(self):
+        try:
+            mtime = os.path.getmtime(self.manifest_file)
+        except FileNotFoundError:
+            self._mtime = None
+            self.files = {}
+            return
+        if mtime != self._mtime:
+            with open(self.manifest_file, 'r') as f:
+                self.files = json.load(f)
+            self._mtime = mtime
+
+    def resolve(self, name):
+        """Hashed file name for a bundle, or None when assets have not been built."""
+        return self.files.get(name)
+
+    def variant(self, filename, accept_encoding):
+        """Best precompressed variant of a built file for the client's Accept-Encoding."""
+        if filename.endswith(COMPRESSIBLE):
+            for suffix, encoding in (('.br', 'br'), ('.gz', 'gzip')):
+                if encoding in accept_encoding and os.path.exists(os.path.join(self.dist_folder, filename + suffix)):
+                    return filename + suffix, encoding
+        return filename, None
+
+
+if __name__ == '__main__':
+    built = build_assets()
+    for bundle, hashed in built.items():
+        print(f"{bundle} -> {hashed}")
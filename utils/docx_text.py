@@ -0,0 +1,55 @@
+import zipfile
+import xml.etree.ElementTree as ET
+from docx import Document
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+PARAGRAPH, TEXT, TAB, BREAK, CARRIAGE_RETURN, BODY = (
+    W + 'p', W + 't', W + 'tab', W + 'br', W + 'cr', W + 'body'
+)
+
+
+def iter_docx_paragraphs(source):
+    """Stream the text of every paragraph in word/document.xml, table cells included.
+
+    ``source`` is a path or a seekable binary file. Elements are cleared as
+    soon as they have been read, and finished top-level blocks are dropped
+    from the body, so memory stays flat however long the document is.
+    """
+    with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as xml:
+        buffers = []  # one per open paragraph; text boxes can nest them
+        body, depth, body_depth = None, 0, None
+        for event, element in ET.iterparse(xml, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if element.tag == PARAGRAPH:
+                    buffers.append([])
+                elif element.tag == BODY:
+                    body, body_depth = element, depth
+                continue
+
+            tag = element.tag
+            if buffers:
+                if tag == TEXT:
+                    buffers[-1].append(element.text or '')
+                elif tag == TAB:
+                    buffers[-1].append('\t')
+                elif tag in (BREAK, CARRIAGE_RETURN):
+                    buffers[-1].append('\n')
+            if tag == PARAGRAPH:
+                yield ''.join(buffers.pop())
+
+            element.clear()
+            if body is not None and depth == body_depth + 1:
+                body.clear()
+            depth -= 1
+
+
+def extract_docx_text(source):
+    """Plain text of a DOCX, one line per paragraph, with python-docx as the fallback."""
+    try:
+        return ''.join(paragraph + '\n' for paragraph in iter_docx_paragraphs(source))
+    except (zipfile.BadZipFile, KeyError, ET.ParseError):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        doc = Document(source)
+        return ''.join(paragraph.text + '\n' for paragraph in doc.paragraphs)
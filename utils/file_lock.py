@@ -0,0 +1,39 @@
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock shared by every worker process, held as a context manager.
+
+    Guards read-modify-write of on-disk stores. Two threads of one process
+    would not exclude each other reliably, so callers also hold their own
+    ``threading.Lock`` around it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a+b')
+        if fcntl:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
@@ -0,0 +1,53 @@
+import threading
+from collections import OrderedDict
+from flask import render_template
+
+
+class FragmentCache:
+    """Small in-process LRU cache of rendered HTML.
+
+    Keys must change whenever the rendered data changes (e.g. they include
+    the interview id and its results version), so entries never need to be
+    invalidated explicitly; stale ones simply fall out of the LRU.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def set(self, key, html):
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def render(self, key, template_name, **context):
+        """Return the cached rendering for key, rendering the template on a miss."""
+        html = self.get(key)
+        if html is None:
+            html = render_template(template_name, **context)
+            self.set(key, html)
+        return html
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
@@ -0,0 +1,183 @@
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from utils.file_lock import FileLock
+
+ROUTE_PATTERN = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+
+def collapse_stack(frame, max_depth=64):
+    """Root-first ``file:function;file:function`` string for a frame, as flamegraph tools expect."""
+    names = []
+    while frame is not None and len(names) < max_depth:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler:
+    """One background thread sampling the stacks of the threads being profiled.
+
+    Sampling costs nothing for threads that are not registered, and the
+    thread sleeps while no request is being profiled.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self._targets = {}  # thread id -> Counter of collapsed stacks
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, thread_id):
+        with self._lock:
+            self._targets[thread_id] = Counter()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def stop(self, thread_id):
+        with self._lock:
+            return self._targets.pop(thread_id, Counter())
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._targets:
+                    self._wake.clear()
+                    continue
+                frames = sys._current_frames()
+                for thread_id, stacks in self._targets.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        stacks[collapse_stack(frame)] += 1
+
+
+class RequestProfiler:
+    """Opt-in sampling profiler for live requests.
+
+    A request is profiled when profiling is enabled and it falls in the
+    sampled fraction, or when it carries ``X-Profile: <token>``. Its stack
+    samples are appended to ``<folder>/<endpoint>.folded`` in the collapsed
+    format read by flamegraph.pl and speedscope. A file that grows past
+    ``max_bytes`` is rewritten with equal stacks merged, keeping the most
+    sampled stacks that fit in half of it.
+    """
+
+    HEADER = 'X-Profile'
+
+    def __init__(self, folder='data/profiles', enabled=False, sample_rate=0.01, token=None, interval=0.005,
+                 max_bytes=4 * 1024 * 1024):
+        self.folder = folder
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.token = token
+        self.max_bytes = max_bytes
+        self.sampler = StackSampler(interval)
+        self._write_lock = threading.Lock()
+        self.profiled = 0
+
+    def authorized(self, headers):
+        # Constant-time, so response timing does not reveal how much of a guess matched
+        return bool(self.token) and hmac.compare_digest(headers.get(self.HEADER, '').encode(), self.token.encode())
+
+    def should_profile(self, headers):
+        if self.authorized(headers):
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+    def start(self):
+        self.sampler.start(threading.get_ident())
+
+    def stop(self, route):
+        stacks = self.sampler.stop(threading.get_ident())
+        if not stacks:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        path = os.path.join(self.folder, ROUTE_PATTERN.sub('_', route or 'unknown') + '.folded')
+        lines = ''.join(f'{stack} {count}\n' for stack, count in stacks.items())
+        with self._write_lock, FileLock(path + '.lock'):
+            with open(path, 'a') as f:
+                f.write(lines)
+                size = f.tell()
+            if size > self.max_bytes:
+                self._compact(path)
+            self.profiled += 1
+
+    def _compact(self, path):
+        stacks = self._read_file(path)
+        budget = self.max_bytes // 2
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w') as f:
+            for stack, count in stacks.most_common():
+                line = f'{stack} {count}\n'
+                budget -= len(line.encode('utf-8'))
+                if budget < 0:
+                    break
+                f.write(line)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read_file(path):
+        stacks = Counter()
+        with open(path, 'r') as f:
+            for line in f:
+                stack, _, count = line.rstrip('\n').rpartition(' ')
+                if stack and count.isdigit():
+                    stacks[stack] += int(count)
+        return stacks
+
+    def _read(self, route=None):
+        try:
+            names = sorted(n for n in os.listdir(self.folder) if n.endswith('.folded'))
+        except FileNotFoundError:
+            return {}
+        merged = {}
+        for name in names:
+            name_route = name[:-len('.folded')]
+            if route and name_route != route:
+                continue
+            merged[name_route] = self._read_file(os.path.join(self.folder, name))
+        return merged
+
+    def folded(self, route=None):
+        """All samples merged into one collapsed-stack document, prefixed by route."""
+        return ''.join(f'{name};{stack} {count}\n'
+                       for name, stacks in self._read(route).items()
+                       for stack, count in stacks.most_common())
+
+    def summary(self, route=None, limit=20):
+        """Samples per route and the hottest functions by self and total samples."""
+        per_route = self._read(route)
+        self_samples = Counter()
+        total_samples = Counter()
+        for stacks in per_route.values():
+            for stack, count in stacks.items():
+                frames = stack.split(';')
+                self_samples[frames[-1]] += count
+                for frame in set(frames):
+                    total_samples[frame] += count
+
+        all_samples = sum(sum(stacks.values()) for stacks in per_route.values())
+        return {
+            'samples': all_samples,
+            'interval_ms': self.sampler.interval * 1000,
+            'routes': {name: sum(stacks.values()) for name, stacks in per_route.items()},
+            'self': [{'function': frame, 'samples': count,
+                      'percent': round(100 * count / all_samples, 1)} for frame, count in self_samples.most_common(limit)],
+            'total': [{'function': frame, 'samples': count,
+                       'percent': round(100 * count / all_samples, 1)} for frame, count in total_samples.most_common(limit)],
+        }
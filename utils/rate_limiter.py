@@ -0,0 +1,182 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import jsonify, request
+
+
+def _refill(tokens, updated, now, rate, burst):
+    return min(burst, tokens + (now - updated) * rate)
+
+
+class MemoryRateLimitBackend:
+    """Token buckets kept in this process only.
+
+    At most ``max_keys`` buckets are kept; the least recently used client
+    is forgotten first, which at worst hands it a full bucket again.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, cost=1.0):
+        """Take `cost` tokens; returns (allowed, seconds until enough tokens)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = _refill(tokens, updated, now, rate, burst)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (cost - tokens) / rate
+
+
+class SQLiteRateLimitBackend:
+    """Token buckets shared by every worker on the host through one SQLite file."""
+
+    def __init__(self, path='data/rate_limits.sqlite3'):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._local = threading.local()
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)'
+        )
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def take(self, key, rate, burst, cost=1.0):
+        # Wall clock, since monotonic clocks are not comparable across processes
+        now = time.time()
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+            tokens, updated = row if row else (burst, now)
+            tokens = _refill(tokens, updated, now, rate, burst)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            connection.execute('INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)',
+                               (key, tokens, now))
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        return allowed, 0.0 if allowed else (cost - tokens) / rate
+
+
+class RateLimiter:
+    """Per-client token buckets for each route class.
+
+    ``limits`` maps a route class to (tokens per second, burst size).
+    """
+
+    def __init__(self, limits, backend=None):
+        self.limits = limits
+        self.backend = backend or MemoryRateLimitBackend()
+
+    def check(self, route_class, client_key):
+        if route_class not in self.limits:
+            return True, 0.0
+        rate, burst = self.limits[route_class]
+        return self.backend.take(f'{route_class}:{client_key}', rate, burst)
+
+
+class AdmissionController:
+    """Caps concurrent requests per route class.
+
+    ``limits`` maps a route class to (max concurrent, priority). Low
+    priority classes are also refused once ``shed_low_priority_at``
+    requests of any class are in flight, which keeps workers free for
+    interactive traffic.
+    """
+
+    def __init__(self, limits, shed_low_priority_at=None):
+        self.limits = limits
+        self.shed_low_priority_at = shed_low_priority_at
+        self.in_flight = {route_class: 0 for route_class in limits}
+        self.rejected = {route_class: 0 for route_class in limits}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, route_class):
+        if route_class not in self.limits:
+            return True
+        max_concurrent, priority = self.limits[route_class]
+        with self._lock:
+            total = sum(self.in_flight.values())
+            if self.in_flight[route_class] >= max_concurrent or (
+                    priority == 'low' and self.shed_low_priority_at is not None
+                    and total >= self.shed_low_priority_at):
+                self.rejected[route_class] += 1
+                return False
+            self.in_flight[route_class] += 1
+            return True
+
+    def release(self, route_class):
+        if route_class not in self.limits:
+            return
+        with self._lock:
+            self.in_flight[route_class] -= 1
+
+    def stats(self):
+        with self._lock:
+            return {'in_flight': dict(self.in_flight), 'rejected': dict(self.rejected)}
+
+
+def create_backend(name, sqlite_path):
+    if name == 'sqlite':
+        return SQLiteRateLimitBackend(sqlite_path)
+    return MemoryRateLimitBackend()
+
+
+class RequestThrottle:
+    """Flask decorator applying the rate limiter and admission controller to a view."""
+
+    def __init__(self, rate_limiter, admission_controller):
+        self.rate_limiter = rate_limiter
+        self.admission_controller = admission_controller
+
+    def _too_many(self, message, retry_after):
+        response = jsonify({'error': message, 'retry_after': round(retry_after, 2)})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    def limit(self, route_class, methods=None):
+        def decorator(view):
+            @wraps(view)
+            def wrapped(*args, **kwargs):
+                if methods and request.method not in methods:
+                    return view(*args, **kwargs)
+
+                # The client's address rather than its interview, since starting
+                # a new interview would otherwise hand out fresh buckets
+                client_key = request.remote_addr
+                allowed, retry_after = self.rate_limiter.check(route_class, client_key)
+                if not allowed:
+                    return self._too_many('Too many requests, please slow down', retry_after)
+
+                if not self.admission_controller.try_acquire(route_class):
+                    return self._too_many('Server busy, please retry shortly', 1)
+                try:
+                    return view(*args, **kwargs)
+                finally:
+                    self.admission_controller.release(route_class)
+            return wrapped
+        return decorator
@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+
+class Stage:
+    __slots__ = ('name', 'fn', 'deps', 'timeout', 'default')
+
+    def __init__(self, name, fn, deps, timeout, default):
+        self.name = name
+        self.fn = fn
+        self.deps = deps
+        self.timeout = timeout
+        self.default = default
+
+
+class StageGraph:
+    """A small DAG of analysis stages for one request.
+
+    Each stage is called with the results of its dependencies, in order.
+    With an executor, every stage whose dependencies are done is submitted
+    at once, so independent stages overlap. A stage's timeout counts from
+    when a pool thread starts it, not while it waits in the queue. A stage
+    that misses its timeout gets ``default()`` as its result and is
+    reported as timed out, and its dependents run on that partial result;
+    the abandoned call still finishes in the background since Python
+    threads cannot be killed.
+    Without an executor the stages run inline in the order they were added.
+    """
+
+    def __init__(self):
+        self._stages = {}
+
+    def add(self, name, fn, deps=(), timeout=None, default=None):
+        missing = [dep for dep in deps if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on unknown stages {missing}")
+        self._stages[name] = Stage(name, fn, tuple(deps), timeout, default)
+        return self
+
+    def run(self, executor=None):
+        """Returns (results by stage name, names of stages that timed out)."""
+        results = {}
+        if executor is None:
+            for stage in self._stages.values():
+                results[stage.name] = stage.fn(*(results[dep] for dep in stage.deps))
+            return results, []
+
+        timed_out = []
+        pending = dict(self._stages)
+        running = {}  # future -> (stage, future set to the start time once a thread picks it up)
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if all(dep in results for dep in stage.deps):
+                    started = Future()
+                    future = executor.submit(_call, stage.fn, started, [results[dep] for dep in stage.deps])
+                    running[future] = (stage, started)
+                    del pending[name]
+
+            # Wake on a stage finishing, a timed stage starting, or the earliest deadline
+            waiting_on = list(running)
+            deadlines = []
+            for stage, started in running.values():
+                if stage.timeout:
+                    if started.done():
+                        deadlines.append(started.result() + stage.timeout)
+                    else:
+                        waiting_on.append(started)
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = wait(waiting_on, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            now = time.monotonic()
+            for future, (stage, started) in list(running.items()):
+                if future in done:
+                    results[stage.name] = future.result()
+                elif stage.timeout and started.done() and now >= started.result() + stage.timeout:
+                    results[stage.name] = stage.default() if stage.default else None
+                    timed_out.append(stage.name)
+                else:
+                    continue
+                del running[future]
+        return results, timed_out
+
+
+def _call(fn, started, args):
+    started.set_result(time.monotonic())
+    return fn(*args)
@@ -0,0 +1,314 @@
+import argparse
+import json
+import os
+import random
+import zipfile
+from xml.sax.saxutils import escape
+
+FIRST_NAMES = ['Avery', 'Jordan', 'Priya', 'Mateo', 'Chen', 'Amara', 'Lukas', 'Sofia', 'Kenji', 'Noor',
+               'Diego', 'Hannah', 'Ravi', 'Elena', 'Tariq', 'Mei', 'Oliver', 'Zainab', 'Felix', 'Ines']
+LAST_NAMES = ['Sample', 'Testwell', 'Fixture', 'Placeholder', 'Mockley', 'Synthetic', 'Example', 'Dummy']
+COMPANIES = ['Northwind Labs', 'Contoso Systems', 'Fabrikam Data', 'Initech', 'Globex Analytics',
+             'Umbrella Cloud', 'Hooli Platforms', 'Vandelay Software', 'Acme Robotics', 'Stark Digital']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Data Scientist', 'Backend Developer',
+          'Frontend Developer', 'Machine Learning Engineer', 'DevOps Engineer', 'Data Analyst']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'Technical University']
+FIELDS = ['Computer Science', 'Statistics', 'Electrical Engineering', 'Information Systems', 'Mathematics']
+# Each is recognized by ResumeAnalyzer's degree pattern
+DEGREES = ['Bachelor of Science', 'Master of Science', 'PhD', 'MBA', 'B.Tech', 'M.Tech']
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+VERBS = ['Built', 'Designed', 'Implemented', 'Led', 'Migrated', 'Automated', 'Optimized', 'Maintained']
+OUTCOMES = ['cutting latency by {n} percent', 'saving {n} hours a week', 'serving {n} thousand users',
+            'reducing costs by {n} percent', 'raising test coverage to {n} percent']
+
+# Concepts asked about per skill category, used as question keywords
+CONCEPTS = {
+    'programming': ['performance', 'memory', 'concurrency', 'testing', 'debugging', 'design patterns'],
+    'web_tech': ['components', 'state', 'routing', 'caching', 'accessibility', 'rendering'],
+    'databases': ['indexes', 'transactions', 'normalization', 'replication', 'queries', 'schema'],
+    'cloud': ['deployment', 'scaling', 'monitoring', 'containers', 'infrastructure', 'security'],
+    'data_science': ['features', 'validation', 'overfitting', 'metrics', 'pipeline', 'visualization'],
+    'soft_skills': ['stakeholders', 'feedback', 'priorities', 'conflict', 'mentoring', 'deadlines'],
+}
+TECHNICAL_TEMPLATES = ['How would you use {skill} to improve {concept} in a {scale} system?',
+                       'Explain how a {scale} {skill} codebase handles {concept} and the trade-offs involved.',
+                       'What {concept} problems have you run into with {skill}, and how did you fix them?',
+                       'Walk me through debugging a {concept} issue in a {scale} {skill} project.']
+BEHAVIORAL_TEMPLATES = ['Tell me about a time you handled {concept} on a {scale} project.',
+                        'Describe a situation where {concept} put a {scale} delivery at risk.',
+                        'Give an example of improving {concept} in a {scale} team using {skill}.']
+SCALES = ['small', 'growing', 'large', 'legacy', 'distributed', 'customer-facing', 'internal']
+STAR_SENTENCES = ['When our team was working on the {skill} project, the situation was difficult.',
+                  'My task was to own the {keyword} work and the goal was clear.',
+                  'I implemented changes around {keyword} and decided how we would test them.',
+                  'The result was that we improved {keyword} and I learned a lot.']
+FILLER_WORDS = ['um', 'basically', 'you know', 'actually', 'like']
+
+
+class SyntheticDataGenerator:
+    """Reproducible fake resumes, question banks, answers and interview traffic.
+
+    Every item is generated from its own ``(seed, kind, index)`` random
+    stream, so item 42 is the same whether 50 or 50,000 are generated.
+    No output is derived from real candidate data.
+    """
+
+    def __init__(self, seed=0, skill_categories=None, category_rates=None, skill_skew=1.2):
+        if skill_categories is None:
+            from models.resume_analyzer import ResumeAnalyzer
+            skill_categories = ResumeAnalyzer().skill_categories
+        self.seed = seed
+        self.skill_categories = skill_categories
+        # Chance that a resume lists any skills of a category
+        self.category_rates = {category: 0.5 for category in skill_categories}
+        self.category_rates.update(category_rates or {})
+        # Zipf-like popularity within a category: the first skills are the most common
+        self.skill_weights = {category: [1 / (rank + 1) ** skill_skew for rank in range(len(skills))]
+                              for category, skills in skill_categories.items()}
+
+    def _rng(self, kind, index):
+        return random.Random(f'{self.seed}:{kind}:{index}')
+
+    def _skills(self, rng):
+        chosen = {}
+        for category, skills in self.skill_categories.items():
+            if rng.random() >= self.category_rates[category]:
+                continue
+            count = rng.randint(1, min(4, len(skills)))
+            picked = set()
+            while len(picked) < count:
+                picked.add(rng.choices(skills, self.skill_weights[category])[0])
+            chosen[category] = sorted(picked, key=skills.index)
+        return chosen
+
+    def resume(self, index, positions=None, bullets=3):
+        """(text, truth) for one resume; truth holds the skills, degrees and number of positions."""
+        rng = self._rng('resume', index)
+        skills = self._skills(rng)
+        flat_skills = [skill for category_skills in skills.values() for skill in category_skills]
+        technical = [skill for category, category_skills in skills.items() if category != 'soft_skills'
+                     for skill in category_skills]
+        positions = positions or rng.randint(1, 4)
+
+        lines = [f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                 f'candidate{index}@example.com', '', 'SUMMARY',
+                 f'{rng.choice(TITLES)} with {positions * 2} years experience.', '', 'EXPERIENCE']
+        year, month = 2024, rng.randint(1, 12)
+        for position in range(positions):
+            length = rng.randint(12, 36)
+            end = f'{MONTH_NAMES[month - 1]} {year}' if position else 'Present'
+            start_index = year * 12 + month - 1 - length
+            start_year, start_month = divmod(start_index, 12)
+            lines.append(f'{rng.choice(TITLES)}, {rng.choice(COMPANIES)}  '
+                         f'{MONTH_NAMES[start_month]} {start_year} - {end}')
+            for _ in range(bullets):
+                skill = rng.choice(technical) if technical else 'internal tools'
+                outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 60))
+                lines.append(f'- {rng.choice(VERBS)} services with {skill}, {outcome}.')
+            year, month = divmod(start_index - rng.randint(0, 6), 12)
+            month += 1
+        degrees = rng.sample(DEGREES, rng.randint(1, 2))
+        lines += ['', 'EDUCATION']
+        lines += [f'{degree} in {rng.choice(FIELDS)}, {rng.choice(SCHOOLS)}, {year - 1 - i}'
+                  for i, degree in enumerate(degrees)]
+        lines += ['', 'SKILLS', ', '.join(flat_skills) or 'Microsoft Office']
+        if technical:
+            lines += ['', 'PROJECTS', f'Open source tooling written with {rng.choice(technical)}.']
+
+        truth = {'skills': skills, 'degrees': degrees, 'positions': positions}
+        return '\n'.join(lines) + '\n', truth
+
+    def question_bank(self, roles=('software_engineer', 'data_scientist'), per_role=1000, behavioral_rate=0.3):
+        """Questions in the interview_questions.json layout, keyworded from the skill categories."""
+        bank = {}
+        categories = list(self.skill_categories)
+        for role in roles:
+            questions = []
+            for i in range(per_role):
+                rng = self._rng(f'question:{role}', i)
+                category = rng.choice(categories)
+                skill = rng.choice(self.skill_categories[category])
+                concepts = rng.sample(CONCEPTS.get(category, CONCEPTS['programming']), 4)
+                behavioral = rng.random() < behavioral_rate
+                template = rng.choice(BEHAVIORAL_TEMPLATES if behavioral else TECHNICAL_TEMPLATES)
+                questions.append({
+                    'question': template.format(skill=skill, concept=concepts[0], scale=rng.choice(SCALES)),
+                    'type': 'behavioral' if behavioral else 'technical',
+                    'keywords': [skill] + concepts,
+                })
+            bank[role] = questions
+        return bank
+
+    def answer(self, question, index=0, words=80, keyword_rate=0.5, filler_rate=0.0):
+        """An answer of at least ``words`` words mentioning that share of the question's keywords."""
+        rng = self._rng(f"answer:{question['question']}", index)
+        keywords = question.get('keywords', [])
+        used = rng.sample(keywords, round(len(keywords) * keyword_rate)) if keywords else []
+        skill = keywords[0] if keywords else 'the system'
+        sentences = []
+        if question.get('type') == 'behavioral':
+            sentences += [sentence.format(skill=skill, keyword=rng.choice(used or ['delivery']))
+                          for sentence in STAR_SENTENCES]
+        for keyword in used:
+            sentences.append(f'I focused on {keyword} because it mattered most for the {rng.choice(SCALES)} system.')
+
+        # Whole sentences until the answer reaches the requested length
+        while sum(len(sentence.split()) for sentence in sentences) < words:
+            sentences.append(f'We {rng.choice(VERBS).lower()} the {skill} work step by step and reviewed it.')
+        tokens = ' '.join(sentences).split()
+        if filler_rate:
+            for position in sorted(rng.sample(range(1, len(tokens)), int(len(tokens) * filler_rate)), reverse=True):
+                tokens.insert(position, rng.choice(FILLER_WORDS) + ',')
+        return ' '.join(tokens)
+
+    def answer_corpus(self, bank, per_question=3, lengths=(20, 80, 200)):
+        """Sample responses in the sample_responses.json layout, at varying lengths and keyword coverage."""
+        corpus = []
+        for role, questions in bank.items():
+            for question_index, question in enumerate(questions):
+                for i in range(per_question):
+                    rng = self._rng(f'corpus:{role}:{question_index}', i)
+                    corpus.append({
+                        'job_role': role,
+                        'question_index': question_index,
+                        'answer': self.answer(question, i, words=rng.choice(lengths),
+                                              keyword_rate=rng.choice([0.0, 0.34, 0.67, 1.0]),
+                                              filler_rate=rng.choice([0.0, 0.0, 0.05])),
+                    })
+        return corpus
+
+    def interviews(self, bank, count, questions_per_interview=10):
+        """Interview traffic: which questions each synthetic candidate answers, and how."""
+        for i in range(count):
+            rng = self._rng('interview', i)
+            role = rng.choice(list(bank))
+            picked = sorted(rng.sample(range(len(bank[role])), min(questions_per_interview, len(bank[role]))))
+            yield {
+                'interview_id': f'synthetic-{self.seed}-{i}',
+                'job_role': role,
+                'answers': [{'question_index': q,
+                             'answer': self.answer(bank[role][q], i, words=rng.randint(10, 150),
+                                                   keyword_rate=rng.random())} for q in picked],
+            }
+
+
+def write_txt(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+DOCX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="word/document.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'),
+}
+
+
+def write_docx(path, text):
+    """Minimal WordprocessingML document, one paragraph per line, with fixed timestamps."""
+    paragraphs = ''.join(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+                         for line in text.splitlines())
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{paragraphs}</w:body></w:document>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as docx:
+        for name, content in list(DOCX_PARTS.items()) + [('word/document.xml', document)]:
+            docx.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), content)
+
+
+def write_pdf(path, text, lines_per_page=60):
+    """Minimal text-only PDF (Helvetica, 10pt) that PyPDF2 can extract."""
+    lines = text.splitlines() or ['']
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+               '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>']
+    page_ids = []
+    for page in pages:
+        body = ''.join('({}) Tj T*\n'.format(line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)'))
+                       for line in page)
+        stream = f'BT /F1 10 Tf 12 TL 50 800 Td\n{body}ET'.encode('latin-1', 'replace')
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+        page_ids.append(len(objects))
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(f"{i} 0 R" for i in page_ids)}] /Count {len(page_ids)} >>'
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n'.encode() + (obj if isinstance(obj, bytes) else obj.encode()) + b'\nendobj\n'
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    out += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode()
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+WRITERS = {'txt': write_txt, 'docx': write_docx, 'pdf': write_pdf}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate reproducible synthetic data for scale tests')
+    parser.add_argument('command', choices=['resumes', 'questions', 'answers', 'traffic'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--count', type=int, default=100, help='resumes, questions per role or interviews')
+    parser.add_argument('--formats', default='txt', help='resume formats, e.g. txt,docx,pdf')
+    parser.add_argument('--roles', default='software_engineer,data_scientist')
+    parser.add_argument('--questions', default=None, help='question bank JSON for answers and traffic')
+    parser.add_argument('--out', default='data/synthetic')
+    args = parser.parse_args(argv)
+
+    generator = SyntheticDataGenerator(args.seed)
+    os.makedirs(args.out, exist_ok=True)
+
+    if args.command == 'resumes':
+        formats = args.formats.split(',')
+        with open(os.path.join(args.out, 'resumes.jsonl'), 'w') as truth_file:
+            for i in range(args.count):
+                text, truth = generator.resume(i)
+                name = f'resume_{i:06d}.{formats[i % len(formats)]}'
+                WRITERS[formats[i % len(formats)]](os.path.join(args.out, name), text)
+                truth_file.write(json.dumps({'file': name, **truth}) + '\n')
+        print(f"Wrote {args.count} resumes to {args.out}")
+        return
+
+    if args.questions:
+        with open(args.questions, 'r') as f:
+            bank = json.load(f)
+    else:
+        bank = generator.question_bank(args.roles.split(','), args.count)
+
+    if args.command == 'questions':
+        path = os.path.join(args.out, 'interview_questions.json')
+        with open(path, 'w') as f:
+            json.dump(bank, f, indent=1)
+        print(f"Wrote {sum(map(len, bank.values()))} questions to {path}")
+    elif args.command == 'answers':
+        path = os.path.join(args.out, 'sample_responses.json')
+        corpus = generator.answer_corpus(bank)
+        with open(path, 'w') as f:
+            json.dump(corpus, f)
+        print(f"Wrote {len(corpus)} answers to {path}")
+    else:
+        path = os.path.join(args.out, 'interviews.jsonl')
+        with open(path, 'w') as f:
+            for interview in generator.interviews(bank, args.count):
+                f.write(json.dumps(interview) + '\n')
+        print(f"Wrote {args.count} interviews to {path}")
+
+
+if __name__ == '__main__':
+    main()